@@ -12,38 +12,194 @@ Enhanced with:
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext
+from tkinter import ttk, messagebox
 import json
+import copy
+import csv
 import os
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, date
 import random
 from collections import defaultdict
+from types import MappingProxyType
 import math
 import hashlib
+import functools
+import time
+import queue
+import threading
 
-# Try to import PIL for logo support
+# orjson is optional; it serializes progress much faster than the stdlib encoder
 try:
-    from PIL import Image, ImageTk
-    PIL_AVAILABLE = True
+    import orjson
 except ImportError:
-    PIL_AVAILABLE = False
+    orjson = None
+
+
+def _dump_json(obj):
+    """Serialize obj to compact JSON bytes"""
+    if orjson is not None:
+        # Runtime dicts (progress, last_review_day) have int keys
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def _load_json(data):
+    """Parse JSON bytes, using orjson when it is available"""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # Older saves wrote Infinity, which only the stdlib parser accepts
+    return json.loads(data)
+
+
+@functools.lru_cache(maxsize=4096)
+def _question_id(question_text, topic):
+    """Hash question text + topic into a short stable ID (pure, so cached)"""
+    # 6-byte digest = same 12 hex chars the old truncated MD5 produced
+    h = hashlib.blake2b(question_text.encode('utf-8'), digest_size=6)
+    h.update(topic.to_bytes(2, 'little'))
+    return h.hexdigest()
+
+
+def _legacy_question_id(question_text, topic):
+    """Question ID format used before blake2b (only needed to migrate old saves)"""
+    q_str = question_text + str(topic)
+    return hashlib.md5(q_str.encode()).hexdigest()[:12]
+
 
 class AILearningApp:
+    # Memory strength gained per correct answer, by self-reported confidence
+    _STRENGTH_GAIN = {'high': 1, 'medium': 0.7, 'low': 0.4}
+    
+    # Leitner-style review intervals in days, indexed by topic mastery (0-5)
+    _REVIEW_INTERVALS = (1, 3, 7, 14, 30, 60)
+    
+    # Dashboard "Explore" links as (label, screen method name)
+    _NAV_ITEMS = (
+        ("Study", "show_topics_menu"),
+        ("Quiz", "show_quiz_options"),
+        ("Quests", "show_quests"),
+        ("Progress", "show_progress"),
+        ("Skills Map", "show_skills_map"),
+        ("Leaderboard", "show_leaderboard"),
+        ("NN Builder", "show_nn_builder"),
+        ("Visualize", "show_visualizations"),
+        ("Practice", "show_practice_tests"),
+        ("Achievements", "show_achievements"),
+    )
+    
+    # Modern Design System - Restrained color palette
+    TARLETON_PURPLE = "#4E2A84"  # Primary brand color
+    TARLETON_PURPLE_LIGHT = "#6B3FA0"
+    TARLETON_GOLD = "#C4A000"
+    
+    # Semantic colors (used sparingly)
+    COLOR_SUCCESS = "#10B981"  # Green - correct/success
+    COLOR_WARNING = "#F59E0B"  # Amber - warning/streak
+    COLOR_ERROR = "#EF4444"    # Red - error/wrong
+    COLOR_INFO = "#3B82F6"     # Blue - info
+    
+    # JSON object keys for topic numbers 0-10, indexed by topic number
+    _TOPIC_KEYS = tuple(str(t) for t in range(11))
+    
+    # Answer cards added to the results review per idle pass (see _insert_review_cards)
+    _REVIEW_CARDS_PER_PASS = 5
+    
+    # Achievement rows built per idle pass on the achievements screen
+    _ACHIEVEMENT_ROWS_PER_PASS = 20
+    
+    # Light-mode backgrounds for the four multiple choice option rows
+    _OPTION_COLORS = ('#e8f4f8', '#f8f4e8', '#f4f8e8', '#f8e8f4')
+    
+    # Algorithm visualization menu as (label, viz method name, button color)
+    _VIZ_OPTIONS = (
+        ("🌳 Decision Tree", "viz_decision_tree", TARLETON_PURPLE),
+        ("🎯 K-Means Clustering", "viz_kmeans", "#16a085"),
+        ("📉 Gradient Descent", "viz_gradient_descent", "#e74c3c"),
+        ("🧠 Neural Network Training", "viz_nn_training", "#3498db"),
+    )
+    
+    # Features unlocked by completed quests as (name, unlocked_features key, quests needed, emoji)
+    _FEATURE_UNLOCKS = (
+        ("Hard Mode", "hard_mode", 5, "🔥"),
+        ("Exam Simulator", "exam_simulator", 15, "📝"),
+        ("Bonus Visualizations", "bonus_visualizations", 25, "🔬"),
+        ("AI Case Studies", "case_studies", 40, "📚"),
+    )
+    
+    # Achievements checked after every quiz as (predicate(app, score_percent), name)
+    _QUIZ_ACHIEVEMENTS = (
+        (lambda app, score: score == 100, "Perfect Score!"),
+        (lambda app, score: 90 <= score < 100, "Excellent Performance!"),
+        (lambda app, score: app.total_questions_answered >= 100, "Century Club: 100 Questions!"),
+        (lambda app, score: app.streak >= 7, "7 Day Streak!"),
+    )
+    
+    # Skills map bar colors for below 40%, 40-69% and 70%+
+    _SCORE_COLORS = ('#e74c3c', '#f39c12', '#27ae60')
+    
+    # Theme palettes, built once and shared read-only (see get_theme_colors)
+    _DARK_PALETTE = MappingProxyType({
+        'bg': '#121212',              # Near black
+        'bg_elevated': '#1E1E1E',     # Slightly lighter for cards
+        'surface': '#2D2D2D',         # Interactive surfaces
+        'border': '#404040',          # Subtle borders
+        'text_primary': '#FFFFFF',    # High contrast text
+        'text_secondary': '#A0A0A0',  # Muted text
+        'text_tertiary': '#6B6B6B',   # Very muted
+        'primary': TARLETON_PURPLE,
+        'primary_hover': '#5E3A94',
+        'accent': TARLETON_GOLD,
+        'success': COLOR_SUCCESS,
+        'warning': COLOR_WARNING,
+        'error': COLOR_ERROR,
+        'divider': '#333333',
+        # Backward compatibility aliases for legacy code
+        'card_bg': '#1E1E1E',
+        'text': '#FFFFFF',
+        'fg': '#FFFFFF',
+        'gold': TARLETON_GOLD,
+        'button_primary': TARLETON_PURPLE,
+        'accent_light': TARLETON_PURPLE_LIGHT
+    })
+    _LIGHT_PALETTE = MappingProxyType({
+        'bg': '#FAFAFA',              # Light gray (not pure white)
+        'bg_elevated': '#FFFFFF',     # White for cards
+        'surface': '#F5F5F5',         # Interactive surfaces
+        'border': '#E0E0E0',          # Subtle borders
+        'text_primary': '#1A1A1A',    # Near black text
+        'text_secondary': '#6B7280',  # Gray text
+        'text_tertiary': '#9CA3AF',   # Light gray
+        'primary': TARLETON_PURPLE,
+        'primary_hover': '#5E3A94',
+        'accent': TARLETON_GOLD,
+        'success': COLOR_SUCCESS,
+        'warning': COLOR_WARNING,
+        'error': COLOR_ERROR,
+        'divider': '#E5E7EB',
+        # Backward compatibility aliases for legacy code
+        'card_bg': '#FFFFFF',
+        'text': '#1A1A1A',
+        'fg': '#1A1A1A',
+        'gold': TARLETON_GOLD,
+        'button_primary': TARLETON_PURPLE,
+        'accent_light': TARLETON_PURPLE_LIGHT
+    })
+    
     def __init__(self, root):
         self.root = root
         self.root.title("AI Learning Game - COSC 5360 Spring 2026 | Tarleton State University")
         self.root.geometry("1200x800")
         
-        # Modern Design System - Restrained color palette
-        self.TARLETON_PURPLE = "#4E2A84"  # Primary brand color
-        self.TARLETON_PURPLE_LIGHT = "#6B3FA0"
-        self.TARLETON_GOLD = "#C4A000"
-        
-        # Semantic colors (used sparingly)
-        self.COLOR_SUCCESS = "#10B981"  # Green - correct/success
-        self.COLOR_WARNING = "#F59E0B"  # Amber - warning/streak
-        self.COLOR_ERROR = "#EF4444"    # Red - error/wrong
-        self.COLOR_INFO = "#3B82F6"     # Blue - info
+        # Every screen is built inside this one container, so switching screens
+        # only tears down the container's children (see clear_window)
+        self._screen = tk.Frame(self.root)
+        self._screen.pack(fill=tk.BOTH, expand=True)
+        # Screens whose content never changes are built once into their own frame
+        # and swapped in and out instead (see _show_cached_screen)
+        self._screen_cache = {}  # (name, dark_mode): frame
+        self._cached_screen = None  # Cached frame currently shown in place of _screen
         
         # Theme management
         self.dark_mode = False
@@ -73,18 +229,29 @@ class AILearningApp:
         self.xp = 0
         self.level = 1
         self.streak = 0
-        self.last_study_date = None
-        self.achievements = []
+        self.last_study_day = 0  # date.toordinal() of the last study day, 0 if never
+        self.achievements = []  # Names in unlock order, for display
+        self._achievement_set = set()  # Same names as achievements, for O(1) membership checks
         self.unlocked_content = []
         
         # Spaced repetition data - enhanced with per-question tracking
-        self.review_schedule = {}  # topic_num: next_review_date
-        self.mastery_levels = defaultdict(int)  # topic_num: mastery (0-5)
-        self.question_memory = {}  # question_id: {strength, last_seen, confidence, times_correct, times_wrong}
+        self.last_review_day = {}  # topic_num: date.toordinal() of the last review
+        self.mastery_levels = [0] * 11  # Indexed by topic_num (1-10): mastery (0-5)
+        self._mastery_sum = 0  # Running sum of mastery_levels (see _set_mastery)
+        self.question_memory = {}  # question_id: {strength, last_seen (epoch secs), confidence, times_correct, times_wrong}
         self.review_queue = []  # List of question_ids to review
-        
-        # Adaptive difficulty tracking
-        self.topic_accuracy = defaultdict(lambda: {'correct': 0, 'total': 0})  # Per-topic accuracy
+        self._review_set = set()  # Same IDs as review_queue, for O(1) membership checks
+        
+        # Adaptive difficulty tracking: per-topic accuracy, indexed by topic_num
+        self.topic_correct = [0] * 11
+        self.topic_total = [0] * 11
+        self._topic_acc_pct = [0] * 11  # correct/total as a percent, kept by _update_accuracy
+        self._overall_accuracy = 0
+        self._weakest_topic = None  # Cached get_weakest_topic() result, None = stale
+        
+        # Dashboard figures, reused across redraws until _dash_ver changes (see _dashboard_stats)
+        self._dash_ver = 0
+        self._dash_cache = None
         self.difficulty_preference = 'adaptive'  # 'easy', 'normal', 'hard', 'adaptive'
         
         # Personal bests for leaderboard
@@ -108,10 +275,15 @@ class AILearningApp:
         self.session_start = datetime.now()
         self.streak_prompt_shown = False
         
+        # (ISO date, day ordinal) for today, reused until local midnight (see _today_iso)
+        self._today_cache = None
+        self._day_ends_at = 0
+        
         # Quest system
         self.active_quests = []
         self.completed_quests = []
         self.quest_progress = {}
+        self._quests_by_type = {}  # quest type: active quests of that type
         
         # Streak guardrails
         self.streak_freezes = 2  # Start with 2 free freezes
@@ -145,6 +317,30 @@ class AILearningApp:
         self.correct_answers = 0
         self.total_time_spent = 0  # Track total study time in seconds
         
+        # Persistence: saves are coalesced behind a dirty flag (see save_data)
+        self._dirty = False
+        self._gradebook_dirty = False
+        self._save_job = None
+        self._saved_digest = None  # Hash of the last written state (see _flush)
+        self._save_unreadable = False  # Set by load_data so a bad save isn't overwritten
+        
+        # Current quiz settings, replaced by start_quiz
+        self.is_test = False
+        self.is_daily_challenge = False
+        self.is_review = False
+        self.is_placement = False
+        self.time_limit = None
+        self.time_remaining = None
+        self.short_answer_mode = False
+        self.timer_label = None
+        # Answer and confidence inputs, shared by every quiz screen and reset per question
+        self.selected_answer = tk.StringVar(self.root)
+        self.confidence_var = tk.StringVar(self.root, value='medium')
+        
+        # Quiz countdown: time.monotonic() deadline and the pending tick (see update_timer)
+        self._deadline = None
+        self._timer_job = None
+        
         # Course topics from syllabus (must be before load_data)
         self.topics = {
             1: {"name": "Introduction to AI and Applications", "hours": 3, "completed": False},
@@ -162,80 +358,53 @@ class AILearningApp:
         # Load questions database
         self.questions_db = self.load_questions()
         
+        # Study text lives on the class; one instance serves every topic
+        self._study_content = StudyContent()
+        
+        # Info window reused by the visualizations, created on first use (see _show_info)
+        self._info_dialog = None
+        self._info_label = None
+        
         # Load or initialize data
         self.load_data()
         
         # Apply theme
         self.apply_theme()
         
+        # Write any pending progress before the window goes away
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        
         self.show_main_menu()
     
     def load_logo(self):
         """Load Tarleton State University logo"""
-        if PIL_AVAILABLE:
-            try:
-                script_dir = os.path.dirname(os.path.abspath(__file__))
-                logo_path = os.path.join(script_dir, 'TSU.png')
-                if os.path.exists(logo_path):
-                    img = Image.open(logo_path)
-                    # Resize for header
-                    img = img.resize((180, 60), Image.Resampling.LANCZOS)
-                    self.logo_image = ImageTk.PhotoImage(img)
-            except Exception as e:
-                print(f"Could not load logo: {e}")
-                self.logo_image = None
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        logo_path = os.path.join(script_dir, 'TSU.png')
+        if not os.path.exists(logo_path):
+            return
+        
+        # PIL is optional and only needed here, so import it on first use
+        try:
+            from PIL import Image, ImageTk
+        except ImportError:
+            return
+        
+        try:
+            img = Image.open(logo_path)
+            # Resize for header
+            img = img.resize((180, 60), Image.Resampling.LANCZOS)
+            self.logo_image = ImageTk.PhotoImage(img)
+        except Exception as e:
+            print(f"Could not load logo: {e}")
+            self.logo_image = None
     
     def get_theme_colors(self):
         """Modern design system colors - minimal, high contrast"""
-        if self.dark_mode:
-            colors = {
-                'bg': '#121212',              # Near black
-                'bg_elevated': '#1E1E1E',     # Slightly lighter for cards
-                'surface': '#2D2D2D',         # Interactive surfaces
-                'border': '#404040',          # Subtle borders
-                'text_primary': '#FFFFFF',    # High contrast text
-                'text_secondary': '#A0A0A0',  # Muted text
-                'text_tertiary': '#6B6B6B',   # Very muted
-                'primary': self.TARLETON_PURPLE,
-                'primary_hover': '#5E3A94',
-                'accent': self.TARLETON_GOLD,
-                'success': self.COLOR_SUCCESS,
-                'warning': self.COLOR_WARNING,
-                'error': self.COLOR_ERROR,
-                'divider': '#333333'
-            }
-        else:
-            colors = {
-                'bg': '#FAFAFA',              # Light gray (not pure white)
-                'bg_elevated': '#FFFFFF',     # White for cards
-                'surface': '#F5F5F5',         # Interactive surfaces
-                'border': '#E0E0E0',          # Subtle borders
-                'text_primary': '#1A1A1A',    # Near black text
-                'text_secondary': '#6B7280',  # Gray text
-                'text_tertiary': '#9CA3AF',   # Light gray
-                'primary': self.TARLETON_PURPLE,
-                'primary_hover': '#5E3A94',
-                'accent': self.TARLETON_GOLD,
-                'success': self.COLOR_SUCCESS,
-                'warning': self.COLOR_WARNING,
-                'error': self.COLOR_ERROR,
-                'divider': '#E5E7EB'
-            }
-        
-        # Backward compatibility aliases for legacy code
-        colors['card_bg'] = colors['bg_elevated']
-        colors['text'] = colors['text_primary']
-        colors['fg'] = colors['text_primary']
-        colors['gold'] = colors['accent']
-        colors['button_primary'] = colors['primary']
-        colors['accent_light'] = self.TARLETON_PURPLE_LIGHT
-        
-        return colors
+        return self._DARK_PALETTE if self.dark_mode else self._LIGHT_PALETTE
     
     def create_button(self, parent, text, command, style='secondary', width=None, icon=None):
         """Create a styled button following hierarchy: primary > secondary > tertiary"""
         colors = self.theme_colors
-        font_size = int(self.FONT_BUTTON * self.font_scale)
         
         if style == 'primary':
             bg = colors['primary']
@@ -259,7 +428,7 @@ class AILearningApp:
         btn_text = f"{icon} {text}" if icon else text
         
         btn = tk.Button(parent, text=btn_text, command=command,
-                       font=('Segoe UI', font_size, 'normal'),
+                       font=self._fonts['button'],
                        bg=bg, fg=fg, relief=relief, bd=border,
                        cursor='hand2', padx=16, pady=8,
                        activebackground=hover_bg, activeforeground=fg,
@@ -291,19 +460,75 @@ class AILearningApp:
         frame = tk.Frame(parent, bg=colors['bg'])
         
         tk.Label(frame, text=text,
-                font=('Segoe UI', int(self.FONT_SECTION * self.font_scale), 'bold'),
+                font=self._fonts['section_bold'],
                 bg=colors['bg'], fg=colors['text_primary']).pack(anchor='w')
         
         if subtitle:
             tk.Label(frame, text=subtitle,
-                    font=('Segoe UI', int(self.FONT_CAPTION * self.font_scale)),
+                    font=self._fonts['caption'],
                     bg=colors['bg'], fg=colors['text_tertiary']).pack(anchor='w')
         
         return frame
     
+    def create_score_bar(self, parent, width, height, pct, color):
+        """Create a flat horizontal bar filled to pct percent (one widget per bar)"""
+        bar = tk.Canvas(parent, bg='#e0e0e0', width=width, height=height,
+                       highlightthickness=0, bd=0)
+        if pct > 0:
+            bar.create_rectangle(0, 0, int(width * pct / 100), height, fill=color, width=0)
+        return bar
+    
+    def bind_wheel_scroll(self, canvas):
+        """Scroll canvas with the mouse wheel, coalescing wheel ticks to at most one scroll per frame"""
+        pending = {'units': 0, 'job': None}
+        
+        def apply_scroll():
+            units = pending['units']
+            pending['units'] = 0
+            pending['job'] = None
+            if units and canvas.winfo_exists():
+                canvas.yview_scroll(units, 'units')
+        
+        def on_wheel(event):
+            if event.num == 4:  # X11 reports the wheel as buttons 4/5
+                pending['units'] -= 1
+            elif event.num == 5:
+                pending['units'] += 1
+            elif abs(event.delta) >= 120:  # Windows: multiples of 120 per notch
+                pending['units'] -= event.delta // 120
+            elif event.delta:  # macOS: small raw deltas
+                pending['units'] += -1 if event.delta > 0 else 1
+            if pending['job'] is None:
+                pending['job'] = self.root.after(16, apply_scroll)
+        
+        # One scrolling screen is shown at a time; drop the global binding when it goes away
+        for sequence in ('<MouseWheel>', '<Button-4>', '<Button-5>'):
+            canvas.bind_all(sequence, on_wheel)
+        
+        def on_destroy(event):
+            for sequence in ('<MouseWheel>', '<Button-4>', '<Button-5>'):
+                canvas.unbind_all(sequence)
+            if pending['job'] is not None:
+                self.root.after_cancel(pending['job'])
+        
+        canvas.bind('<Destroy>', on_destroy)
+    
     def apply_theme(self):
         """Apply current theme to root window"""
         self.root.configure(bg=self.theme_colors['bg'])
+        self._screen.configure(bg=self.theme_colors['bg'])
+        self._fonts = self._build_fonts()
+    
+    def _build_fonts(self):
+        """Scaled font tuples for the typography ramp, e.g. 'body' and 'body_bold'"""
+        fonts = {}
+        for name, size in (('title', self.FONT_TITLE), ('subtitle', self.FONT_SUBTITLE),
+                           ('section', self.FONT_SECTION), ('body', self.FONT_BODY),
+                           ('button', self.FONT_BUTTON), ('caption', self.FONT_CAPTION)):
+            scaled = int(size * self.font_scale)
+            fonts[name] = ('Segoe UI', scaled)
+            fonts[name + '_bold'] = ('Segoe UI', scaled, 'bold')
+        return fonts
     
     def toggle_dark_mode(self):
         """Toggle between dark and light mode"""
@@ -316,17 +541,25 @@ class AILearningApp:
     def adjust_font_scale(self, scale):
         """Adjust font scaling"""
         self.font_scale = max(0.8, min(1.5, scale))
+        self._fonts = self._build_fonts()
         self.save_data()
     
     def load_data(self):
         """Load student progress from file"""
+        # Defaults from __init__, restored if a save can only be applied in part
+        defaults = dict(vars(self))
+        for name in ('scores', 'progress', 'mastery_levels', 'topic_correct', 'topic_total'):
+            defaults[name] = copy.copy(defaults[name])  # Filled in place below
         try:
             if os.path.exists('student_progress.json'):
-                with open('student_progress.json', 'r') as f:
-                    data = json.load(f)
+                with open('student_progress.json', 'rb') as f:
+                    data = _load_json(f.read())
                     self.student_name = data.get('name', '')
-                    self.scores = defaultdict(int, data.get('scores', {}))
-                    self.progress = defaultdict(int, data.get('progress', {}))
+                    # Fill the defaultdicts created in __init__ rather than rebuilding them
+                    self.scores.update(data.get('scores', {}))
+                    # JSON turns the int topic keys into strings; restore them
+                    for topic_key, pct in data.get('progress', {}).items():
+                        self.progress[int(topic_key)] = pct
                     self.total_questions_answered = data.get('total_questions', 0)
                     self.correct_answers = data.get('correct_answers', 0)
                     self.dark_mode = data.get('dark_mode', False)
@@ -334,20 +567,49 @@ class AILearningApp:
                     self.xp = data.get('xp', 0)
                     self.level = data.get('level', 1)
                     self.streak = data.get('streak', 0)
-                    self.last_study_date = data.get('last_study_date')
+                    self.last_study_day = data.get('last_study_day', 0)
+                    if 'last_study_day' not in data and data.get('last_study_date'):
+                        # Older saves stored the last study date as an ISO string
+                        self.last_study_day = date.fromisoformat(data['last_study_date']).toordinal()
                     self.achievements = data.get('achievements', [])
                     self.unlocked_content = data.get('unlocked_content', [])
-                    self.review_schedule = data.get('review_schedule', {})
-                    self.mastery_levels = defaultdict(int, data.get('mastery_levels', {}))
+                    # Per-topic stats are stored as {topic_key: value} dicts; skip keys
+                    # that don't name a topic slot rather than failing the whole load
+                    n_topics = len(self.mastery_levels)
+                    for topic_key, mastery in data.get('mastery_levels', {}).items():
+                        if not (topic_key.isdigit() and int(topic_key) < n_topics):
+                            continue
+                        self.mastery_levels[int(topic_key)] = mastery
+                    self._mastery_sum = sum(self.mastery_levels)
+                    # JSON turns the int topic keys into strings; restore them
+                    self.last_review_day = {int(t): d for t, d in data.get('last_review_day', {}).items()}
+                    if 'last_review_day' not in data:
+                        # Older saves stored the next review date; step back by its interval
+                        for t, next_review in data.get('review_schedule', {}).items():
+                            if not (t.isdigit() and int(t) < n_topics):
+                                continue
+                            interval = self._REVIEW_INTERVALS[min(int(self.mastery_levels[int(t)]), 5)]
+                            self.last_review_day[int(t)] = date.fromisoformat(next_review[:10]).toordinal() - interval
                     # New enhanced data
                     self.question_memory = data.get('question_memory', {})
+                    # Older saves stored last_seen as an ISO string
+                    for mem in self.question_memory.values():
+                        if isinstance(mem.get('last_seen'), str):
+                            mem['last_seen'] = int(datetime.fromisoformat(mem['last_seen']).timestamp())
                     self.review_queue = data.get('review_queue', [])
-                    self.topic_accuracy = defaultdict(lambda: {'correct': 0, 'total': 0}, 
-                                                       data.get('topic_accuracy', {}))
+                    for topic_key, acc_data in data.get('topic_accuracy', {}).items():
+                        if not (topic_key.isdigit() and int(topic_key) < n_topics):
+                            continue
+                        self.topic_correct[int(topic_key)] = acc_data.get('correct', 0)
+                        self.topic_total[int(topic_key)] = acc_data.get('total', 0)
+                    self._weakest_topic = None
                     self.personal_bests = data.get('personal_bests', {
                         'best_accuracy': 0, 'fastest_quiz': float('inf'),
                         'longest_streak': 0, 'highest_single_quiz': 0
                     })
+                    # Saved as null when there's no fastest quiz yet
+                    if self.personal_bests.get('fastest_quiz') is None:
+                        self.personal_bests['fastest_quiz'] = float('inf')
                     self.daily_challenge_completed = data.get('daily_challenge_completed')
                     self.daily_challenge_streak = data.get('daily_challenge_streak', 0)
                     self.onboarding_complete = data.get('onboarding_complete', False)
@@ -371,18 +633,52 @@ class AILearningApp:
                     # Question history
                     self.question_history = data.get('question_history', {})
                     self.total_time_spent = data.get('total_time_spent', 0)
-        except:
-            pass
+                    self.migrate_question_ids()
+        except Exception as e:
+            # Start over from defaults, but keep the unreadable save for recovery
+            self.__dict__.update(defaults)
+            try:
+                os.replace('student_progress.json', 'student_progress.json.bak')
+                kept = "It has been kept as student_progress.json.bak."
+            except OSError:
+                # Couldn't move it aside, so never write over it this session
+                self._save_unreadable = True
+                kept = "It has been left in place and will not be overwritten."
+            messagebox.showwarning("Progress Not Loaded",
+                                   f"Your saved progress could not be read ({e}).\n\n{kept}")
+        self._review_set = set(self.review_queue)
+        self._achievement_set = set(self.achievements)
+        self._index_quests()
+        self._update_accuracy()
         
         # Generate daily quests if needed
         self.check_and_generate_quests()
     
     def save_data(self):
-        """Save student progress to file"""
+        """Mark progress as changed and schedule a debounced write"""
+        self._dirty = True
+        self._gradebook_dirty = True
+        if self._save_job is None:
+            self._save_job = self.root.after(1500, self._flush)
+    
+    def _flush(self):
+        """Write student progress to file if anything changed"""
+        if self._save_job is not None:
+            self.root.after_cancel(self._save_job)
+            self._save_job = None
+        if not self._dirty or self._save_unreadable:
+            return
+        self._dirty = False
+        
         # Update personal bests
         if self.streak > self.personal_bests.get('longest_streak', 0):
             self.personal_bests['longest_streak'] = self.streak
+        # JSON has no infinity, so "no fastest quiz yet" is saved as null
+        personal_bests = dict(self.personal_bests)
+        if personal_bests.get('fastest_quiz') == float('inf'):
+            personal_bests['fastest_quiz'] = None
         
+        topic_keys = self._TOPIC_KEYS
         data = {
             'name': self.student_name,
             'scores': dict(self.scores),
@@ -394,15 +690,16 @@ class AILearningApp:
             'xp': self.xp,
             'level': self.level,
             'streak': self.streak,
-            'last_study_date': self.last_study_date,
+            'last_study_day': self.last_study_day,
             'achievements': self.achievements,
             'unlocked_content': self.unlocked_content,
-            'review_schedule': self.review_schedule,
-            'mastery_levels': dict(self.mastery_levels),
+            'last_review_day': self.last_review_day,
+            'mastery_levels': {topic_keys[t]: m for t, m in enumerate(self.mastery_levels) if m},
             'question_memory': self.question_memory,
             'review_queue': self.review_queue,
-            'topic_accuracy': dict(self.topic_accuracy),
-            'personal_bests': self.personal_bests,
+            'topic_accuracy': {topic_keys[t]: {'correct': self.topic_correct[t], 'total': n}
+                               for t, n in enumerate(self.topic_total) if n},
+            'personal_bests': personal_bests,
             'daily_challenge_completed': self.daily_challenge_completed,
             'daily_challenge_streak': self.daily_challenge_streak,
             'onboarding_complete': self.onboarding_complete,
@@ -422,22 +719,68 @@ class AILearningApp:
             'opt_in_leaderboard': self.opt_in_leaderboard,
             # Question history
             'question_history': self.question_history,
-            'total_time_spent': self.total_time_spent,
-            'last_updated': datetime.now().isoformat()
+            'total_time_spent': self.total_time_spent
         }
-        with open('student_progress.json', 'w') as f:
-            json.dump(data, f, indent=2)
         
-        # Also export gradebook-friendly data
-        self.export_gradebook_data()
+        # Skip the write when nothing actually changed since the last one
+        payload = _dump_json(data)
+        digest = hashlib.blake2b(payload, digest_size=8).digest()
+        if digest == self._saved_digest:
+            return
+        # Prepend the timestamp to the encoded state; it stays out of the digest
+        stamp = _dump_json({'last_updated': datetime.now().isoformat()})
+        
+        # Write to a temp file and rename so a crash never leaves a truncated file
+        try:
+            with open('student_progress.json.tmp', 'wb', buffering=64 * 1024) as f:
+                f.write(stamp[:-1] + b',' + payload[1:])
+            os.replace('student_progress.json.tmp', 'student_progress.json')
+        except OSError:
+            self._dirty = True  # Still unsaved; the next flush tries again
+            raise
+        self._saved_digest = digest
+    
+    def flush_gradebook(self):
+        """Re-export gradebook data if progress changed since the last export"""
+        if self._gradebook_dirty:
+            self._gradebook_dirty = False
+            self.export_gradebook_data()
+    
+    def on_close(self):
+        """Flush pending progress and close the app"""
+        try:
+            self._flush()
+            self.flush_gradebook()
+        except OSError as e:
+            messagebox.showerror("Save Error", f"Could not save your progress: {e}")
+        finally:
+            # Always let the window close, even if saving failed
+            self.root.destroy()
     
     def get_question_id(self, question):
         """Generate unique ID for a question"""
-        q_str = question['question'] + str(question['topic'])
-        return hashlib.md5(q_str.encode()).hexdigest()[:12]
+        q_id = question.get('_qid')
+        if q_id is None:
+            # Question not from questions_db (no precomputed ID)
+            q_id = _question_id(question['question'], question['topic'])
+        return q_id
+    
+    def migrate_question_ids(self):
+        """Re-key saved per-question data from legacy MD5 IDs to current IDs"""
+        known_ids = self.questions_by_id.keys()
+        saved_ids = set(self.question_memory) | set(self.question_history) | set(self.review_queue)
+        if saved_ids <= known_ids:
+            return
+        
+        legacy_ids = {_legacy_question_id(q['question'], q['topic']): q['_qid']
+                      for q in self.questions_db}
+        self.question_memory = {legacy_ids.get(k, k): v for k, v in self.question_memory.items()}
+        self.question_history = {legacy_ids.get(k, k): v for k, v in self.question_history.items()}
+        self.review_queue = [legacy_ids.get(k, k) for k in self.review_queue]
     
-    def update_question_memory(self, question, is_correct, confidence='medium'):
+    def update_question_memory(self, question, is_correct, confidence='medium', now=None):
         """Update per-question memory strength (enhanced spaced repetition)"""
+        # No save here: finish_quiz saves once after grading the whole quiz
         q_id = self.get_question_id(question)
         if q_id not in self.question_memory:
             self.question_memory[q_id] = {
@@ -446,39 +789,59 @@ class AILearningApp:
             }
         
         mem = self.question_memory[q_id]
-        mem['last_seen'] = datetime.now().isoformat()
+        mem['last_seen'] = int(time.time()) if now is None else now
         mem['confidence'] = confidence
         
         if is_correct:
             mem['times_correct'] += 1
-            # Increase strength more for high confidence correct answers
-            strength_gain = 1 if confidence == 'high' else 0.7 if confidence == 'medium' else 0.4
-            mem['strength'] = min(5, mem['strength'] + strength_gain)
+            # Increase strength more for high confidence correct answers (capped at 5)
+            strength = mem['strength'] + self._STRENGTH_GAIN.get(confidence, 0.4)
+            mem['strength'] = strength if strength < 5 else 5
         else:
             mem['times_wrong'] += 1
-            mem['strength'] = max(0, mem['strength'] - 1)
+            mem['strength'] = mem['strength'] - 1 if mem['strength'] > 1 else 0
             # Add to review queue if not already there
-            if q_id not in self.review_queue:
-                self.review_queue.append(q_id)
-        
-        self.save_data()
+            self._queue_for_review(q_id)
+    
+    def _queue_for_review(self, q_id):
+        """Append a question ID to the review queue; returns False if already queued"""
+        if q_id in self._review_set:
+            return False
+        self._review_set.add(q_id)
+        self.review_queue.append(q_id)
+        return True
     
     def get_exam_readiness(self):
         """Calculate exam readiness score (0-100) based on mastery across all topics"""
-        if not self.mastery_levels:
-            return 0
-        total_mastery = sum(self.mastery_levels.values())
         max_mastery = len(self.topics) * 5  # Max mastery is 5 per topic
-        return int((total_mastery / max_mastery) * 100)
+        return int((self._mastery_sum / max_mastery) * 100)
+    
+    def _set_mastery(self, topic_num, mastery):
+        """Set a topic's mastery level, keeping the running sum in step"""
+        self._mastery_sum += mastery - self.mastery_levels[topic_num]
+        self.mastery_levels[topic_num] = mastery
     
     def get_weakest_topic(self):
         """Find the topic with lowest accuracy for weak area booster"""
+        # Only recomputed after topic accuracy changes
+        if self._weakest_topic is None:
+            self._weakest_topic = self._find_weakest_topic()
+        return self._weakest_topic
+    
+    def _update_accuracy(self):
+        """Recompute cached overall and per-topic accuracy percents after answers are recorded"""
+        answered = self.total_questions_answered
+        self._overall_accuracy = (self.correct_answers / answered * 100) if answered > 0 else 0
+        for topic_num, total in enumerate(self.topic_total):
+            self._topic_acc_pct[topic_num] = (self.topic_correct[topic_num] / total) * 100 if total > 0 else 0
+    
+    def _find_weakest_topic(self):
+        """Scan all topics for the lowest accuracy"""
         weakest = None
         lowest_acc = 101
         for topic_num in self.topics.keys():
-            acc_data = self.topic_accuracy.get(str(topic_num), {'correct': 0, 'total': 0})
-            if acc_data['total'] > 0:
-                acc = (acc_data['correct'] / acc_data['total']) * 100
+            if self.topic_total[topic_num] > 0:
+                acc = self._topic_acc_pct[topic_num]
                 if acc < lowest_acc:
                     lowest_acc = acc
                     weakest = topic_num
@@ -489,20 +852,32 @@ class AILearningApp:
     
     def get_adaptive_difficulty(self, topic_num):
         """Get recommended difficulty based on topic accuracy"""
-        acc_data = self.topic_accuracy.get(str(topic_num), {'correct': 0, 'total': 0})
-        if acc_data['total'] < 5:
+        if self.topic_total[topic_num] < 5:
             return 'normal'
-        accuracy = (acc_data['correct'] / acc_data['total']) * 100
+        accuracy = self._topic_acc_pct[topic_num]
         if accuracy < 50:
             return 'easy'
         elif accuracy > 80:
             return 'hard'
         return 'normal'
     
+    def _today_iso(self):
+        """Today's date as an ISO string, recomputed only once the day rolls over"""
+        if time.time() >= self._day_ends_at:
+            today = date.today()
+            self._today_cache = (today.isoformat(), today.toordinal())
+            self._day_ends_at = datetime.combine(today + timedelta(days=1), datetime.min.time()).timestamp()
+        return self._today_cache[0]
+    
+    def _today_ordinal(self):
+        """Today's date as a date.toordinal() day number"""
+        self._today_iso()
+        return self._today_cache[1]
+    
     # ===== QUEST SYSTEM =====
     def check_and_generate_quests(self):
         """Generate daily/weekly quests tied to course objectives"""
-        today = datetime.now().date().isoformat()
+        today = self._today_iso()
         
         # Check if we need new daily quests
         if not self.active_quests or self.active_quests[0].get('generated_date') != today:
@@ -510,7 +885,7 @@ class AILearningApp:
     
     def generate_daily_quests(self):
         """Generate 3 daily quests based on student progress"""
-        today = datetime.now().date().isoformat()
+        today = self._today_iso()
         
         # Find weakest topic for targeted quest
         weakest_topic, _ = self.get_weakest_topic()
@@ -568,19 +943,25 @@ class AILearningApp:
             })
         
         self.active_quests = quest_templates
+        self._index_quests()
         self.save_data()
     
+    def _index_quests(self):
+        """Group active quests by type for update_quest_progress"""
+        self._quests_by_type = {}
+        for quest in self.active_quests:
+            self._quests_by_type.setdefault(quest['type'], []).append(quest)
+    
     def update_quest_progress(self, quest_type, amount=1, topic=None):
         """Update progress on active quests"""
-        for quest in self.active_quests:
-            if quest['type'] == quest_type:
-                if topic and quest.get('target_topic') and quest['target_topic'] != topic:
-                    continue
-                quest['progress'] = min(quest['target'], quest['progress'] + amount)
-                
-                # Check if quest completed
-                if quest['progress'] >= quest['target']:
-                    self.complete_quest(quest)
+        for quest in self._quests_by_type.get(quest_type, ()):
+            if topic and quest.get('target_topic') and quest['target_topic'] != topic:
+                continue
+            quest['progress'] = min(quest['target'], quest['progress'] + amount)
+            
+            # Check if quest completed
+            if quest['progress'] >= quest['target']:
+                self.complete_quest(quest)
         self.save_data()
     
     def complete_quest(self, quest):
@@ -588,22 +969,16 @@ class AILearningApp:
         if quest not in self.completed_quests:
             self.completed_quests.append(quest)
             self.active_quests = [q for q in self.active_quests if q['id'] != quest['id']]
+            self._quests_by_type[quest['type']] = [q for q in self._quests_by_type.get(quest['type'], [])
+                                                   if q['id'] != quest['id']]
             self.add_xp(quest['xp_reward'])
             
             # Unlock features based on completed quests
             completed_count = len(self.completed_quests)
-            if completed_count >= 5 and not self.unlocked_features['hard_mode']:
-                self.unlocked_features['hard_mode'] = True
-                self.unlock_achievement("Unlocked: Hard Mode!")
-            if completed_count >= 15 and not self.unlocked_features['exam_simulator']:
-                self.unlocked_features['exam_simulator'] = True
-                self.unlock_achievement("Unlocked: Exam Simulator!")
-            if completed_count >= 25 and not self.unlocked_features['bonus_visualizations']:
-                self.unlocked_features['bonus_visualizations'] = True
-                self.unlock_achievement("Unlocked: Bonus Visualizations!")
-            if completed_count >= 40 and not self.unlocked_features['case_studies']:
-                self.unlocked_features['case_studies'] = True
-                self.unlock_achievement("Unlocked: AI Case Studies!")
+            for name, key, required, _emoji in self._FEATURE_UNLOCKS:
+                if completed_count >= required and not self.unlocked_features[key]:
+                    self.unlocked_features[key] = True
+                    self.unlock_achievement(f"Unlocked: {name}!")
             
             messagebox.showinfo("Quest Complete!", 
                 f"🎉 {quest['title']}\n\n+{quest['xp_reward']} XP earned!")
@@ -629,13 +1004,12 @@ class AILearningApp:
     
     def check_streak_with_guardrails(self):
         """Check streak with supportive messaging and freeze option"""
-        today = datetime.now().date().isoformat()
-        yesterday = (datetime.now().date() - timedelta(days=1)).isoformat()
+        days_since = self._today_ordinal() - self.last_study_day
         
-        if self.last_study_date == today:
+        if days_since == 0:
             return True  # Already studied today
         
-        if self.last_study_date == yesterday:
+        if days_since == 1:
             return True  # Streak is intact, just needs activity
         
         # Streak at risk - offer freeze
@@ -652,7 +1026,7 @@ class AILearningApp:
                 return True
         
         # Supportive message if streak lost
-        if self.streak > 0 and self.last_study_date and self.last_study_date < yesterday:
+        if self.streak > 0 and self.last_study_day and days_since > 1:
             old_streak = self.streak
             self.streak = 0
             messagebox.showinfo("Starting Fresh",
@@ -665,7 +1039,7 @@ class AILearningApp:
     # ===== GRADEBOOK EXPORT =====
     def export_gradebook_data(self):
         """Export gradebook-friendly data for instructors"""
-        overall_accuracy = (self.correct_answers / self.total_questions_answered * 100) if self.total_questions_answered > 0 else 0
+        overall_accuracy = self._overall_accuracy
         
         export_data = {
             'student_name': self.student_name or 'Guest',
@@ -682,72 +1056,87 @@ class AILearningApp:
                 'current_streak': self.streak,
                 'longest_streak': self.personal_bests.get('longest_streak', 0),
                 'quests_completed': len(self.completed_quests)
-            },
-            'topic_mastery': {},
-            'topic_accuracy': {}
+            }
         }
         
         # Add per-topic data
-        for topic_num in self.topics.keys():
-            topic_key = str(topic_num)
-            export_data['topic_mastery'][topic_key] = {
-                'mastery_level': self.mastery_levels.get(topic_key, 0),
-                'mastery_percent': int((self.mastery_levels.get(topic_key, 0) / 5) * 100)
-            }
-            
-            acc_data = self.topic_accuracy.get(topic_key, {'correct': 0, 'total': 0})
-            if acc_data['total'] > 0:
-                export_data['topic_accuracy'][topic_key] = {
-                    'correct': acc_data['correct'],
-                    'total': acc_data['total'],
-                    'accuracy': round((acc_data['correct'] / acc_data['total']) * 100, 2)
-                }
-            else:
-                export_data['topic_accuracy'][topic_key] = {
-                    'correct': 0, 'total': 0, 'accuracy': 0
-                }
+        mastery = self.mastery_levels
+        correct = self.topic_correct
+        total = self.topic_total
+        acc_pct = self._topic_acc_pct
+        topic_keys = self._TOPIC_KEYS
+        export_data['topic_mastery'] = {
+            topic_keys[t]: {'mastery_level': mastery[t], 'mastery_percent': int(mastery[t] * 20)}  # level/5 as %
+            for t in self.topics
+        }
+        export_data['topic_accuracy'] = {
+            topic_keys[t]: {'correct': correct[t], 'total': total[t],
+                     'accuracy': round(acc_pct[t], 2) if total[t] > 0 else 0}
+            for t in self.topics
+        }
         
         # Save export file
         export_filename = f"gradebook_export_{self.student_name or 'guest'}.json"
         try:
-            with open(export_filename, 'w') as f:
-                json.dump(export_data, f, indent=2)
-        except:
-            pass  # Silent fail for export
+            # Compact JSON, encoded once and handed to the file as a single buffer
+            with open(export_filename + '.tmp', 'wb') as f:
+                f.write(_dump_json(export_data))
+            os.replace(export_filename + '.tmp', export_filename)
+        except OSError as e:
+            print(f"Could not export gradebook data: {e}")  # Export is best-effort
     
     def export_csv_report(self):
         """Export a CSV report for the instructor"""
-        import csv
-        
-        overall_accuracy = (self.correct_answers / self.total_questions_answered * 100) if self.total_questions_answered > 0 else 0
+        overall_accuracy = self._overall_accuracy
+        
+        rows = [
+            ('Metric', 'Value'),
+            ('Student Name', self.student_name or 'Guest'),
+            ('Total Questions', self.total_questions_answered),
+            ('Correct Answers', self.correct_answers),
+            ('Overall Accuracy (%)', f"{overall_accuracy:.1f}"),
+            ('Exam Readiness (%)', self.get_exam_readiness()),
+            ('Current Level', self.level),
+            ('Total XP', self.xp),
+            ('Current Streak', self.streak),
+            ('Time Spent (min)', f"{self.total_time_spent/60:.1f}"),
+            (),
+            ('Topic', 'Mastery %', 'Accuracy %', 'Questions'),
+        ]
+        for topic_num, topic_info in self.topics.items():
+            mastery = int(self.mastery_levels[topic_num] * 20)  # level/5 as %
+            total = self.topic_total[topic_num]
+            acc = self._topic_acc_pct[topic_num]
+            rows.append((topic_info['name'], mastery, f"{acc:.1f}", total))
         
+        # Rows are a snapshot, so the file can be written off the Tk thread
         filename = f"student_report_{self.student_name or 'guest'}.csv"
+        results = queue.Queue()
+        threading.Thread(target=self._write_csv_rows, args=(filename, rows, results),
+                         daemon=True).start()
+        self._poll_csv_export(filename, results)
+    
+    @staticmethod
+    def _write_csv_rows(filename, rows, results):
+        """Write CSV rows to filename (worker thread); puts None or the error on results"""
         try:
-            with open(filename, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow(['Metric', 'Value'])
-                writer.writerow(['Student Name', self.student_name or 'Guest'])
-                writer.writerow(['Total Questions', self.total_questions_answered])
-                writer.writerow(['Correct Answers', self.correct_answers])
-                writer.writerow(['Overall Accuracy (%)', f"{overall_accuracy:.1f}"])
-                writer.writerow(['Exam Readiness (%)', self.get_exam_readiness()])
-                writer.writerow(['Current Level', self.level])
-                writer.writerow(['Total XP', self.xp])
-                writer.writerow(['Current Streak', self.streak])
-                writer.writerow(['Time Spent (min)', f"{self.total_time_spent/60:.1f}"])
-                writer.writerow([])
-                writer.writerow(['Topic', 'Mastery %', 'Accuracy %', 'Questions'])
-                
-                for topic_num, topic_info in self.topics.items():
-                    topic_key = str(topic_num)
-                    mastery = int((self.mastery_levels.get(topic_key, 0) / 5) * 100)
-                    acc_data = self.topic_accuracy.get(topic_key, {'correct': 0, 'total': 0})
-                    acc = (acc_data['correct'] / acc_data['total'] * 100) if acc_data['total'] > 0 else 0
-                    writer.writerow([topic_info['name'], mastery, f"{acc:.1f}", acc_data['total']])
-            
-            messagebox.showinfo("Export Complete", f"Report saved to:\n{filename}")
+            with open(filename, 'w', newline='', encoding='utf-8', buffering=64 * 1024) as f:
+                csv.writer(f).writerows(rows)
+            results.put(None)
         except Exception as e:
-            messagebox.showerror("Export Error", f"Could not export report: {e}")
+            results.put(e)
+    
+    def _poll_csv_export(self, filename, results):
+        """Report the CSV export result once the worker thread finishes"""
+        try:
+            error = results.get_nowait()
+        except queue.Empty:
+            self.root.after(50, self._poll_csv_export, filename, results)
+            return
+        if error is None:
+            messagebox.showinfo("Export Complete", f"Report saved to:\n{filename}")
+        else:
+            messagebox.showerror("Export Error", f"Could not export report: {error}")
     
     def add_xp(self, amount):
         """Add XP and check for level up"""
@@ -761,36 +1150,30 @@ class AILearningApp:
     
     def update_streak(self):
         """Update daily study streak"""
-        today = datetime.now().date().isoformat()
-        if self.last_study_date != today:
-            if self.last_study_date:
-                yesterday = (datetime.now().date() - timedelta(days=1)).isoformat()
-                if self.last_study_date == yesterday:
-                    self.streak += 1
-                else:
-                    self.streak = 1
-            else:
-                self.streak = 1
-            self.last_study_date = today
-            if self.streak % 7 == 0:
-                self.unlock_achievement(f"{self.streak} Day Streak!")
-            self.save_data()
+        today = self._today_ordinal()
+        delta = today - self.last_study_day
+        if delta == 0:
+            return
+        self.streak = self.streak + 1 if delta == 1 else 1
+        self.last_study_day = today
+        if self.streak % 7 == 0:
+            self.unlock_achievement(f"{self.streak} Day Streak!")
+        self.save_data()
     
     def unlock_achievement(self, achievement_name):
         """Unlock an achievement"""
-        if achievement_name not in self.achievements:
+        if achievement_name not in self._achievement_set:
+            self._achievement_set.add(achievement_name)
             self.achievements.append(achievement_name)
-            self.add_xp(50)  # Bonus XP for achievements
-            self.save_data()
+            self.add_xp(50)  # Bonus XP for achievements (add_xp saves)
     
-    def check_spaced_repetition(self, topic_num):
+    def check_spaced_repetition(self, topic_num, today=None):
         """Check if topic needs review based on spaced repetition"""
-        today = datetime.now().date()
-        next_review = self.review_schedule.get(topic_num)
-        if not next_review:
+        last_review = self.last_review_day.get(topic_num)
+        if last_review is None:
             return True  # Never reviewed, should review
-        next_review_date = datetime.fromisoformat(next_review).date()
-        return today >= next_review_date
+        interval = self._REVIEW_INTERVALS[min(int(self.mastery_levels[topic_num]), 5)]
+        return (today or date.today()).toordinal() - last_review >= interval
     
     def update_spaced_repetition(self, topic_num, performance_score):
         """Update spaced repetition schedule based on performance"""
@@ -802,142 +1185,190 @@ class AILearningApp:
         else:  # Poor performance
             mastery = max(0, mastery - 1)
         
-        self.mastery_levels[topic_num] = mastery
+        self._set_mastery(topic_num, mastery)
+        self._dash_ver += 1
         
-        # Calculate next review date based on mastery (spaced repetition algorithm)
-        days_until_review = [1, 3, 7, 14, 30, 60][min(int(mastery), 5)]
-        next_review = datetime.now() + timedelta(days=days_until_review)
-        self.review_schedule[topic_num] = next_review.date().isoformat()
+        # Next review is due _REVIEW_INTERVALS[mastery] days from today (see check_spaced_repetition)
+        self.last_review_day[topic_num] = date.today().toordinal()
         self.save_data()
     
     def load_questions(self):
         """Load questions database"""
-        return QuestionsDatabase().get_all_questions()
+        self.question_database = QuestionsDatabase()
+        questions = self.question_database.get_all_questions()
+        # Precompute IDs and short-answer hints once
+        self.questions_by_id = {}
+        for q in questions:
+            q['_qid'] = _question_id(q['question'], q['topic'])
+            self.questions_by_id[q['_qid']] = q
+            # First letters of the correct answer's words, e.g. "G_______ d______"
+            q['_hint'] = ' '.join(w[0] + '_' * (len(w) - 1) for w in q['correct'].split()[:5])
+        return questions
     
     def clear_window(self):
-        """Clear all widgets from window"""
-        for widget in self.root.winfo_children():
+        """Clear all widgets from the screen container"""
+        if self._cached_screen is not None:
+            self._cached_screen.pack_forget()
+            self._cached_screen = None
+            self._screen.pack(fill=tk.BOTH, expand=True)
+        for widget in self._screen.winfo_children():
             widget.destroy()
     
+    def _show_cached_screen(self, name, build):
+        """Show a static screen, calling build() to fill it only on the first visit per theme"""
+        self.clear_window()
+        key = (name, self.dark_mode)
+        frame = self._screen_cache.get(key)
+        if frame is None:
+            # Point the builder at a fresh frame; it fills it exactly like the shared container
+            frame = tk.Frame(self.root)
+            live_screen, self._screen = self._screen, frame
+            try:
+                build()
+            finally:
+                self._screen = live_screen
+            self._screen_cache[key] = frame
+        self._screen.pack_forget()
+        frame.pack(fill=tk.BOTH, expand=True)
+        self._cached_screen = frame
+    
     def show_main_menu(self):
         """Modern, minimal dashboard with clear hierarchy"""
         self.clear_window()
+        # Gradebook export is kept off the per-answer save path; refresh it between activities
+        self.flush_gradebook()
         self.theme_colors = self.get_theme_colors()
         colors = self.theme_colors
+        bg = colors['bg']
+        bg_elevated = colors['bg_elevated']
+        surface = colors['surface']
+        text_primary = colors['text_primary']
+        text_secondary = colors['text_secondary']
+        text_tertiary = colors['text_tertiary']
+        primary = colors['primary']
+        success = colors['success']
+        warning = colors['warning']
+        error = colors['error']
+        fonts = self._fonts
+        font_title_bold = fonts['title_bold']
+        font_subtitle_bold = fonts['subtitle_bold']
+        font_body = fonts['body']
+        font_body_bold = fonts['body_bold']
+        font_caption = fonts['caption']
+        font_caption_bold = fonts['caption_bold']
         
         # Check for onboarding
         if not self.student_name and not self.is_guest and not self.onboarding_complete:
             self.show_onboarding()
             return
         
-        # Show streak prompt if needed (B=MAP: Prompt)
-        self.check_streak_prompt()
-        
-        self.root.configure(bg=colors['bg'])
+        self._screen.configure(bg=bg)
         
         # ===== MINIMAL HEADER =====
-        header = tk.Frame(self.root, bg=colors['bg_elevated'], height=56)
+        header = tk.Frame(self._screen, bg=bg_elevated, height=56)
         header.pack(fill=tk.X)
         header.pack_propagate(False)
         
-        header_inner = tk.Frame(header, bg=colors['bg_elevated'])
+        header_inner = tk.Frame(header, bg=bg_elevated)
         header_inner.pack(fill=tk.X, padx=self.SPACE_XL, pady=12)
         
         # Left: Logo + Course name
-        left_header = tk.Frame(header_inner, bg=colors['bg_elevated'])
+        left_header = tk.Frame(header_inner, bg=bg_elevated)
         left_header.pack(side=tk.LEFT)
         
         if self.logo_image:
-            logo_small = tk.Label(left_header, image=self.logo_image, bg=colors['bg_elevated'])
+            logo_small = tk.Label(left_header, image=self.logo_image, bg=bg_elevated)
             logo_small.pack(side=tk.LEFT, padx=(0, 12))
         
         tk.Label(left_header, text="COSC 5360 · AI Learning", 
-                font=('Segoe UI', int(self.FONT_SUBTITLE * self.font_scale), 'bold'),
-                bg=colors['bg_elevated'], fg=colors['text_primary']).pack(side=tk.LEFT)
+                font=font_subtitle_bold,
+                bg=bg_elevated, fg=text_primary).pack(side=tk.LEFT)
         
         # Right: User chip + settings
-        right_header = tk.Frame(header_inner, bg=colors['bg_elevated'])
+        right_header = tk.Frame(header_inner, bg=bg_elevated)
         right_header.pack(side=tk.RIGHT)
         
         # User chip
         name_display = self.student_name if self.student_name else "Guest"
         user_chip = tk.Label(right_header, text=f"Hi, {name_display[:12]}", 
-                            font=('Segoe UI', int(self.FONT_BODY * self.font_scale)),
-                            bg=colors['surface'], fg=colors['text_primary'],
+                            font=font_body,
+                            bg=surface, fg=text_primary,
                             padx=12, pady=4)
         user_chip.pack(side=tk.LEFT, padx=8)
         
         # Theme toggle (minimal)
         theme_btn = tk.Button(right_header, text="◐" if not self.dark_mode else "◑",
                              command=self.toggle_dark_mode,
-                             font=('Segoe UI', 14), bg=colors['bg_elevated'],
-                             fg=colors['text_secondary'], relief=tk.FLAT, bd=0,
+                             font=('Segoe UI', 14), bg=bg_elevated,
+                             fg=text_secondary, relief=tk.FLAT, bd=0,
                              cursor='hand2', width=3)
         theme_btn.pack(side=tk.LEFT)
         
         # ===== MAIN CONTENT AREA =====
-        main_frame = tk.Frame(self.root, bg=colors['bg'])
+        main_frame = tk.Frame(self._screen, bg=bg)
         main_frame.pack(fill=tk.BOTH, expand=True, padx=self.SPACE_XL, pady=self.SPACE_LG)
         
         # Constrain content width for readability
         content_width = 900
-        content = tk.Frame(main_frame, bg=colors['bg'], width=content_width)
+        content = tk.Frame(main_frame, bg=bg, width=content_width)
         content.pack(anchor='n')
         
+        # Show streak prompt if needed (B=MAP: Prompt)
+        self.check_streak_prompt(content)
+        
         # ===== TODAY CARD - Primary action area =====
         today_card, today_inner = self.create_card(content, padding=20)
         today_card.pack(fill=tk.X, pady=(0, self.SPACE_LG))
         
         # Stats row
-        stats_row = tk.Frame(today_inner, bg=colors['bg_elevated'])
+        stats_row = tk.Frame(today_inner, bg=bg_elevated)
         stats_row.pack(fill=tk.X, pady=(0, self.SPACE_MD))
         
         # Streak
-        streak_frame = tk.Frame(stats_row, bg=colors['bg_elevated'])
+        streak_frame = tk.Frame(stats_row, bg=bg_elevated)
         streak_frame.pack(side=tk.LEFT)
         
         tk.Label(streak_frame, text=f"{self.streak}", 
-                font=('Segoe UI', int(self.FONT_TITLE * self.font_scale), 'bold'),
-                bg=colors['bg_elevated'], fg=colors['warning']).pack(side=tk.LEFT)
+                font=font_title_bold,
+                bg=bg_elevated, fg=warning).pack(side=tk.LEFT)
         tk.Label(streak_frame, text=" day streak", 
-                font=('Segoe UI', int(self.FONT_BODY * self.font_scale)),
-                bg=colors['bg_elevated'], fg=colors['text_secondary']).pack(side=tk.LEFT, padx=(4, 0))
+                font=font_body,
+                bg=bg_elevated, fg=text_secondary).pack(side=tk.LEFT, padx=(4, 0))
         
         # XP + Level (right side)
-        xp_frame = tk.Frame(stats_row, bg=colors['bg_elevated'])
+        xp_frame = tk.Frame(stats_row, bg=bg_elevated)
         xp_frame.pack(side=tk.RIGHT)
         
         tk.Label(xp_frame, text=f"Level {self.level}", 
-                font=('Segoe UI', int(self.FONT_BODY * self.font_scale)),
-                bg=colors['bg_elevated'], fg=colors['text_secondary']).pack(side=tk.LEFT, padx=(0, 16))
+                font=font_body,
+                bg=bg_elevated, fg=text_secondary).pack(side=tk.LEFT, padx=(0, 16))
         tk.Label(xp_frame, text=f"{self.xp} XP", 
-                font=('Segoe UI', int(self.FONT_BODY * self.font_scale), 'bold'),
-                bg=colors['bg_elevated'], fg=colors['primary']).pack(side=tk.LEFT)
+                font=font_body_bold,
+                bg=bg_elevated, fg=primary).pack(side=tk.LEFT)
         
         # Exam readiness bar
-        readiness_row = tk.Frame(today_inner, bg=colors['bg_elevated'])
+        readiness_row = tk.Frame(today_inner, bg=bg_elevated)
         readiness_row.pack(fill=tk.X, pady=(0, self.SPACE_MD))
         
-        exam_readiness = self.get_exam_readiness()
+        exam_readiness, review_topics, weakest_topic, weak_acc = self._dashboard_stats()
         tk.Label(readiness_row, text="Exam readiness", 
-                font=('Segoe UI', int(self.FONT_CAPTION * self.font_scale)),
-                bg=colors['bg_elevated'], fg=colors['text_tertiary']).pack(anchor='w')
+                font=font_caption,
+                bg=bg_elevated, fg=text_tertiary).pack(anchor='w')
         
-        bar_bg = tk.Frame(readiness_row, bg=colors['surface'], height=8)
+        bar_bg = tk.Frame(readiness_row, bg=surface, height=8)
         bar_bg.pack(fill=tk.X, pady=4)
         
-        bar_color = colors['success'] if exam_readiness >= 70 else colors['warning'] if exam_readiness >= 40 else colors['error']
+        bar_color = success if exam_readiness >= 70 else warning if exam_readiness >= 40 else error
         bar_fill = tk.Frame(bar_bg, bg=bar_color, height=8, width=int(content_width * 0.9 * exam_readiness / 100))
         bar_fill.place(x=0, y=0)
         
         tk.Label(readiness_row, text=f"{exam_readiness}%", 
-                font=('Segoe UI', int(self.FONT_CAPTION * self.font_scale), 'bold'),
-                bg=colors['bg_elevated'], fg=bar_color).pack(anchor='e')
+                font=font_caption_bold,
+                bg=bg_elevated, fg=bar_color).pack(anchor='e')
         
         # Primary CTA - Daily Challenge
-        today = datetime.now().date().isoformat()
-        if self.last_study_date != today:
-            cta_frame = tk.Frame(today_inner, bg=colors['bg_elevated'])
+        if self.last_study_day != self._today_ordinal():
+            cta_frame = tk.Frame(today_inner, bg=bg_elevated)
             cta_frame.pack(fill=tk.X, pady=(self.SPACE_SM, 0))
             
             primary_btn = self.create_button(cta_frame, "Start Daily Challenge", 
@@ -945,23 +1376,21 @@ class AILearningApp:
             primary_btn.pack(side=tk.LEFT)
             
             tk.Label(cta_frame, text="2-3 min to keep your streak", 
-                    font=('Segoe UI', int(self.FONT_CAPTION * self.font_scale)),
-                    bg=colors['bg_elevated'], fg=colors['text_tertiary']).pack(side=tk.LEFT, padx=12)
+                    font=font_caption,
+                    bg=bg_elevated, fg=text_tertiary).pack(side=tk.LEFT, padx=12)
         else:
             tk.Label(today_inner, text="✓ Today's practice complete", 
-                    font=('Segoe UI', int(self.FONT_BODY * self.font_scale)),
-                    bg=colors['bg_elevated'], fg=colors['success']).pack(anchor='w')
+                    font=font_body,
+                    bg=bg_elevated, fg=success).pack(anchor='w')
         
         # ===== NEXT ACTIONS - 3 cards =====
         self.create_section_header(content, "Recommended for you").pack(anchor='w', pady=(0, self.SPACE_SM))
         
-        actions_frame = tk.Frame(content, bg=colors['bg'])
+        actions_frame = tk.Frame(content, bg=bg)
         actions_frame.pack(fill=tk.X, pady=(0, self.SPACE_LG))
         
         # Get data for action cards
-        review_topics = [tn for tn in self.topics.keys() if self.check_spaced_repetition(tn)]
         review_count = len(review_topics)
-        weakest_topic, weak_acc = self.get_weakest_topic()
         
         action_data = [
             ("Review", f"{review_count} topics due" if review_count else "All caught up",
@@ -982,60 +1411,63 @@ class AILearningApp:
         # ===== EXPLORE - Secondary navigation =====
         self.create_section_header(content, "Explore", "All features").pack(anchor='w', pady=(0, self.SPACE_SM))
         
-        nav_frame = tk.Frame(content, bg=colors['bg'])
+        nav_frame = tk.Frame(content, bg=bg)
         nav_frame.pack(fill=tk.X)
         
         # Navigation items - text links, not colored buttons
-        nav_items = [
-            ("Study", self.show_topics_menu),
-            ("Quiz", self.show_quiz_options),
-            ("Quests", self.show_quests),
-            ("Progress", self.show_progress),
-            ("Skills Map", self.show_skills_map),
-            ("Leaderboard", self.show_leaderboard),
-            ("NN Builder", self.show_nn_builder),
-            ("Visualize", self.show_visualizations),
-            ("Practice", self.show_practice_tests),
-            ("Achievements", self.show_achievements),
-        ]
-        
-        for i, (label, command) in enumerate(nav_items):
-            btn = self.create_button(nav_frame, label, command, style='secondary')
+        for i, (label, attr) in enumerate(self._NAV_ITEMS):
+            btn = self.create_button(nav_frame, label, getattr(self, attr), style='secondary')
             btn.grid(row=i//5, column=i%5, padx=4, pady=4, sticky='ew')
         
         for col in range(5):
             nav_frame.columnconfigure(col, weight=1)
         
         # Footer link
-        footer = tk.Frame(content, bg=colors['bg'])
+        footer = tk.Frame(content, bg=bg)
         footer.pack(fill=tk.X, pady=(self.SPACE_LG, 0))
         
         tk.Button(footer, text="About · Instructor Dashboard", 
                  command=self.show_about,
-                 font=('Segoe UI', int(self.FONT_CAPTION * self.font_scale)),
-                 bg=colors['bg'], fg=colors['text_tertiary'],
+                 font=font_caption,
+                 bg=bg, fg=text_tertiary,
                  relief=tk.FLAT, bd=0, cursor='hand2').pack(side=tk.LEFT)
     
+    def _dashboard_stats(self):
+        """Return (exam readiness, topics due for review, weakest topic, its accuracy)"""
+        # Review due-ness also depends on the date, so a new day invalidates too
+        key = (self._dash_ver, self._today_iso())
+        if self._dash_cache is None or self._dash_cache[0] != key:
+            today = date.fromisoformat(key[1])
+            review_topics = [tn for tn in self.topics.keys() if self.check_spaced_repetition(tn, today)]
+            weakest_topic, weak_acc = self.get_weakest_topic()
+            self._dash_cache = (key, (self.get_exam_readiness(), review_topics, weakest_topic, weak_acc))
+        return self._dash_cache[1]
+    
     def _create_minimal_action_card(self, parent, title, subtitle, command, is_active, col):
         """Create a minimal action card"""
         colors = self.theme_colors
-        
-        card = tk.Frame(parent, bg=colors['bg_elevated'],
-                       highlightbackground=colors['border'],
+        bg_elevated = colors['bg_elevated']
+        border = colors['border']
+        text_primary = colors['text_primary']
+        text_secondary = colors['text_secondary']
+        text_tertiary = colors['text_tertiary']
+        
+        card = tk.Frame(parent, bg=bg_elevated,
+                       highlightbackground=border,
                        highlightthickness=1)
         card.grid(row=0, column=col, padx=4, pady=0, sticky='nsew')
         
-        inner = tk.Frame(card, bg=colors['bg_elevated'])
+        inner = tk.Frame(card, bg=bg_elevated)
         inner.pack(fill=tk.BOTH, expand=True, padx=16, pady=16)
         
         tk.Label(inner, text=title,
-                font=('Segoe UI', int(self.FONT_BODY * self.font_scale), 'bold'),
-                bg=colors['bg_elevated'], 
-                fg=colors['text_primary'] if is_active else colors['text_tertiary']).pack(anchor='w')
+                font=self._fonts['body_bold'],
+                bg=bg_elevated, 
+                fg=text_primary if is_active else text_tertiary).pack(anchor='w')
         
         tk.Label(inner, text=subtitle,
-                font=('Segoe UI', int(self.FONT_CAPTION * self.font_scale)),
-                bg=colors['bg_elevated'], fg=colors['text_secondary']).pack(anchor='w', pady=(2, 8))
+                font=self._fonts['caption'],
+                bg=bg_elevated, fg=text_secondary).pack(anchor='w', pady=(2, 8))
         
         if command and is_active:
             btn = self.create_button(inner, "Start", command, style='tertiary')
@@ -1053,13 +1485,13 @@ class AILearningApp:
         inner.pack(fill=tk.BOTH, expand=True, padx=16, pady=16)
         
         tk.Label(inner, text=title.replace('⚡ ', '').replace('📋 ', '').replace('🔧 ', ''),
-                font=('Segoe UI', int(self.FONT_BODY * self.font_scale), 'bold'),
+                font=self._fonts['body_bold'],
                 bg=colors['bg_elevated'], fg=colors['text_primary']).pack(anchor='w')
         
-        tk.Label(inner, text=subtitle, font=('Segoe UI', int(self.FONT_CAPTION * self.font_scale)),
+        tk.Label(inner, text=subtitle, font=self._fonts['caption'],
                 bg=colors['bg_elevated'], fg=colors['text_secondary']).pack(anchor='w', pady=(2, 0))
         
-        tk.Label(inner, text=description, font=('Segoe UI', int(self.FONT_CAPTION * self.font_scale)),
+        tk.Label(inner, text=description, font=self._fonts['caption'],
                 bg=colors['bg_elevated'], fg=colors['text_tertiary'],
                 wraplength=200).pack(anchor='w', pady=(4, 8))
         
@@ -1067,59 +1499,78 @@ class AILearningApp:
             btn = self.create_button(inner, "Start", command, style='tertiary')
             btn.pack(anchor='w')
     
-    def check_streak_prompt(self):
-        """Show gentle prompt to keep streak (B=MAP: Prompt)"""
-        today = datetime.now().date().isoformat()
-        if self.last_study_date != today and not self.streak_prompt_shown and self.streak > 0:
+    def check_streak_prompt(self, parent):
+        """Show gentle in-page prompt to keep streak (B=MAP: Prompt)"""
+        if self.last_study_day == self._today_ordinal() or self.streak_prompt_shown or self.streak <= 0:
+            return False
+        
+        colors = self.theme_colors
+        surface = colors['surface']
+        
+        # Non-modal banner at the top of the dashboard
+        banner = tk.Frame(parent, bg=surface)
+        banner.pack(fill=tk.X, pady=(0, self.SPACE_MD))
+        
+        tk.Label(banner, text=f"🔥 Keep your {self.streak} day streak! "
+                              "Take a 2-minute Daily Challenge to keep it going.",
+                font=self._fonts['body'],
+                bg=surface, fg=colors['text_primary'],
+                padx=12, pady=8).pack(side=tk.LEFT)
+        
+        def start():
             self.streak_prompt_shown = True
-            # Show non-intrusive prompt
-            response = messagebox.askquestion("Keep Your Streak!", 
-                f"🔥 You have a {self.streak} day streak!\n\n"
-                "Take a 2-minute Daily Challenge to keep it going?\n\n"
-                "(You can also do this later from the home screen)",
-                icon='question')
-            if response == 'yes':
-                self.start_daily_challenge()
-                return True
-        return False
+            self.start_daily_challenge()
+        
+        def dismiss():
+            self.streak_prompt_shown = True
+            banner.destroy()
+        
+        self.create_button(banner, "Dismiss", dismiss, style='tertiary').pack(side=tk.RIGHT, padx=(0, 8), pady=4)
+        self.create_button(banner, "Start", start, style='primary').pack(side=tk.RIGHT, padx=4, pady=4)
+        return True
     
     def show_onboarding(self):
         """Modern, minimal onboarding screen"""
         self.clear_window()
         colors = self.theme_colors
-        self.root.configure(bg=colors['bg'])
+        bg = colors['bg']
+        bg_elevated = colors['bg_elevated']
+        surface = colors['surface']
+        text_primary = colors['text_primary']
+        text_secondary = colors['text_secondary']
+        self._screen.configure(bg=bg)
         
         # Center content
-        center_frame = tk.Frame(self.root, bg=colors['bg'])
+        center_frame = tk.Frame(self._screen, bg=bg)
         center_frame.place(relx=0.5, rely=0.5, anchor='center')
         
         # Logo
         if self.logo_image:
-            logo_label = tk.Label(center_frame, image=self.logo_image, bg=colors['bg'])
+            logo_label = tk.Label(center_frame, image=self.logo_image, bg=bg)
             logo_label.pack(pady=(0, 24))
         
         # Welcome text
         tk.Label(center_frame, text="Welcome to AI Learning", 
-                font=('Segoe UI', int(self.FONT_TITLE * self.font_scale), 'bold'),
-                bg=colors['bg'], fg=colors['text_primary']).pack()
+                font=self._fonts['title_bold'],
+                bg=bg, fg=text_primary).pack()
         
         tk.Label(center_frame, text="COSC 5360 · Spring 2026", 
-                font=('Segoe UI', int(self.FONT_BODY * self.font_scale)),
-                bg=colors['bg'], fg=colors['text_secondary']).pack(pady=(4, 32))
+                font=self._fonts['body'],
+                bg=bg, fg=text_secondary).pack(pady=(4, 32))
         
         # Name entry card
         card, card_inner = self.create_card(center_frame, padding=24)
         card.pack(pady=16)
         
         tk.Label(card_inner, text="What's your name?", 
-                font=('Segoe UI', int(self.FONT_BODY * self.font_scale)),
-                bg=colors['bg_elevated'], fg=colors['text_primary']).pack(anchor='w')
+                font=self._fonts['body'],
+                bg=bg_elevated, fg=text_primary).pack(anchor='w')
         
         name_entry = tk.Entry(card_inner, 
-                             font=('Segoe UI', int(self.FONT_SUBTITLE * self.font_scale)),
+                             font=self._fonts['subtitle'],
                              width=28, relief=tk.FLAT, bd=0,
-                             bg=colors['surface'], fg=colors['text_primary'],
-                             insertbackground=colors['text_primary'])
+                             bg=surface, fg=text_primary,
+                             insertbackground=text_primary)
         name_entry.pack(fill=tk.X, pady=(8, 16), ipady=8)
         name_entry.focus()
         
@@ -1151,7 +1602,7 @@ class AILearningApp:
     def show_guided_tour(self):
         """Show 30-second guided tour for new users"""
         self.clear_window()
-        self.root.configure(bg=self.theme_colors['bg'])
+        self._screen.configure(bg=self.theme_colors['bg'])
         
         tour_steps = [
             ("🎯 Daily Challenges", "Complete quick 2-3 minute challenges to build your streak and stay sharp."),
@@ -1160,7 +1611,7 @@ class AILearningApp:
             ("🏆 Earn Rewards", "Gain XP, level up, and unlock achievements as you learn!")
         ]
         
-        center_frame = tk.Frame(self.root, bg=self.theme_colors['bg'])
+        center_frame = tk.Frame(self._screen, bg=self.theme_colors['bg'])
         center_frame.place(relx=0.5, rely=0.5, anchor='center')
         
         tk.Label(center_frame, text=f"Welcome, {self.student_name}! Here's how it works:", 
@@ -1191,13 +1642,15 @@ class AILearningApp:
                  bg='#95a5a6', fg='white', font=('Arial', int(12 * self.font_scale)),
                  width=25, relief=tk.FLAT, cursor='hand2').pack(pady=5)
     
-    def _lighten_hex(self, hex_color):
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _lighten_hex(hex_color):
         """Lighten a hex color by 20%"""
-        hex_color = hex_color.lstrip('#')
-        r, g, b = tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-        r = min(255, int(r * 1.2))
-        g = min(255, int(g * 1.2))
-        b = min(255, int(b * 1.2))
+        # One int parse, then integer math per channel (x * 6 // 5 == int(x * 1.2) for 0-255)
+        rgb = int(hex_color.lstrip('#'), 16)
+        r = min(255, (rgb >> 16) * 6 // 5)
+        g = min(255, ((rgb >> 8) & 0xFF) * 6 // 5)
+        b = min(255, (rgb & 0xFF) * 6 // 5)
         return f'#{r:02x}{g:02x}{b:02x}'
     
     def start_daily_challenge(self):
@@ -1207,18 +1660,15 @@ class AILearningApp:
             return
         
         # Mix questions from different topics (interleaving for desirable difficulty)
-        all_questions = list(self.questions_db)
-        random.shuffle(all_questions)
-        
         # Select 5 questions for a quick challenge
-        challenge_questions = all_questions[:5]
+        challenge_questions = random.sample(self.questions_db, min(5, len(self.questions_db)))
         
         self.start_quiz(challenge_questions, "⚡ Daily Challenge", None, 
                        is_daily_challenge=True, time_limit=180)  # 3 min time limit
     
     def start_review_session(self):
         """Start spaced repetition review session"""
-        review_topics = [tn for tn in self.topics.keys() if self.check_spaced_repetition(tn)]
+        review_topics = self._dashboard_stats()[1]
         if not review_topics:
             messagebox.showinfo("All Caught Up!", "No topics need review right now. Great job!")
             return
@@ -1226,9 +1676,7 @@ class AILearningApp:
         # Collect questions from topics due for review
         review_questions = []
         for topic_num in review_topics[:3]:  # Limit to 3 topics per session
-            topic_questions = [q for q in self.questions_db if q['topic'] == topic_num]
-            random.shuffle(topic_questions)
-            review_questions.extend(topic_questions[:3])
+            review_questions.extend(self.question_database.sample_topic(topic_num, 3))
         
         random.shuffle(review_questions)
         
@@ -1242,7 +1690,7 @@ class AILearningApp:
         if not topic_num:
             return
         
-        questions = [q for q in self.questions_db if q['topic'] == topic_num]
+        questions = self.question_database.get_topic(topic_num)
         if not questions:
             messagebox.showinfo("No Questions", "No questions available for this topic.")
             return
@@ -1250,8 +1698,7 @@ class AILearningApp:
         # Get adaptive difficulty
         difficulty = self.get_adaptive_difficulty(topic_num)
         
-        random.shuffle(questions)
-        drill_questions = questions[:8]  # 8 question drill
+        drill_questions = self.question_database.sample_topic(topic_num, 8)  # 8 question drill
         
         self.start_quiz(drill_questions, f"🔧 Weak Area Drill - Topic {topic_num}", 
                        topic_num, difficulty_mode=difficulty)
@@ -1261,7 +1708,7 @@ class AILearningApp:
         # Select 1 question from each of the first 5 topics
         placement_questions = []
         for topic_num in range(1, 6):
-            topic_questions = [q for q in self.questions_db if q['topic'] == topic_num]
+            topic_questions = self.question_database.get_topic(topic_num)
             if topic_questions:
                 placement_questions.append(random.choice(topic_questions))
         
@@ -1276,23 +1723,27 @@ class AILearningApp:
     def show_quiz_options(self):
         """Show quiz mode selection (SDT: Autonomy - choice)"""
         self.clear_window()
-        self.root.configure(bg=self.theme_colors['bg'])
+        colors = self.theme_colors
+        bg = colors['bg']
+        text_secondary = colors['text_secondary']
+        card_bg = colors['card_bg']
+        self._screen.configure(bg=bg)
         
-        back_btn = tk.Button(self.root, text="← Back to Menu", command=self.show_main_menu,
+        back_btn = tk.Button(self._screen, text="← Back to Menu", command=self.show_main_menu,
                             bg=self.TARLETON_PURPLE, fg='white', font=('Arial', 12),
                             relief=tk.FLAT, cursor='hand2')
         back_btn.pack(anchor='nw', padx=10, pady=10)
         
-        header = tk.Label(self.root, text="🎮 Choose Your Quiz Mode", 
-                         font=('Georgia', 24, 'bold'), bg=self.theme_colors['bg'], 
+        header = tk.Label(self._screen, text="🎮 Choose Your Quiz Mode", 
+                         font=('Georgia', 24, 'bold'), bg=bg, 
                          fg=self.TARLETON_PURPLE)
         header.pack(pady=20)
         
-        tk.Label(self.root, text="Select the mode that fits your learning style (SDT: Autonomy)", 
-                font=('Arial', 12), bg=self.theme_colors['bg'], 
-                fg=self.theme_colors['text_secondary']).pack(pady=5)
+        tk.Label(self._screen, text="Select the mode that fits your learning style (SDT: Autonomy)", 
+                font=('Arial', 12), bg=bg, 
+                fg=text_secondary).pack(pady=5)
         
-        content_frame = tk.Frame(self.root, bg=self.theme_colors['bg'])
+        content_frame = tk.Frame(self._screen, bg=bg)
         content_frame.pack(fill=tk.BOTH, expand=True, padx=50, pady=20)
         
         # Quiz mode options
@@ -1312,20 +1763,20 @@ class AILearningApp:
         ]
         
         for i, (title, desc, color, command) in enumerate(modes):
-            mode_frame = tk.Frame(content_frame, bg=self.theme_colors['card_bg'],
+            mode_frame = tk.Frame(content_frame, bg=card_bg,
                                  highlightbackground=color, highlightthickness=2)
             mode_frame.pack(fill=tk.X, pady=8)
             
-            inner = tk.Frame(mode_frame, bg=self.theme_colors['card_bg'])
+            inner = tk.Frame(mode_frame, bg=card_bg)
             inner.pack(fill=tk.X, padx=20, pady=15)
             
-            left = tk.Frame(inner, bg=self.theme_colors['card_bg'])
+            left = tk.Frame(inner, bg=card_bg)
             left.pack(side=tk.LEFT, fill=tk.Y)
             
             tk.Label(left, text=title, font=('Arial', 14, 'bold'),
-                    bg=self.theme_colors['card_bg'], fg=color).pack(anchor='w')
+                    bg=card_bg, fg=color).pack(anchor='w')
             tk.Label(left, text=desc, font=('Arial', 11),
-                    bg=self.theme_colors['card_bg'], fg=self.theme_colors['text_secondary']).pack(anchor='w')
+                    bg=card_bg, fg=text_secondary).pack(anchor='w')
             
             tk.Button(inner, text="Start", command=command,
                      bg=color, fg='white', font=('Arial', 12, 'bold'),
@@ -1333,161 +1784,166 @@ class AILearningApp:
     
     def start_interleaved_quiz(self):
         """Start mixed-topic quiz (interleaving for desirable difficulty)"""
-        all_questions = list(self.questions_db)
-        random.shuffle(all_questions)
-        
-        # Ensure we get questions from different topics
+        count = 10
+        # Random picks per topic, taken round-robin so every topic is covered before any repeats
+        db = self.question_database
+        topics = list(db.by_topic)
+        picks = [db.sample_topic(t, count) for t in random.sample(topics, len(topics))]
         selected = []
-        topics_used = set()
-        for q in all_questions:
-            if q['topic'] not in topics_used or len(selected) >= 10:
-                selected.append(q)
-                topics_used.add(q['topic'])
-            if len(selected) >= 10:
+        for depth in range(count):
+            for topic_picks in picks:
+                if depth < len(topic_picks):
+                    selected.append(topic_picks[depth])
+                    if len(selected) == count:
+                        break
+            if len(selected) == count:
                 break
         
         self.start_quiz(selected, "🔀 Interleaved Quiz", None)
     
     def start_timed_drill(self, seconds):
         """Start time-boxed drill"""
-        all_questions = list(self.questions_db)
-        random.shuffle(all_questions)
-        self.start_quiz(all_questions[:20], f"⏱️ Time Attack ({seconds//60} min)", 
+        questions = random.sample(self.questions_db, min(20, len(self.questions_db)))
+        self.start_quiz(questions, f"⏱️ Time Attack ({seconds//60} min)", 
                        None, time_limit=seconds)
     
     def start_short_answer_quiz(self):
         """Start short answer quiz mode (no multiple choice)"""
-        all_questions = list(self.questions_db)
-        random.shuffle(all_questions)
-        self.start_quiz(all_questions[:10], "📝 Short Answer Quiz", None, short_answer_mode=True)
+        questions = random.sample(self.questions_db, min(10, len(self.questions_db)))
+        self.start_quiz(questions, "📝 Short Answer Quiz", None, short_answer_mode=True)
     
     def show_skills_map(self):
         """Show detailed skills/mastery map (SDT: Competence visualization)"""
         self.clear_window()
-        self.root.configure(bg=self.theme_colors['bg'])
+        colors = self.theme_colors
+        bg = colors['bg']
+        text_secondary = colors['text_secondary']
+        card_bg = colors['card_bg']
+        text = colors['text']
+        self._screen.configure(bg=bg)
         
-        back_btn = tk.Button(self.root, text="← Back to Menu", command=self.show_main_menu,
+        back_btn = tk.Button(self._screen, text="← Back to Menu", command=self.show_main_menu,
                             bg=self.TARLETON_PURPLE, fg='white', font=('Arial', 12),
                             relief=tk.FLAT, cursor='hand2')
         back_btn.pack(anchor='nw', padx=10, pady=10)
         
-        header = tk.Label(self.root, text="📈 Your Skills Map", 
-                         font=('Georgia', 24, 'bold'), bg=self.theme_colors['bg'], 
+        header = tk.Label(self._screen, text="📈 Your Skills Map", 
+                         font=('Georgia', 24, 'bold'), bg=bg, 
                          fg=self.TARLETON_PURPLE)
         header.pack(pady=10)
         
         # Exam readiness
         exam_readiness = self.get_exam_readiness()
-        readiness_frame = tk.Frame(self.root, bg=self.theme_colors['card_bg'],
+        readiness_frame = tk.Frame(self._screen, bg=card_bg,
                                   highlightbackground=self.TARLETON_PURPLE, highlightthickness=2)
         readiness_frame.pack(fill=tk.X, padx=50, pady=10)
         
-        readiness_inner = tk.Frame(readiness_frame, bg=self.theme_colors['card_bg'])
+        readiness_inner = tk.Frame(readiness_frame, bg=card_bg)
         readiness_inner.pack(fill=tk.X, padx=20, pady=15)
         
         tk.Label(readiness_inner, text="📊 Overall Exam Readiness", 
                 font=('Arial', 16, 'bold'),
-                bg=self.theme_colors['card_bg'], fg=self.theme_colors['text']).pack(anchor='w')
+                bg=card_bg, fg=text).pack(anchor='w')
         
         # Large readiness bar
-        bar_frame = tk.Frame(readiness_inner, bg='#e0e0e0', height=30, width=500)
-        bar_frame.pack(pady=10, anchor='w')
-        bar_frame.pack_propagate(False)
-        
-        readiness_color = '#27ae60' if exam_readiness >= 70 else '#f39c12' if exam_readiness >= 40 else '#e74c3c'
-        bar_fill = tk.Frame(bar_frame, bg=readiness_color, height=30, width=int(500 * exam_readiness / 100))
-        bar_fill.place(x=0, y=0)
+        score_colors = self._SCORE_COLORS
+        readiness_color = score_colors[(exam_readiness >= 40) + (exam_readiness >= 70)]
+        self.create_score_bar(readiness_inner, 500, 30, exam_readiness, readiness_color).pack(pady=10, anchor='w')
         
         tk.Label(readiness_inner, text=f"{exam_readiness}% Ready for Exam", 
                 font=('Arial', 14, 'bold'),
-                bg=self.theme_colors['card_bg'], fg=readiness_color).pack(anchor='w')
+                bg=card_bg, fg=readiness_color).pack(anchor='w')
         
         # Scrollable topic details
-        canvas = tk.Canvas(self.root, bg=self.theme_colors['bg'], highlightthickness=0)
-        scrollbar = ttk.Scrollbar(self.root, orient="vertical", command=canvas.yview)
-        scrollable = tk.Frame(canvas, bg=self.theme_colors['bg'])
+        canvas = tk.Canvas(self._screen, bg=bg, highlightthickness=0)
+        scrollbar = ttk.Scrollbar(self._screen, orient="vertical", command=canvas.yview)
+        scrollable = tk.Frame(canvas, bg=bg)
         
-        scrollable.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
+        # The frame is the canvas' only item, so its new size is the scroll region
+        scrollable.bind("<Configure>", lambda e: canvas.configure(scrollregion=(0, 0, e.width, e.height)))
         canvas.create_window((0, 0), window=scrollable, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
         
         canvas.pack(side="left", fill="both", expand=True, padx=50, pady=10)
         scrollbar.pack(side="right", fill="y")
+        self.bind_wheel_scroll(canvas)
         
         for topic_num, topic_info in self.topics.items():
-            topic_frame = tk.Frame(scrollable, bg=self.theme_colors['card_bg'],
+            topic_frame = tk.Frame(scrollable, bg=card_bg,
                                   highlightbackground=self.TARLETON_PURPLE, highlightthickness=1)
             topic_frame.pack(fill=tk.X, pady=5, padx=10)
             
-            inner = tk.Frame(topic_frame, bg=self.theme_colors['card_bg'])
+            inner = tk.Frame(topic_frame, bg=card_bg)
             inner.pack(fill=tk.X, padx=15, pady=12)
             
             # Topic header
-            header_row = tk.Frame(inner, bg=self.theme_colors['card_bg'])
+            header_row = tk.Frame(inner, bg=card_bg)
             header_row.pack(fill=tk.X)
             
             tk.Label(header_row, text=f"Topic {topic_num}: {topic_info['name']}", 
                     font=('Arial', 12, 'bold'),
-                    bg=self.theme_colors['card_bg'], fg=self.TARLETON_PURPLE).pack(side=tk.LEFT)
+                    bg=card_bg, fg=self.TARLETON_PURPLE).pack(side=tk.LEFT)
             
             # Mastery level
-            mastery_level = self.mastery_levels.get(str(topic_num), 0)
-            mastery_pct = int((mastery_level / 5) * 100)
+            mastery_level = self.mastery_levels[topic_num]
+            mastery_pct = int(mastery_level * 20)
             
-            mastery_color = '#27ae60' if mastery_pct >= 70 else '#f39c12' if mastery_pct >= 40 else '#e74c3c'
+            mastery_color = score_colors[(mastery_pct >= 40) + (mastery_pct >= 70)]
             tk.Label(header_row, text=f"Mastery: {mastery_pct}%", 
                     font=('Arial', 11, 'bold'),
-                    bg=self.theme_colors['card_bg'], fg=mastery_color).pack(side=tk.RIGHT)
+                    bg=card_bg, fg=mastery_color).pack(side=tk.RIGHT)
             
             # Progress bar
-            bar_bg = tk.Frame(inner, bg='#e0e0e0', height=15, width=400)
-            bar_bg.pack(pady=5, anchor='w')
-            bar_bg.pack_propagate(False)
-            
-            bar_fill = tk.Frame(bar_bg, bg=mastery_color, height=15, width=int(400 * mastery_pct / 100))
-            bar_fill.place(x=0, y=0)
+            self.create_score_bar(inner, 400, 15, mastery_pct, mastery_color).pack(pady=5, anchor='w')
             
             # Accuracy stats
-            acc_data = self.topic_accuracy.get(str(topic_num), {'correct': 0, 'total': 0})
-            if acc_data['total'] > 0:
-                topic_acc = (acc_data['correct'] / acc_data['total']) * 100
-                tk.Label(inner, text=f"Accuracy: {topic_acc:.0f}% ({acc_data['correct']}/{acc_data['total']} correct)", 
+            correct = self.topic_correct[topic_num]
+            total = self.topic_total[topic_num]
+            if total > 0:
+                topic_acc = self._topic_acc_pct[topic_num]
+                tk.Label(inner, text=f"Accuracy: {topic_acc:.0f}% ({correct}/{total} correct)", 
                         font=('Arial', 10),
-                        bg=self.theme_colors['card_bg'], fg=self.theme_colors['text_secondary']).pack(anchor='w')
+                        bg=card_bg, fg=text_secondary).pack(anchor='w')
             else:
                 tk.Label(inner, text="No questions attempted yet", 
                         font=('Arial', 10),
-                        bg=self.theme_colors['card_bg'], fg=self.theme_colors['text_secondary']).pack(anchor='w')
+                        bg=card_bg, fg=text_secondary).pack(anchor='w')
     
     
     def show_topics_menu(self):
         """Display topics menu"""
         self.clear_window()
-        self.root.configure(bg=self.theme_colors['bg'])
+        colors = self.theme_colors
+        bg = colors['bg']
+        text_secondary = colors['text_secondary']
+        card_bg = colors['card_bg']
+        text = colors['text']
+        self._screen.configure(bg=bg)
         
         # Back button
-        back_btn = tk.Button(self.root, text="← Back to Menu", command=self.show_main_menu,
+        back_btn = tk.Button(self._screen, text="← Back to Menu", command=self.show_main_menu,
                             bg=self.TARLETON_PURPLE, fg='white', font=('Arial', 12),
                             relief=tk.FLAT, cursor='hand2')
         back_btn.pack(anchor='nw', padx=10, pady=10)
         
         # Header
-        header = tk.Label(self.root, text="📚 Course Topics", font=('Georgia', 28, 'bold'),
-                         bg=self.theme_colors['bg'], fg=self.TARLETON_PURPLE)
+        header = tk.Label(self._screen, text="📚 Course Topics", font=('Georgia', 28, 'bold'),
+                         bg=bg, fg=self.TARLETON_PURPLE)
         header.pack(pady=20)
         
         # Topics frame
-        topics_frame = tk.Frame(self.root, bg=self.theme_colors['bg'])
+        topics_frame = tk.Frame(self._screen, bg=bg)
         topics_frame.pack(fill=tk.BOTH, expand=True, padx=50, pady=20)
         
         # Create scrollable canvas
-        canvas = tk.Canvas(topics_frame, bg=self.theme_colors['bg'], highlightthickness=0)
+        canvas = tk.Canvas(topics_frame, bg=bg, highlightthickness=0)
         scrollbar = ttk.Scrollbar(topics_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = tk.Frame(canvas, bg=self.theme_colors['bg'])
+        scrollable_frame = tk.Frame(canvas, bg=bg)
         
+        # The frame is the canvas' only item, so its new size is the scroll region
         scrollable_frame.bind(
             "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+            lambda e: canvas.configure(scrollregion=(0, 0, e.width, e.height))
         )
         
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
@@ -1495,41 +1951,41 @@ class AILearningApp:
         
         # Display topics
         for topic_num, topic_info in self.topics.items():
-            topic_frame = tk.Frame(scrollable_frame, bg=self.theme_colors['card_bg'], relief=tk.FLAT, bd=0,
+            topic_frame = tk.Frame(scrollable_frame, bg=card_bg, relief=tk.FLAT, bd=0,
                                   highlightbackground=self.TARLETON_PURPLE, highlightthickness=2)
             topic_frame.pack(fill=tk.X, padx=10, pady=8)
             
             # Topic info
-            info_frame = tk.Frame(topic_frame, bg=self.theme_colors['card_bg'])
+            info_frame = tk.Frame(topic_frame, bg=card_bg)
             info_frame.pack(fill=tk.X, padx=15, pady=10)
             
             topic_label = tk.Label(info_frame, 
                                   text=f"Topic {topic_num}: {topic_info['name']}",
-                                  font=('Arial', 14, 'bold'), bg=self.theme_colors['card_bg'], 
+                                  font=('Arial', 14, 'bold'), bg=card_bg, 
                                   fg=self.TARLETON_PURPLE, anchor='w')
             topic_label.pack(fill=tk.X)
             
             hours_label = tk.Label(info_frame, 
                                   text=f"⏱️ {topic_info['hours']} hours",
-                                  font=('Arial', 11), bg=self.theme_colors['card_bg'], 
-                                  fg=self.theme_colors['text_secondary'], anchor='w')
+                                  font=('Arial', 11), bg=card_bg, 
+                                  fg=text_secondary, anchor='w')
             hours_label.pack(fill=tk.X)
             
             # Progress bar
             progress = self.progress.get(topic_num, 0)
-            progress_frame = tk.Frame(topic_frame, bg=self.theme_colors['card_bg'])
+            progress_frame = tk.Frame(topic_frame, bg=card_bg)
             progress_frame.pack(fill=tk.X, padx=15, pady=5)
             
             tk.Label(progress_frame, text=f"Progress: {progress}%", 
-                    font=('Arial', 10), bg=self.theme_colors['card_bg'], 
-                    fg=self.theme_colors['text']).pack(side=tk.LEFT)
+                    font=('Arial', 10), bg=card_bg, 
+                    fg=text).pack(side=tk.LEFT)
             
             progress_bar = ttk.Progressbar(progress_frame, length=300, mode='determinate')
             progress_bar['value'] = progress
             progress_bar.pack(side=tk.LEFT, padx=10, fill=tk.X, expand=True)
             
             # Buttons
-            btn_frame = tk.Frame(topic_frame, bg=self.theme_colors['card_bg'])
+            btn_frame = tk.Frame(topic_frame, bg=card_bg)
             btn_frame.pack(fill=tk.X, padx=15, pady=10)
             
             tk.Button(btn_frame, text="📖 Study", 
@@ -1549,29 +2005,32 @@ class AILearningApp:
         
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
+        self.bind_wheel_scroll(canvas)
     
     def study_topic(self, topic_num):
         """Show study material for a topic"""
         self.clear_window()
-        self.root.configure(bg=self.theme_colors['bg'])
+        self._screen.configure(bg=self.theme_colors['bg'])
         
-        back_btn = tk.Button(self.root, text="← Back", command=self.show_topics_menu,
+        back_btn = tk.Button(self._screen, text="← Back", command=self.show_topics_menu,
                             bg=self.TARLETON_PURPLE, fg='white', font=('Arial', 12),
                             relief=tk.FLAT, cursor='hand2')
         back_btn.pack(anchor='nw', padx=10, pady=10)
         
         topic_name = self.topics[topic_num]['name']
-        header = tk.Label(self.root, text=f"📖 {topic_name}", 
+        header = tk.Label(self._screen, text=f"📖 {topic_name}", 
                          font=('Georgia', 24, 'bold'), bg=self.theme_colors['bg'], 
                          fg=self.TARLETON_PURPLE)
         header.pack(pady=20)
         
         # Study content
-        content_frame = tk.Frame(self.root, bg=self.theme_colors['bg'])
+        content_frame = tk.Frame(self._screen, bg=self.theme_colors['bg'])
         content_frame.pack(fill=tk.BOTH, expand=True, padx=50, pady=20)
         
-        study_content = StudyContent().get_content(topic_num)
+        study_content = self._study_content.get_content(topic_num)
         
+        # Only the study screen uses ScrolledText
+        from tkinter import scrolledtext
         text_widget = scrolledtext.ScrolledText(content_frame, wrap=tk.WORD, 
                                                font=('Arial', 12), bg=self.theme_colors['card_bg'], 
                                                fg=self.theme_colors['text'], padx=20, pady=20)
@@ -1593,7 +2052,7 @@ class AILearningApp:
     
     def start_topic_quiz(self, topic_num):
         """Start a quiz for a specific topic"""
-        questions = [q for q in self.questions_db if q['topic'] == topic_num]
+        questions = self.question_database.get_topic(topic_num)
         if not questions:
             messagebox.showinfo("No Questions", "No questions available for this topic yet.")
             return
@@ -1602,7 +2061,7 @@ class AILearningApp:
     
     def start_topic_test(self, topic_num):
         """Start a test for a specific topic"""
-        questions = [q for q in self.questions_db if q['topic'] == topic_num]
+        questions = self.question_database.get_topic(topic_num)
         if not questions:
             messagebox.showinfo("No Questions", "No questions available for this topic yet.")
             return
@@ -1615,8 +2074,8 @@ class AILearningApp:
             messagebox.showinfo("No Questions", "Question database is empty.")
             return
         
-        random.shuffle(self.questions_db)
-        self.start_quiz(self.questions_db[:15], "Random Quiz Game", None)
+        questions = random.sample(self.questions_db, min(15, len(self.questions_db)))
+        self.start_quiz(questions, "Random Quiz Game", None)
     
     def start_quiz(self, questions, title, topic_num, is_test=False, is_daily_challenge=False,
                    is_review=False, is_placement=False, time_limit=None, difficulty_mode='normal',
@@ -1626,11 +2085,12 @@ class AILearningApp:
             messagebox.showinfo("Error", "No questions available.")
             return
         
-        self.clear_window()
         self.current_questions = questions
+        self._correct_answers = [q['correct'] for q in questions]
         self.current_question_index = 0
-        self.quiz_answers = []
-        self.quiz_confidences = []  # Track confidence for each answer
+        # One slot per question; None marks an unanswered question
+        self.quiz_answers = [None] * len(questions)
+        self.quiz_confidences = ['medium'] * len(questions)  # Track confidence for each answer
         self.quiz_title = title
         self.quiz_topic = topic_num
         self.is_test = is_test
@@ -1640,49 +2100,61 @@ class AILearningApp:
         self.time_limit = time_limit
         self.difficulty_mode = difficulty_mode
         self.short_answer_mode = short_answer_mode
-        self.start_time = datetime.now()
+        self.start_time = time.monotonic()
         self.time_remaining = time_limit
         
+        self._build_quiz_ui()
+        
         # Start timer if time limit set
+        self._cancel_timer()
         if time_limit:
+            self._deadline = self.start_time + time_limit
             self.update_timer()
         
-        self.show_question()
+        self._render_question()
     
     def update_timer(self):
         """Update countdown timer for timed quizzes"""
-        if not hasattr(self, 'time_remaining') or self.time_remaining is None:
+        self._timer_job = None
+        if self._deadline is None:
             return
         
-        elapsed = (datetime.now() - self.start_time).total_seconds()
-        self.time_remaining = max(0, self.time_limit - int(elapsed))
+        left = self._deadline - time.monotonic()
+        self.time_remaining = max(0, math.ceil(left))
         
         if self.time_remaining <= 0:
             # Time's up - auto submit
+            self._deadline = None
             messagebox.showinfo("Time's Up!", "The time limit has been reached.")
             self.finish_quiz()
             return
         
-        # Schedule next update
-        if hasattr(self, 'timer_label') and self.timer_label.winfo_exists():
+        # Schedule next update for when the displayed second changes
+        if self.timer_label is not None and self.timer_label.winfo_exists():
             mins = self.time_remaining // 60
             secs = self.time_remaining % 60
             self.timer_label.config(text=f"⏱️ {mins}:{secs:02d}")
-            self.root.after(1000, self.update_timer)
+            delay = int((left - (self.time_remaining - 1)) * 1000) + 1
+            self._timer_job = self.root.after(delay, self.update_timer)
     
-    def show_question(self):
-        """Display current question with timer and confidence rating"""
+    def _cancel_timer(self):
+        """Stop the quiz countdown, if one is running"""
+        self._deadline = None
+        if self._timer_job is not None:
+            self.root.after_cancel(self._timer_job)
+            self._timer_job = None
+    
+    def _build_quiz_ui(self):
+        """Build the quiz screen once per quiz; _render_question fills it in per question"""
         self.clear_window()
-        self.root.configure(bg=self.theme_colors['bg'])
-        
-        if self.current_question_index >= len(self.current_questions):
-            self.finish_quiz()
-            return
-        
-        question = self.current_questions[self.current_question_index]
+        colors = self.theme_colors
+        bg = colors['bg']
+        text_secondary = colors['text_secondary']
+        card_bg = colors['card_bg']
+        self._screen.configure(bg=bg)
         
         # Header with Tarleton purple
-        header_frame = tk.Frame(self.root, bg=self.TARLETON_PURPLE, height=90)
+        header_frame = tk.Frame(self._screen, bg=self.TARLETON_PURPLE, height=90)
         header_frame.pack(fill=tk.X)
         header_frame.pack_propagate(False)
         
@@ -1694,159 +2166,176 @@ class AILearningApp:
                 bg=self.TARLETON_PURPLE, fg='#e8e8e8').pack(side=tk.LEFT)
         
         # Right: Timer (if applicable)
-        if hasattr(self, 'time_limit') and self.time_limit:
+        self.timer_label = None
+        if self.time_limit:
             self.timer_label = tk.Label(header_inner, text="⏱️ --:--", 
                                        font=('Arial', 14, 'bold'),
                                        bg=self.TARLETON_PURPLE, fg='#FFD700')
             self.timer_label.pack(side=tk.RIGHT)
-            self.update_timer()
         
         # Progress
         progress_row = tk.Frame(header_frame, bg=self.TARLETON_PURPLE)
         progress_row.pack(fill=tk.X, padx=20)
         
-        progress_text = f"Question {self.current_question_index + 1} of {len(self.current_questions)}"
-        tk.Label(progress_row, text=progress_text, font=('Arial', 12, 'bold'),
-                bg=self.TARLETON_PURPLE, fg='white').pack(side=tk.LEFT)
+        self._quiz_progress_label = tk.Label(progress_row, font=('Arial', 12, 'bold'),
+                                             bg=self.TARLETON_PURPLE, fg='white')
+        self._quiz_progress_label.pack(side=tk.LEFT)
         
-        progress_bar = ttk.Progressbar(progress_row, length=300, mode='determinate',
-                                       maximum=len(self.current_questions))
-        progress_bar['value'] = self.current_question_index + 1
-        progress_bar.pack(side=tk.RIGHT, pady=5)
+        self._quiz_progress_bar = ttk.Progressbar(progress_row, length=300, mode='determinate',
+                                                  maximum=len(self.current_questions))
+        self._quiz_progress_bar.pack(side=tk.RIGHT, pady=5)
         
         # Question content
-        content_frame = tk.Frame(self.root, bg=self.theme_colors['bg'])
+        content_frame = tk.Frame(self._screen, bg=bg)
         content_frame.pack(fill=tk.BOTH, expand=True, padx=50, pady=20)
         
         # Topic indicator
-        topic_num = question.get('topic', 'N/A')
-        topic_name = self.topics.get(topic_num, {}).get('name', 'Unknown')
-        tk.Label(content_frame, text=f"📚 Topic {topic_num}: {topic_name}", 
-                font=('Arial', 10),
-                bg=self.theme_colors['bg'], fg=self.theme_colors['text_secondary']).pack(anchor='w')
+        self._quiz_topic_label = tk.Label(content_frame, font=('Arial', 10),
+                                          bg=bg, fg=text_secondary)
+        self._quiz_topic_label.pack(anchor='w')
         
         # Question text
-        question_frame = tk.Frame(content_frame, bg=self.theme_colors['card_bg'], 
+        question_frame = tk.Frame(content_frame, bg=card_bg, 
                                  highlightbackground=self.TARLETON_PURPLE, highlightthickness=3)
         question_frame.pack(fill=tk.X, pady=10)
         
-        q_text = tk.Label(question_frame, text=question['question'], 
-                         font=('Arial', 15, 'bold'), bg=self.theme_colors['card_bg'], 
-                         fg=self.TARLETON_PURPLE, wraplength=800, justify=tk.LEFT, padx=20, pady=15)
-        q_text.pack(anchor='w')
+        self._quiz_question_label = tk.Label(question_frame, 
+                                             font=('Arial', 15, 'bold'), bg=card_bg, 
+                                             fg=self.TARLETON_PURPLE, wraplength=800, justify=tk.LEFT,
+                                             padx=20, pady=15)
+        self._quiz_question_label.pack(anchor='w')
         
         # Answer options (or short answer)
-        if hasattr(self, 'short_answer_mode') and self.short_answer_mode:
-            self._show_short_answer_input(content_frame, question)
+        if self.short_answer_mode:
+            self._build_short_answer_input(content_frame)
         else:
-            self._show_multiple_choice(content_frame, question)
+            self._build_multiple_choice(content_frame)
         
         # Confidence rating (enhanced spaced repetition)
-        confidence_frame = tk.Frame(content_frame, bg=self.theme_colors['bg'])
+        confidence_frame = tk.Frame(content_frame, bg=bg)
         confidence_frame.pack(fill=tk.X, pady=10)
         
         tk.Label(confidence_frame, text="How confident are you?", 
                 font=('Arial', 11),
-                bg=self.theme_colors['bg'], fg=self.theme_colors['text_secondary']).pack(side=tk.LEFT)
-        
-        self.confidence_var = tk.StringVar(value='medium')
+                bg=bg, fg=text_secondary).pack(side=tk.LEFT)
         
         for conf, label, color in [('low', '😟 Low', '#e74c3c'), 
                                    ('medium', '🤔 Medium', '#f39c12'), 
                                    ('high', '😊 High', '#27ae60')]:
             rb = tk.Radiobutton(confidence_frame, text=label, variable=self.confidence_var,
                                value=conf, font=('Arial', 10), 
-                               bg=self.theme_colors['bg'], fg=color,
-                               selectcolor=self.theme_colors['bg'])
+                               bg=bg, fg=color,
+                               selectcolor=bg)
             rb.pack(side=tk.LEFT, padx=10)
         
         # Navigation buttons
-        nav_frame = tk.Frame(content_frame, bg=self.theme_colors['bg'])
+        nav_frame = tk.Frame(content_frame, bg=bg)
         nav_frame.pack(fill=tk.X, pady=15)
         
-        if self.current_question_index > 0:
-            tk.Button(nav_frame, text="← Previous", 
-                     command=self.previous_question,
-                     bg='#7f8c8d', fg='white', font=('Arial', 12), width=15,
-                     relief=tk.FLAT, cursor='hand2').pack(side=tk.LEFT, padx=10)
+        # Shown from the second question on (see _render_question)
+        self._quiz_prev_btn = tk.Button(nav_frame, text="← Previous", 
+                                        command=self.previous_question,
+                                        bg='#7f8c8d', fg='white', font=('Arial', 12), width=15,
+                                        relief=tk.FLAT, cursor='hand2')
+        
+        self._quiz_next_btn = tk.Button(nav_frame, 
+                                        command=self.next_question,
+                                        bg=self.TARLETON_PURPLE, fg='white', font=('Arial', 12, 'bold'),
+                                        width=15, relief=tk.FLAT, cursor='hand2')
+        self._quiz_next_btn.pack(side=tk.RIGHT, padx=10)
+    
+    def _render_question(self):
+        """Show the current question in the quiz screen built by _build_quiz_ui"""
+        if self.current_question_index >= len(self.current_questions):
+            self.finish_quiz()
+            return
         
-        btn_text = "Finish" if self.current_question_index == len(self.current_questions) - 1 else "Next →"
-        tk.Button(nav_frame, text=btn_text, 
-                 command=self.next_question,
-                 bg=self.TARLETON_PURPLE, fg='white', font=('Arial', 12, 'bold'), width=15,
-                 relief=tk.FLAT, cursor='hand2').pack(side=tk.RIGHT, padx=10)
+        index = self.current_question_index
+        count = len(self.current_questions)
+        question = self.current_questions[index]
+        
+        self._quiz_progress_label.config(text=f"Question {index + 1} of {count}")
+        self._quiz_progress_bar['value'] = index + 1
+        
+        topic_num = question.get('topic', 'N/A')
+        topic_name = self.topics.get(topic_num, {}).get('name', 'Unknown')
+        self._quiz_topic_label.config(text=f"📚 Topic {topic_num}: {topic_name}")
+        self._quiz_question_label.config(text=question['question'])
+        
+        # Saved answer and confidence when revisiting a question, else a blank slate
+        self.selected_answer.set(self.quiz_answers[index] or '')
+        self.confidence_var.set(self.quiz_confidences[index])
+        if self.short_answer_mode:
+            self._quiz_hint_label.config(text=f"Hint: {question['_hint']}")
+            self._quiz_answer_entry.focus()
+        else:
+            for rb, option in zip(self._quiz_option_rbs, question['options']):
+                rb.config(text=option, value=option)
+        
+        if index > 0:
+            self._quiz_prev_btn.pack(side=tk.LEFT, padx=10)
+        else:
+            self._quiz_prev_btn.pack_forget()
+        self._quiz_next_btn.config(text="Finish" if index == count - 1 else "Next →")
         
         # Store correct answer for later
         self.current_correct = question['correct']
     
-    def _show_multiple_choice(self, parent, question):
-        """Display multiple choice options"""
-        options_frame = tk.Frame(parent, bg=self.theme_colors['bg'])
+    def _build_multiple_choice(self, parent):
+        """Create the multiple choice option rows, filled in by _render_question"""
+        colors = self.theme_colors
+        bg = colors['bg']
+        card_bg = colors['card_bg']
+        text = colors['text']
+        options_frame = tk.Frame(parent, bg=bg)
         options_frame.pack(fill=tk.BOTH, expand=True, pady=10)
         
-        self.selected_answer = tk.StringVar()
-        options = question['options']
-        
-        option_colors = ['#e8f4f8', '#f8f4e8', '#f4f8e8', '#f8e8f4']
-        for i, option in enumerate(options):
-            opt_bg = option_colors[i % len(option_colors)] if not self.dark_mode else self.theme_colors['card_bg']
+        # Every question in the bank has four options
+        option_colors = self._OPTION_COLORS if not self.dark_mode else (card_bg,) * 4
+        self._quiz_option_rbs = []
+        for opt_bg in option_colors:
             option_frame = tk.Frame(options_frame, bg=opt_bg, 
                                    highlightbackground=self.TARLETON_PURPLE, highlightthickness=1)
             option_frame.pack(fill=tk.X, pady=4)
             
-            rb = tk.Radiobutton(option_frame, text=option, variable=self.selected_answer,
-                               value=option, font=('Arial', 12), bg=opt_bg, 
-                               fg=self.theme_colors['text'],
+            rb = tk.Radiobutton(option_frame, variable=self.selected_answer,
+                               font=('Arial', 12), bg=opt_bg, 
+                               fg=text,
                                selectcolor=self.TARLETON_PURPLE_LIGHT, 
                                activebackground=self.TARLETON_PURPLE_LIGHT,
                                padx=20, pady=10, anchor='w', cursor='hand2')
             rb.pack(fill=tk.X)
+            self._quiz_option_rbs.append(rb)
     
-    def _show_short_answer_input(self, parent, question):
-        """Display short answer input field"""
-        self.selected_answer = tk.StringVar()
-        
+    def _build_short_answer_input(self, parent):
+        """Create the short answer field and hint label, filled in by _render_question"""
+        colors = self.theme_colors
+        bg = colors['bg']
+        text_secondary = colors['text_secondary']
+        text = colors['text']
         tk.Label(parent, text="Type your answer:", 
                 font=('Arial', 12),
-                bg=self.theme_colors['bg'], fg=self.theme_colors['text']).pack(anchor='w', pady=5)
+                bg=bg, fg=text).pack(anchor='w', pady=5)
         
-        answer_entry = tk.Entry(parent, textvariable=self.selected_answer,
-                               font=('Arial', 14), width=50)
-        answer_entry.pack(anchor='w', pady=10)
-        answer_entry.focus()
+        self._quiz_answer_entry = tk.Entry(parent, textvariable=self.selected_answer,
+                                           font=('Arial', 14), width=50)
+        self._quiz_answer_entry.pack(anchor='w', pady=10)
         
-        # Show hint (first letters of correct answer words)
-        correct = question['correct']
-        hint = ' '.join([w[0] + '_' * (len(w)-1) for w in correct.split()[:5]])
-        tk.Label(parent, text=f"Hint: {hint}", 
-                font=('Arial', 10),
-                bg=self.theme_colors['bg'], fg=self.theme_colors['text_secondary']).pack(anchor='w')
+        self._quiz_hint_label = tk.Label(parent, font=('Arial', 10),
+                                         bg=bg, fg=text_secondary)
+        self._quiz_hint_label.pack(anchor='w')
     
     def previous_question(self):
         """Go to previous question"""
         if self.current_question_index > 0:
             # Save current answer and confidence
-            if self.selected_answer.get():
-                if self.current_question_index < len(self.quiz_answers):
-                    self.quiz_answers[self.current_question_index] = self.selected_answer.get()
-                else:
-                    self.quiz_answers.append(self.selected_answer.get())
-                
-                # Save confidence
-                confidence = self.confidence_var.get() if hasattr(self, 'confidence_var') else 'medium'
-                if self.current_question_index < len(self.quiz_confidences):
-                    self.quiz_confidences[self.current_question_index] = confidence
-                else:
-                    self.quiz_confidences.append(confidence)
+            answer = self.selected_answer.get()
+            if answer:
+                self.quiz_answers[self.current_question_index] = answer
+                self.quiz_confidences[self.current_question_index] = self.confidence_var.get()
             
             self.current_question_index -= 1
-            self.show_question()
-            
-            # Restore previous answer and confidence if exists
-            if self.current_question_index < len(self.quiz_answers):
-                self.selected_answer.set(self.quiz_answers[self.current_question_index])
-            if self.current_question_index < len(self.quiz_confidences):
-                self.confidence_var.set(self.quiz_confidences[self.current_question_index])
+            self._render_question()
     
     def next_question(self):
         """Go to next question with confidence tracking"""
@@ -1854,71 +2343,61 @@ class AILearningApp:
             messagebox.showwarning("No Answer", "Please select an answer before continuing.")
             return
         
-        # Save answer
-        if self.current_question_index < len(self.quiz_answers):
-            self.quiz_answers[self.current_question_index] = self.selected_answer.get()
-        else:
-            self.quiz_answers.append(self.selected_answer.get())
-        
-        # Save confidence
-        confidence = self.confidence_var.get() if hasattr(self, 'confidence_var') else 'medium'
-        if self.current_question_index < len(self.quiz_confidences):
-            self.quiz_confidences[self.current_question_index] = confidence
-        else:
-            self.quiz_confidences.append(confidence)
+        # Save answer and confidence
+        self.quiz_answers[self.current_question_index] = self.selected_answer.get()
+        self.quiz_confidences[self.current_question_index] = self.confidence_var.get()
         
         self.current_question_index += 1
-        self.show_question()
-        
-        # Restore answer if exists
-        if self.current_question_index < len(self.quiz_answers):
-            self.selected_answer.set(self.quiz_answers[self.current_question_index])
+        self._render_question()
     
     def finish_quiz(self):
         """Calculate and display quiz results with enhanced feedback"""
+        self._cancel_timer()
         self.clear_window()
         
-        # Calculate score
-        correct = 0
+        # Calculate score in one pass; unanswered questions count as wrong
         total = len(self.current_questions)
-        
-        for i, question in enumerate(self.current_questions):
-            user_answer = self.quiz_answers[i] if i < len(self.quiz_answers) else None
-            is_correct = user_answer == question['correct']
-            if is_correct:
-                correct += 1
+        correct = 0
+        cards = []  # (question, answer, is_correct) rows for the review pane below
+        
+        topic_total = self.topic_total
+        topic_correct = self.topic_correct
+        now = int(time.time())  # One timestamp for the whole quiz
+        for question, answer, correct_answer, confidence in zip(
+                self.current_questions, self.quiz_answers, self._correct_answers, self.quiz_confidences):
+            is_correct = answer == correct_answer
+            correct += is_correct
+            cards.append((question, answer, is_correct))
             
             # Update per-question memory strength
-            confidence = self.quiz_confidences[i] if i < len(self.quiz_confidences) else 'medium'
-            self.update_question_memory(question, is_correct, confidence)
+            self.update_question_memory(question, is_correct, confidence, now)
             
-            # Update topic accuracy
-            topic_num = str(question.get('topic', 0))
-            if topic_num not in self.topic_accuracy:
-                self.topic_accuracy[topic_num] = {'correct': 0, 'total': 0}
-            self.topic_accuracy[topic_num]['total'] += 1
-            if is_correct:
-                self.topic_accuracy[topic_num]['correct'] += 1
+            # Update topic accuracy (the per-topic lists are indexed by topic number)
+            topic_num = question.get('topic', 0)
+            topic_total[topic_num] += 1
+            topic_correct[topic_num] += is_correct
+        self._weakest_topic = None
+        self._dash_ver += 1
         
         score_percent = (correct / total) * 100 if total > 0 else 0
-        time_taken = (datetime.now() - self.start_time).total_seconds()
+        time_taken = time.monotonic() - self.start_time
         
         # Update statistics
         self.total_questions_answered += total
         self.correct_answers += correct
+        self._update_accuracy()
         self.total_time_spent += time_taken  # Track total study time
         
-        # Update personal bests
-        if score_percent > self.personal_bests.get('best_accuracy', 0):
-            self.personal_bests['best_accuracy'] = score_percent
-        if score_percent > self.personal_bests.get('highest_single_quiz', 0):
-            self.personal_bests['highest_single_quiz'] = score_percent
-        if time_taken < self.personal_bests.get('fastest_quiz', float('inf')) and score_percent >= 70:
-            self.personal_bests['fastest_quiz'] = time_taken
+        # Update personal bests (best_accuracy always tracked the same best quiz score)
+        personal_bests = self.personal_bests
+        best_score = max(personal_bests.get('highest_single_quiz', 0), score_percent)
+        personal_bests['highest_single_quiz'] = personal_bests['best_accuracy'] = best_score
+        if score_percent >= 70 and time_taken < personal_bests.get('fastest_quiz', float('inf')):
+            personal_bests['fastest_quiz'] = time_taken
         
         # Update quest progress
         self.update_quest_progress('quiz', total)  # Progress on quiz quests
-        if hasattr(self, 'is_review') and self.is_review:
+        if self.is_review:
             self.update_quest_progress('review', 1)
         if score_percent >= 70:
             self.update_quest_progress('mastery', 1)  # Weekly mastery challenge
@@ -1929,9 +2408,9 @@ class AILearningApp:
         
         # Add XP based on performance
         xp_earned = int(score_percent / 10) + 5  # Base 5 XP + bonus
-        if hasattr(self, 'is_daily_challenge') and self.is_daily_challenge:
+        if self.is_daily_challenge:
             xp_earned += 10  # Bonus for daily challenge
-            self.daily_challenge_completed = datetime.now().date().isoformat()
+            self.daily_challenge_completed = self._today_iso()
         self.add_xp(xp_earned)
         self.update_streak()
         
@@ -1944,51 +2423,63 @@ class AILearningApp:
             self.update_spaced_repetition(self.quiz_topic, score_percent / 100)
         
         # Unlock achievements
-        if score_percent == 100:
-            self.unlock_achievement("Perfect Score!")
-        elif score_percent >= 90:
-            self.unlock_achievement("Excellent Performance!")
-        if self.total_questions_answered >= 100:
-            self.unlock_achievement("Century Club: 100 Questions!")
-        if self.streak >= 7:
-            self.unlock_achievement("7 Day Streak!")
+        for earned, achievement_name in self._QUIZ_ACHIEVEMENTS:
+            if earned(self, score_percent):
+                self.unlock_achievement(achievement_name)
         
+        # Write a finished quiz right away instead of waiting for the debounce timer
         self.save_data()
-        self.root.configure(bg=self.theme_colors['bg'])
+        self._flush()
+        
+        colors = self.theme_colors
+        bg = colors['bg']
+        text_secondary = colors['text_secondary']
+        accent = colors['accent']
+        card_bg = colors['card_bg']
+        text = colors['text']
+        self._screen.configure(bg=bg)
         
         # Results display
-        header = tk.Label(self.root, text="🎉 Quiz Complete!", 
-                         font=('Georgia', 24, 'bold'), bg=self.theme_colors['bg'], 
+        header = tk.Label(self._screen, text="🎉 Quiz Complete!", 
+                         font=('Georgia', 24, 'bold'), bg=bg, 
                          fg=self.TARLETON_PURPLE)
         header.pack(pady=15)
         
-        # Main results area - scrollable
-        main_canvas = tk.Canvas(self.root, bg=self.theme_colors['bg'], highlightthickness=0)
-        scrollbar = ttk.Scrollbar(self.root, orient="vertical", command=main_canvas.yview)
-        results_frame = tk.Frame(main_canvas, bg=self.theme_colors['bg'])
+        # Action buttons (packed first so they stay visible below the review list)
+        btn_frame = tk.Frame(self._screen, bg=bg)
+        btn_frame.pack(side=tk.BOTTOM, fill=tk.X, pady=15, padx=50)
         
-        results_frame.bind("<Configure>", lambda e: main_canvas.configure(scrollregion=main_canvas.bbox("all")))
-        main_canvas.create_window((0, 0), window=results_frame, anchor="nw")
-        main_canvas.configure(yscrollcommand=scrollbar.set)
+        tk.Button(btn_frame, text="🔄 Retake Quiz", 
+                 command=lambda: self.start_quiz(self.current_questions, self.quiz_title, self.quiz_topic, self.is_test),
+                 bg='#3498db', fg='white', font=('Arial', 11), width=14,
+                 relief=tk.FLAT, cursor='hand2').pack(side=tk.LEFT, padx=5)
         
-        main_canvas.pack(side="left", fill="both", expand=True, padx=30, pady=5)
-        scrollbar.pack(side="right", fill="y")
+        if len(self.review_queue) > 0:
+            tk.Button(btn_frame, text=f"📋 Review Queue ({len(self.review_queue)})", 
+                     command=self.start_review_queue,
+                     bg='#f39c12', fg='white', font=('Arial', 11), width=18,
+                     relief=tk.FLAT, cursor='hand2').pack(side=tk.LEFT, padx=5)
+        
+        tk.Button(btn_frame, text="🏠 Main Menu", 
+                 command=self.show_main_menu,
+                 bg=self.TARLETON_PURPLE, fg='white', font=('Arial', 11), width=14,
+                 relief=tk.FLAT, cursor='hand2').pack(side=tk.RIGHT, padx=5)
         
         # Score card
-        score_frame = tk.Frame(results_frame, bg=self.theme_colors['card_bg'], 
+        score_frame = tk.Frame(self._screen, bg=card_bg, 
                               highlightbackground=self.TARLETON_PURPLE, highlightthickness=3)
-        score_frame.pack(fill=tk.X, pady=10, padx=20)
+        score_frame.pack(fill=tk.X, pady=10, padx=50)
         
-        score_inner = tk.Frame(score_frame, bg=self.theme_colors['card_bg'])
+        score_inner = tk.Frame(score_frame, bg=card_bg)
         score_inner.pack(fill=tk.X, padx=20, pady=15)
         
         # Score display
         score_text = f"Score: {correct}/{total} ({score_percent:.0f}%)"
         tk.Label(score_inner, text=score_text, font=('Arial', 22, 'bold'),
-                bg=self.theme_colors['card_bg'], fg=self.TARLETON_PURPLE).pack()
+                bg=card_bg, fg=self.TARLETON_PURPLE).pack()
         
         # Stats row
-        stats_row = tk.Frame(score_inner, bg=self.theme_colors['card_bg'])
+        stats_row = tk.Frame(score_inner, bg=card_bg)
         stats_row.pack(fill=tk.X, pady=10)
         
         time_mins = int(time_taken // 60)
@@ -1999,12 +2490,12 @@ class AILearningApp:
             (f"🔥 {self.streak} days", "Streak")
         ]
         for value, label in stats_data:
-            stat_frame = tk.Frame(stats_row, bg=self.theme_colors['card_bg'])
+            stat_frame = tk.Frame(stats_row, bg=card_bg)
             stat_frame.pack(side=tk.LEFT, padx=20)
             tk.Label(stat_frame, text=value, font=('Arial', 14, 'bold'),
-                    bg=self.theme_colors['card_bg'], fg=self.theme_colors['accent']).pack()
+                    bg=card_bg, fg=accent).pack()
             tk.Label(stat_frame, text=label, font=('Arial', 9),
-                    bg=self.theme_colors['card_bg'], fg=self.theme_colors['text_secondary']).pack()
+                    bg=card_bg, fg=text_secondary).pack()
         
         # Performance message
         if score_percent >= 90:
@@ -2021,102 +2512,103 @@ class AILearningApp:
             color = '#e74c3c'
         
         tk.Label(score_inner, text=message, font=('Arial', 14),
-                bg=self.theme_colors['card_bg'], fg=color).pack(pady=5)
+                bg=card_bg, fg=color).pack(pady=5)
         
         # Enhanced Review - with explanations
-        review_label = tk.Label(results_frame, text="📝 Review Your Answers (Learn from mistakes!)", 
+        review_label = tk.Label(self._screen, text="📝 Review Your Answers (Learn from mistakes!)", 
                                font=('Arial', 14, 'bold'),
-                               bg=self.theme_colors['bg'], fg=self.theme_colors['text'])
-        review_label.pack(anchor='w', padx=20, pady=(15, 5))
+                               bg=bg, fg=text)
+        review_label.pack(anchor='w', padx=50, pady=(15, 5))
+        
+        # One Text widget holds every answer card; tags do the per-card styling
+        review_frame = tk.Frame(self._screen, bg=bg)
+        review_frame.pack(fill=tk.BOTH, expand=True, padx=50, pady=5)
+        
+        review = tk.Text(review_frame, wrap=tk.WORD, font=('Arial', 11), cursor='arrow',
+                         bg=bg, fg=text,
+                         relief=tk.FLAT, bd=0, highlightthickness=0, padx=0, pady=0)
+        scrollbar = ttk.Scrollbar(review_frame, orient="vertical", command=review.yview)
+        review.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side="right", fill="y")
+        review.pack(side="left", fill="both", expand=True)
         
-        for i, question in enumerate(self.current_questions):
-            user_answer = self.quiz_answers[i] if i < len(self.quiz_answers) else "No answer"
-            is_correct = user_answer == question['correct']
-            
-            bg_color = '#e8f8e8' if is_correct else '#fff0f0'
-            if self.dark_mode:
-                bg_color = '#2d4a3d' if is_correct else '#4a2d2d'
-            
-            q_frame = tk.Frame(results_frame, bg=bg_color, relief=tk.FLAT,
-                              highlightbackground='#27ae60' if is_correct else '#e74c3c', 
-                              highlightthickness=2)
-            q_frame.pack(fill=tk.X, padx=20, pady=5)
-            
-            inner = tk.Frame(q_frame, bg=bg_color)
-            inner.pack(fill=tk.X, padx=15, pady=10)
-            
-            # Header row
-            header_row = tk.Frame(inner, bg=bg_color)
-            header_row.pack(fill=tk.X)
-            
+        if self.dark_mode:
+            ok_bg, bad_bg, exp_bg, exp_fg = '#2d4a3d', '#4a2d2d', '#3d3d00', '#fff'
+        else:
+            ok_bg, bad_bg, exp_bg, exp_fg = '#e8f8e8', '#fff0f0', '#fffde7', '#333'
+        review.tag_configure('ok', background=ok_bg, lmargin1=15, lmargin2=15, rmargin=15)
+        review.tag_configure('bad', background=bad_bg, lmargin1=15, lmargin2=15, rmargin=15)
+        review.tag_configure('first', spacing1=10)
+        review.tag_configure('last', spacing3=10)
+        review.tag_configure('status_ok', font=('Arial', 11, 'bold'), foreground='#27ae60')
+        review.tag_configure('status_bad', font=('Arial', 11, 'bold'), foreground='#e74c3c')
+        review.tag_configure('topic', font=('Arial', 9), foreground=text_secondary)
+        review.tag_configure('question', spacing1=5, spacing3=5)
+        review.tag_configure('answer_ok', font=('Arial', 10), foreground='#27ae60')
+        review.tag_configure('answer_bad', font=('Arial', 10), foreground='#e74c3c')
+        review.tag_configure('correct', font=('Arial', 10, 'bold'), foreground='#27ae60', spacing1=2)
+        review.tag_configure('explanation', font=('Arial', 10), background=exp_bg, foreground=exp_fg,
+                             lmargin1=25, lmargin2=25, rmargin=25, spacing1=5, spacing3=5)
+        review.tag_configure('queued', font=('Arial', 9), foreground='#f39c12', spacing1=5)
+        review.tag_configure('gap', font=('Arial', 4))
+        
+        review.configure(state=tk.DISABLED)
+        
+        # Fill in the cards a few at a time so the score card paints before the whole review is built
+        self._insert_review_cards(review, cards, 0)
+    
+    def _insert_review_cards(self, review, cards, start):
+        """Append one batch of answer cards to the review Text, then schedule the next batch"""
+        if not review.winfo_exists():
+            return  # Left the results screen before the review finished filling in
+        end = min(start + self._REVIEW_CARDS_PER_PASS, len(cards))
+        review.configure(state=tk.NORMAL)
+        for i in range(start, end):
+            question, user_answer, is_correct = cards[i]
+            user_answer = user_answer or "No answer"
+            card = 'ok' if is_correct else 'bad'
             status = "✓ Correct" if is_correct else "✗ Incorrect"
-            status_color = '#27ae60' if is_correct else '#e74c3c'
-            
-            tk.Label(header_row, text=f"Q{i+1}: {status}", font=('Arial', 11, 'bold'),
-                    bg=bg_color, fg=status_color).pack(side=tk.LEFT)
-            
+            # A correct card ends at the answer line; a wrong one goes on with the correction
+            answer_tags = (card, 'answer_' + card, 'last') if is_correct else (card, 'answer_' + card)
             topic_num = question.get('topic', 'N/A')
-            tk.Label(header_row, text=f"Topic {topic_num}", font=('Arial', 9),
-                    bg=bg_color, fg=self.theme_colors['text_secondary']).pack(side=tk.RIGHT)
-            
-            # Question text
-            tk.Label(inner, text=question['question'], font=('Arial', 11),
-                    bg=bg_color, fg=self.theme_colors['text'], 
-                    wraplength=650, justify=tk.LEFT).pack(anchor='w', pady=5)
             
-            # Your answer
-            tk.Label(inner, text=f"Your answer: {user_answer}", font=('Arial', 10),
-                    bg=bg_color, fg='#27ae60' if is_correct else '#e74c3c').pack(anchor='w')
+            review.insert('end',
+                          f"Q{i+1}: {status}", (card, 'first', 'status_' + card),
+                          f"    Topic {topic_num}\n", (card, 'first', 'topic'),
+                          f"{question['question']}\n", (card, 'question'),
+                          f"Your answer: {user_answer}\n", answer_tags)
             
             if not is_correct:
-                # Correct answer
-                tk.Label(inner, text=f"✓ Correct answer: {question['correct']}", 
-                        font=('Arial', 10, 'bold'), bg=bg_color, fg='#27ae60').pack(anchor='w', pady=2)
+                review.insert('end', f"✓ Correct answer: {question['correct']}\n", (card, 'correct'))
                 
-                # Explanation (if available in question)
-                explanation = question.get('explanation', self._generate_explanation(question))
+                # Explanation (if available in question); only generate a fallback when it isn't
+                explanation = question.get('explanation') or self._generate_explanation(question)
                 if explanation:
-                    exp_frame = tk.Frame(inner, bg='#fffde7' if not self.dark_mode else '#3d3d00')
-                    exp_frame.pack(fill=tk.X, pady=5)
-                    tk.Label(exp_frame, text=f"💡 {explanation}", font=('Arial', 10),
-                            bg='#fffde7' if not self.dark_mode else '#3d3d00', 
-                            fg='#333' if not self.dark_mode else '#fff',
-                            wraplength=620, justify=tk.LEFT).pack(padx=10, pady=5, anchor='w')
-                
-                # Add to Review Queue button
-                btn_frame = tk.Frame(inner, bg=bg_color)
-                btn_frame.pack(anchor='w', pady=5)
+                    review.insert('end', f"💡 {explanation}\n", (card, 'explanation'))
                 
+                # Add to Review Queue button, created only once the card scrolls into view
                 q_id = self.get_question_id(question)
-                if q_id not in self.review_queue:
-                    add_btn = tk.Button(btn_frame, text="📋 Add to Review Queue", 
-                                       command=lambda qid=q_id: self._add_to_review(qid),
-                                       bg='#f39c12', fg='white', font=('Arial', 9),
-                                       relief=tk.FLAT, cursor='hand2')
-                    add_btn.pack(side=tk.LEFT)
+                if q_id not in self._review_set:
+                    review.insert('end', " ", (card, 'queued'))
+                    review.window_create('end', pady=5,
+                                         create=functools.partial(self._make_review_button, review, q_id))
+                    review.insert('end', "\n", (card, 'last'))
                 else:
-                    tk.Label(btn_frame, text="✓ In Review Queue", font=('Arial', 9),
-                            bg=bg_color, fg='#f39c12').pack(side=tk.LEFT)
-        
-        # Action buttons
-        btn_frame = tk.Frame(results_frame, bg=self.theme_colors['bg'])
-        btn_frame.pack(fill=tk.X, pady=20, padx=20)
-        
-        tk.Button(btn_frame, text="🔄 Retake Quiz", 
-                 command=lambda: self.start_quiz(self.current_questions, self.quiz_title, self.quiz_topic, self.is_test),
-                 bg='#3498db', fg='white', font=('Arial', 11), width=14,
-                 relief=tk.FLAT, cursor='hand2').pack(side=tk.LEFT, padx=5)
-        
-        if len(self.review_queue) > 0:
-            tk.Button(btn_frame, text=f"📋 Review Queue ({len(self.review_queue)})", 
-                     command=self.start_review_queue,
-                     bg='#f39c12', fg='white', font=('Arial', 11), width=18,
-                     relief=tk.FLAT, cursor='hand2').pack(side=tk.LEFT, padx=5)
+                    review.insert('end', "✓ In Review Queue\n", (card, 'queued', 'last'))
+            
+            review.insert('end', "\n", 'gap')
+        review.configure(state=tk.DISABLED)
         
-        tk.Button(btn_frame, text="🏠 Main Menu", 
-                 command=self.show_main_menu,
-                 bg=self.TARLETON_PURPLE, fg='white', font=('Arial', 11), width=14,
-                 relief=tk.FLAT, cursor='hand2').pack(side=tk.RIGHT, padx=5)
+        if end < len(cards):
+            self.root.after_idle(self._insert_review_cards, review, cards, end)
+    
+    def _make_review_button(self, review, q_id):
+        """Create an answer card's "Add to Review Queue" button; returns its Tk path for window_create"""
+        add_btn = tk.Button(review, text="📋 Add to Review Queue", 
+                           command=functools.partial(self._add_to_review, q_id),
+                           bg='#f39c12', fg='white', font=('Arial', 9),
+                           relief=tk.FLAT, cursor='hand2')
+        return str(add_btn)
     
     def _generate_explanation(self, question):
         """Generate a simple explanation for why the correct answer is right"""
@@ -2126,8 +2618,7 @@ class AILearningApp:
     
     def _add_to_review(self, q_id):
         """Add question to review queue"""
-        if q_id not in self.review_queue:
-            self.review_queue.append(q_id)
+        if self._queue_for_review(q_id):
             self.save_data()
             messagebox.showinfo("Added!", "Question added to your review queue.")
     
@@ -2138,50 +2629,50 @@ class AILearningApp:
             return
         
         # Find questions matching review queue IDs
-        review_questions = []
-        for q in self.questions_db:
-            if self.get_question_id(q) in self.review_queue:
-                review_questions.append(q)
+        by_id = self.questions_by_id
+        review_questions = [by_id[q_id] for q_id in self.review_queue if q_id in by_id]
         
         if review_questions:
-            random.shuffle(review_questions)
-            self.start_quiz(review_questions[:10], "📋 Review Queue", None, is_review=True)
+            review_questions = random.sample(review_questions, min(10, len(review_questions)))
+            self.start_quiz(review_questions, "📋 Review Queue", None, is_review=True)
         else:
             self.review_queue = []
+            self._review_set.clear()
             self.save_data()
             messagebox.showinfo("Queue Cleared", "Review queue has been cleared.")
     
     def show_progress(self):
         """Display student progress"""
         self.clear_window()
-        self.root.configure(bg=self.theme_colors['bg'])
+        colors = self.theme_colors
+        bg = colors['bg']
+        card_bg = colors['card_bg']
+        self._screen.configure(bg=bg)
         
-        back_btn = tk.Button(self.root, text="← Back to Menu", command=self.show_main_menu,
+        back_btn = tk.Button(self._screen, text="← Back to Menu", command=self.show_main_menu,
                             bg=self.TARLETON_PURPLE, fg='white', font=('Arial', 12),
                             relief=tk.FLAT, cursor='hand2')
         back_btn.pack(anchor='nw', padx=10, pady=10)
         
-        header = tk.Label(self.root, text="📊 Your Progress", 
-                         font=('Georgia', 28, 'bold'), bg=self.theme_colors['bg'], 
+        header = tk.Label(self._screen, text="📊 Your Progress", 
+                         font=('Georgia', 28, 'bold'), bg=bg, 
                          fg=self.TARLETON_PURPLE)
         header.pack(pady=20)
         
-        content_frame = tk.Frame(self.root, bg=self.theme_colors['bg'])
+        content_frame = tk.Frame(self._screen, bg=bg)
         content_frame.pack(fill=tk.BOTH, expand=True, padx=50, pady=20)
         
         # Overall statistics
-        stats_frame = tk.Frame(content_frame, bg=self.theme_colors['card_bg'], relief=tk.FLAT, 
+        stats_frame = tk.Frame(content_frame, bg=card_bg, relief=tk.FLAT, 
                               highlightbackground=self.TARLETON_PURPLE, highlightthickness=2)
         stats_frame.pack(fill=tk.X, pady=20)
         
-        overall_accuracy = (self.correct_answers / self.total_questions_answered * 100) if self.total_questions_answered > 0 else 0
+        overall_accuracy = self._overall_accuracy
         
-        stats_text = f"""
-        Student: {self.student_name or 'Guest'}
-        Total Questions Answered: {self.total_questions_answered}
-        Correct Answers: {self.correct_answers}
-        Overall Accuracy: {overall_accuracy:.1f}%
-        """
+        stats_text = (f"Student: {self.student_name or 'Guest'}\n"
+                      f"Total Questions Answered: {self.total_questions_answered}\n"
+                      f"Correct Answers: {self.correct_answers}\n"
+                      f"Overall Accuracy: {overall_accuracy:.1f}%")
         
         tk.Label(stats_frame, text=stats_text, font=('Arial', 14),
                 bg='#f5f5f5', fg='#000000', justify=tk.LEFT).pack(padx=20, pady=20)
@@ -2193,49 +2684,66 @@ class AILearningApp:
         tk.Label(topics_frame, text="Topic Progress:", font=('Arial', 16, 'bold'),
                 bg='#ffffff', fg='#000000').pack(anchor='w', pady=10)
         
-        for topic_num, topic_info in self.topics.items():
-            progress = self.progress.get(topic_num, 0)
-            
-            topic_frame = tk.Frame(topics_frame, bg='#f5f5f5', relief=tk.RAISED, bd=2)
-            topic_frame.pack(fill=tk.X, pady=5)
-            
-            tk.Label(topic_frame, text=f"Topic {topic_num}: {topic_info['name']}",
-                    font=('Arial', 12), bg='#f5f5f5', fg='#000000',
-                    anchor='w').pack(fill=tk.X, padx=15, pady=10)
-            
-            progress_bar = ttk.Progressbar(topic_frame, length=400, mode='determinate')
-            progress_bar['value'] = progress
-            progress_bar.pack(padx=15, pady=5, fill=tk.X)
-            
-            tk.Label(topic_frame, text=f"{progress}%", font=('Arial', 10),
-                    bg='#f5f5f5', fg='#666666').pack(anchor='e', padx=15, pady=5)
+        # Draw every topic's bar on one canvas instead of a frame, two labels and a Progressbar per topic
+        row_height = 50
+        bars = tk.Canvas(topics_frame, height=len(self.topics) * row_height, bg='#ffffff',
+                        highlightthickness=0, bd=0)
+        bars.pack(fill=tk.X)
+        
+        rows = []  # (track, fill, percent label, y, progress) canvas items per topic
+        for i, (topic_num, topic_info) in enumerate(self.topics.items()):
+            progress = max(0, min(100, self.progress.get(topic_num, 0)))
+            y = i * row_height
+            bars.create_text(15, y + 12, text=f"Topic {topic_num}: {topic_info['name']}",
+                             font=('Arial', 12), fill='#000000', anchor='w')
+            track = bars.create_rectangle(15, y + 28, 415, y + 42, fill='#e0e0e0', width=0)
+            fill = bars.create_rectangle(15, y + 28, 15 + 4 * progress, y + 42,
+                                         fill=self.TARLETON_PURPLE, width=0)
+            label = bars.create_text(465, y + 35, text=f"{progress}%", font=('Arial', 10),
+                                     fill='#666666', anchor='e')
+            rows.append((track, fill, label, y, progress))
+        
+        def stretch_bars(event):
+            # Bars span the canvas width, leaving room for the percent label on the right
+            bar_right = max(event.width - 65, 115)
+            for track, fill, label, y, progress in rows:
+                bars.coords(track, 15, y + 28, bar_right, y + 42)
+                bars.coords(fill, 15, y + 28, 15 + (bar_right - 15) * progress / 100, y + 42)
+                bars.coords(label, event.width - 15, y + 35)
+        
+        bars.bind('<Configure>', stretch_bars)
     
     def show_leaderboard(self):
         """Display personal bests leaderboard (SDT: Competence)"""
         self.clear_window()
-        self.root.configure(bg=self.theme_colors['bg'])
+        colors = self.theme_colors
+        bg = colors['bg']
+        text_secondary = colors['text_secondary']
+        card_bg = colors['card_bg']
+        text = colors['text']
+        self._screen.configure(bg=bg)
         
-        back_btn = tk.Button(self.root, text="← Back to Menu", command=self.show_main_menu,
+        back_btn = tk.Button(self._screen, text="← Back to Menu", command=self.show_main_menu,
                             bg=self.TARLETON_PURPLE, fg='white', font=('Arial', 12),
                             relief=tk.FLAT, cursor='hand2')
         back_btn.pack(anchor='nw', padx=10, pady=10)
         
-        header = tk.Label(self.root, text="🏆 Your Personal Bests", 
-                         font=('Georgia', 24, 'bold'), bg=self.theme_colors['bg'], 
+        header = tk.Label(self._screen, text="🏆 Your Personal Bests", 
+                         font=('Georgia', 24, 'bold'), bg=bg, 
                          fg=self.TARLETON_GOLD)
         header.pack(pady=15)
         
-        tk.Label(self.root, text="Track your achievements and beat your own records!", 
-                font=('Arial', 12), bg=self.theme_colors['bg'], 
-                fg=self.theme_colors['text_secondary']).pack()
+        tk.Label(self._screen, text="Track your achievements and beat your own records!", 
+                font=('Arial', 12), bg=bg, 
+                fg=text_secondary).pack()
         
-        content_frame = tk.Frame(self.root, bg=self.theme_colors['bg'])
+        content_frame = tk.Frame(self._screen, bg=bg)
         content_frame.pack(fill=tk.BOTH, expand=True, padx=50, pady=20)
         
         # Personal Bests Cards
-        overall_accuracy = (self.correct_answers / self.total_questions_answered * 100) if self.total_questions_answered > 0 else 0
+        overall_accuracy = self._overall_accuracy
         
-        bests_frame = tk.Frame(content_frame, bg=self.theme_colors['bg'])
+        bests_frame = tk.Frame(content_frame, bg=bg)
         bests_frame.pack(fill=tk.X, pady=10)
         
         # Define personal best records
@@ -2252,46 +2760,44 @@ class AILearningApp:
         ]
         
         for i, (emoji, label, value, color) in enumerate(records):
-            card = tk.Frame(bests_frame, bg=self.theme_colors['card_bg'],
+            card = tk.Frame(bests_frame, bg=card_bg,
                            highlightbackground=color, highlightthickness=2)
             card.grid(row=i//3, column=i%3, padx=10, pady=10, sticky='nsew')
             
-            inner = tk.Frame(card, bg=self.theme_colors['card_bg'])
+            inner = tk.Frame(card, bg=card_bg)
             inner.pack(padx=20, pady=15)
             
             tk.Label(inner, text=emoji, font=('Arial', 24),
-                    bg=self.theme_colors['card_bg']).pack()
+                    bg=card_bg).pack()
             tk.Label(inner, text=label, font=('Arial', 11),
-                    bg=self.theme_colors['card_bg'], fg=self.theme_colors['text_secondary']).pack()
+                    bg=card_bg, fg=text_secondary).pack()
             tk.Label(inner, text=value, font=('Arial', 18, 'bold'),
-                    bg=self.theme_colors['card_bg'], fg=color).pack()
+                    bg=card_bg, fg=color).pack()
         
         for col in range(3):
             bests_frame.columnconfigure(col, weight=1)
         
         # Statistics Summary
-        stats_frame = tk.Frame(content_frame, bg=self.theme_colors['card_bg'],
+        stats_frame = tk.Frame(content_frame, bg=card_bg,
                               highlightbackground=self.TARLETON_PURPLE, highlightthickness=2)
         stats_frame.pack(fill=tk.X, pady=20)
         
-        stats_inner = tk.Frame(stats_frame, bg=self.theme_colors['card_bg'])
+        stats_inner = tk.Frame(stats_frame, bg=card_bg)
         stats_inner.pack(fill=tk.X, padx=20, pady=15)
         
         tk.Label(stats_inner, text="📈 Overall Statistics", font=('Arial', 14, 'bold'),
-                bg=self.theme_colors['card_bg'], fg=self.theme_colors['text']).pack(anchor='w')
-        
-        stats_text = f"""
-        👤 Student: {self.student_name or 'Guest'}
-        ✅ Total Correct: {self.correct_answers} / {self.total_questions_answered} questions
-        📚 Topics Mastered: {sum(1 for p in self.progress.values() if p >= 80)} / 10
-        🏆 Achievements: {len(self.achievements)} unlocked
-        🔥 Current Streak: {self.streak} days
-        📋 Review Queue: {len(self.review_queue)} questions
-        """
+                bg=card_bg, fg=text).pack(anchor='w')
+        
+        stats_text = (f"👤 Student: {self.student_name or 'Guest'}\n"
+                      f"✅ Total Correct: {self.correct_answers} / {self.total_questions_answered} questions\n"
+                      f"📚 Topics Mastered: {sum(1 for p in self.progress.values() if p >= 80)} / 10\n"
+                      f"🏆 Achievements: {len(self.achievements)} unlocked\n"
+                      f"🔥 Current Streak: {self.streak} days\n"
+                      f"📋 Review Queue: {len(self.review_queue)} questions")
         
         tk.Label(stats_inner, text=stats_text, font=('Arial', 12),
-                bg=self.theme_colors['card_bg'], fg=self.theme_colors['text'],
-                justify=tk.LEFT).pack(anchor='w', padx=10)
+                bg=card_bg, fg=text,
+                justify=tk.LEFT).pack(anchor='w', padx=10, pady=(5, 0))
         
         # Motivational message
         if overall_accuracy >= 80:
@@ -2304,30 +2810,36 @@ class AILearningApp:
             msg = "🚀 Start your journey by taking a quiz!"
         
         tk.Label(content_frame, text=msg, font=('Arial', 14, 'bold'),
-                bg=self.theme_colors['bg'], fg=self.TARLETON_PURPLE).pack(pady=15)
+                bg=bg, fg=self.TARLETON_PURPLE).pack(pady=15)
     
     def show_practice_tests(self):
         """Show practice test options"""
-        self.clear_window()
-        self.root.configure(bg=self.theme_colors['bg'])
+        self._show_cached_screen('practice_tests', self._build_practice_tests)
+    
+    def _build_practice_tests(self):
+        """Build the practice test topic list (static, so cached by show_practice_tests)"""
+        colors = self.theme_colors
+        bg = colors['bg']
+        text = colors['text']
+        self._screen.configure(bg=bg)
         
-        back_btn = tk.Button(self.root, text="← Back to Menu", command=self.show_main_menu,
+        back_btn = tk.Button(self._screen, text="← Back to Menu", command=self.show_main_menu,
                             bg=self.TARLETON_PURPLE, fg='white', font=('Arial', 12),
                             relief=tk.FLAT, cursor='hand2')
         back_btn.pack(anchor='nw', padx=10, pady=10)
         
-        header = tk.Label(self.root, text="❓ Practice Tests", 
-                         font=('Georgia', 28, 'bold'), bg=self.theme_colors['bg'], 
+        header = tk.Label(self._screen, text="❓ Practice Tests", 
+                         font=('Georgia', 28, 'bold'), bg=bg, 
                          fg=self.TARLETON_PURPLE)
         header.pack(pady=20)
         
-        content_frame = tk.Frame(self.root, bg=self.theme_colors['bg'])
+        content_frame = tk.Frame(self._screen, bg=bg)
         content_frame.pack(fill=tk.BOTH, expand=True, padx=50, pady=30)
         
         tk.Label(content_frame, 
                 text="Select a topic to take a comprehensive practice test:",
-                font=('Arial', 14), bg=self.theme_colors['bg'], 
-                fg=self.theme_colors['text']).pack(pady=20)
+                font=('Arial', 14), bg=bg, 
+                fg=text).pack(pady=20)
         
         # Test buttons for each topic
         for topic_num, topic_info in self.topics.items():
@@ -2397,41 +2909,47 @@ Good luck with your studies! 🎓
     def show_nn_builder(self):
         """Show neural network builder interface"""
         self.clear_window()
-        self.root.configure(bg=self.theme_colors['bg'])
+        colors = self.theme_colors
+        bg = colors['bg']
+        card_bg = colors['card_bg']
+        text = colors['text']
+        self._screen.configure(bg=bg)
         
-        back_btn = tk.Button(self.root, text="← Back to Menu", command=self.show_main_menu,
+        back_btn = tk.Button(self._screen, text="← Back to Menu", command=self.show_main_menu,
                             bg=self.TARLETON_PURPLE, fg='white', font=('Arial', 12),
                             relief=tk.FLAT, cursor='hand2')
         back_btn.pack(anchor='nw', padx=10, pady=10)
         
-        header = tk.Label(self.root, text="🧠 Neural Network Builder", 
-                         font=('Georgia', 24, 'bold'), bg=self.theme_colors['bg'], 
+        header = tk.Label(self._screen, text="🧠 Neural Network Builder", 
+                         font=('Georgia', 24, 'bold'), bg=bg, 
                          fg=self.TARLETON_PURPLE)
         header.pack(pady=20)
         
-        content_frame = tk.Frame(self.root, bg=self.theme_colors['bg'])
+        content_frame = tk.Frame(self._screen, bg=bg)
         content_frame.pack(fill=tk.BOTH, expand=True, padx=50, pady=20)
         
         # Instructions
-        info_frame = tk.Frame(content_frame, bg=self.theme_colors['card_bg'], relief=tk.RAISED, bd=2)
+        info_frame = tk.Frame(content_frame, bg=card_bg, relief=tk.RAISED, bd=2)
         info_frame.pack(fill=tk.X, pady=10)
         tk.Label(info_frame, 
                 text="Drag and drop layers to build your neural network. Click 'Run' to see the architecture visualization.",
-                font=('Arial', 12), bg=self.theme_colors['card_bg'], fg=self.theme_colors['text'],
+                font=('Arial', 12), bg=card_bg, fg=text,
                 wraplength=800, justify=tk.LEFT, padx=20, pady=15).pack()
         
         # Builder area
-        builder_frame = tk.Frame(content_frame, bg=self.theme_colors['bg'])
+        builder_frame = tk.Frame(content_frame, bg=bg)
         builder_frame.pack(fill=tk.BOTH, expand=True, pady=20)
         
         # Layer palette
-        palette_frame = tk.Frame(builder_frame, bg=self.theme_colors['card_bg'], relief=tk.RAISED, bd=2)
+        palette_frame = tk.Frame(builder_frame, bg=card_bg, relief=tk.RAISED, bd=2)
         palette_frame.pack(side=tk.LEFT, fill=tk.Y, padx=10)
         tk.Label(palette_frame, text="Layer Types", font=('Arial', 14, 'bold'),
-                bg=self.theme_colors['card_bg'], fg=self.theme_colors['text']).pack(pady=10)
+                bg=card_bg, fg=text).pack(pady=10)
         
         layer_types = ["Input", "Dense", "Conv2D", "LSTM", "Dropout", "Output"]
         self.nn_layers = []
+        self._nn_items = []  # (box, label) canvas item IDs per layer
+        self._nn_links = []  # Connector line IDs between consecutive layers
         
         for layer_type in layer_types:
             layer_btn = tk.Button(palette_frame, text=layer_type, width=15,
@@ -2440,17 +2958,20 @@ Good luck with your studies! 🎓
             layer_btn.pack(pady=5, padx=10)
         
         # Network canvas
-        canvas_frame = tk.Frame(builder_frame, bg=self.theme_colors['card_bg'], relief=tk.RAISED, bd=2)
+        canvas_frame = tk.Frame(builder_frame, bg=card_bg, relief=tk.RAISED, bd=2)
         canvas_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=10)
         
         tk.Label(canvas_frame, text="Network Architecture", font=('Arial', 14, 'bold'),
-                bg=self.theme_colors['card_bg'], fg=self.theme_colors['text']).pack(pady=10)
+                bg=card_bg, fg=text).pack(pady=10)
         
         self.nn_canvas = tk.Canvas(canvas_frame, bg='white', width=600, height=400)
         self.nn_canvas.pack(padx=20, pady=20, fill=tk.BOTH, expand=True)
+        # Re-centre the layers when the canvas is resized, at most once per 50 ms
+        self._nn_layout_pending = False
+        self.nn_canvas.bind("<Configure>", self._schedule_nn_layout)
         
         # Control buttons
-        control_frame = tk.Frame(canvas_frame, bg=self.theme_colors['card_bg'])
+        control_frame = tk.Frame(canvas_frame, bg=card_bg)
         control_frame.pack(pady=10)
         
         tk.Button(control_frame, text="Clear", command=self.clear_nn_builder,
@@ -2461,37 +2982,53 @@ Good luck with your studies! 🎓
     def add_nn_layer(self, layer_type):
         """Add a layer to the neural network"""
         self.nn_layers.append(layer_type)
+        
+        # Create items for the new layer only; draw_nn_architecture moves them all into place
+        canvas = self.nn_canvas
+        color = '#4CAF50' if layer_type == 'Input' else '#2196F3' if layer_type == 'Output' else '#FF9800'
+        if self._nn_items:
+            self._nn_links.append(canvas.create_line(0, 0, 0, 0, fill='black', width=2))
+        box = canvas.create_rectangle(0, 0, 0, 0, fill=color, outline='black', width=2)
+        label = canvas.create_text(0, 0, text=layer_type, font=('Arial', 12, 'bold'), fill='white')
+        self._nn_items.append((box, label))
         self.draw_nn_architecture()
     
     def clear_nn_builder(self):
         """Clear the neural network builder"""
         self.nn_layers = []
+        self._nn_items = []
+        self._nn_links = []
         self.nn_canvas.delete("all")
     
-    def draw_nn_architecture(self):
-        """Draw the neural network architecture"""
-        self.nn_canvas.delete("all")
-        if not self.nn_layers:
-            self.nn_canvas.create_text(300, 200, text="Add layers to build your network",
-                                      font=('Arial', 14), fill='gray')
+    def _schedule_nn_layout(self, event=None):
+        """Coalesce canvas resizes into one draw_nn_architecture call"""
+        if self._nn_layout_pending or not self._nn_items:
             return
-        
-        width = self.nn_canvas.winfo_width() or 600
-        height = self.nn_canvas.winfo_height() or 400
-        layer_height = height / (len(self.nn_layers) + 1)
+        self._nn_layout_pending = True
+        self.root.after(50, self._run_nn_layout)
+    
+    def _run_nn_layout(self):
+        """Run a scheduled layout if the builder is still on screen"""
+        self._nn_layout_pending = False
+        if self.nn_canvas.winfo_exists():
+            self.draw_nn_architecture()
+    
+    def draw_nn_architecture(self):
+        """Lay out the neural network architecture, spacing the layers evenly down the canvas"""
+        canvas = self.nn_canvas
+        width = canvas.winfo_width() or 600
+        height = canvas.winfo_height() or 400
+        layer_height = height / (len(self._nn_items) + 1)
         x = width / 2
         
-        for i, layer in enumerate(self.nn_layers):
+        for i, (box, label) in enumerate(self._nn_items):
             y = (i + 1) * layer_height
-            # Draw layer box
-            color = '#4CAF50' if layer == 'Input' else '#2196F3' if layer == 'Output' else '#FF9800'
-            self.nn_canvas.create_rectangle(x-80, y-20, x+80, y+20, fill=color, outline='black', width=2)
-            self.nn_canvas.create_text(x, y, text=layer, font=('Arial', 12, 'bold'), fill='white')
+            canvas.coords(box, x-80, y-20, x+80, y+20)
+            canvas.coords(label, x, y)
             
-            # Draw connection to next layer
-            if i < len(self.nn_layers) - 1:
-                next_y = (i + 2) * layer_height
-                self.nn_canvas.create_line(x, y+20, x, next_y-20, fill='black', width=2)
+            # Connection from the previous layer
+            if i:
+                canvas.coords(self._nn_links[i - 1], x, y - layer_height + 20, x, y-20)
     
     def visualize_nn(self):
         """Show neural network visualization"""
@@ -2509,159 +3046,196 @@ Good luck with your studies! 🎓
     
     def show_visualizations(self):
         """Show algorithm visualization menu"""
-        self.clear_window()
-        self.root.configure(bg=self.theme_colors['bg'])
+        self._show_cached_screen('visualizations', self._build_visualizations)
+    
+    def _build_visualizations(self):
+        """Build the visualization menu (static, so cached by show_visualizations)"""
+        colors = self.theme_colors
+        bg = colors['bg']
+        self._screen.configure(bg=bg)
         
-        back_btn = tk.Button(self.root, text="← Back to Menu", command=self.show_main_menu,
+        back_btn = tk.Button(self._screen, text="← Back to Menu", command=self.show_main_menu,
                             bg=self.TARLETON_PURPLE, fg='white', font=('Arial', 12),
                             relief=tk.FLAT, cursor='hand2')
         back_btn.pack(anchor='nw', padx=10, pady=10)
         
-        header = tk.Label(self.root, text="🔬 Algorithm Visualizations", 
-                         font=('Georgia', 24, 'bold'), bg=self.theme_colors['bg'], 
+        header = tk.Label(self._screen, text="🔬 Algorithm Visualizations", 
+                         font=('Georgia', 24, 'bold'), bg=bg, 
                          fg=self.TARLETON_PURPLE)
         header.pack(pady=20)
         
-        content_frame = tk.Frame(self.root, bg=self.theme_colors['bg'])
+        content_frame = tk.Frame(self._screen, bg=bg)
         content_frame.pack(fill=tk.BOTH, expand=True, padx=50, pady=30)
         
         tk.Label(content_frame, text="Select an algorithm to visualize:",
-                font=('Arial', 14), bg=self.theme_colors['bg'], 
-                fg=self.theme_colors['text']).pack(pady=20)
-        
-        viz_options = [
-            ("🌳 Decision Tree", self.viz_decision_tree, self.TARLETON_PURPLE),
-            ("🎯 K-Means Clustering", self.viz_kmeans, '#16a085'),
-            ("📉 Gradient Descent", self.viz_gradient_descent, '#e74c3c'),
-            ("🧠 Neural Network Training", self.viz_nn_training, '#3498db')
-        ]
+                font=('Arial', 14), bg=bg, 
+                fg=colors['text']).pack(pady=20)
         
-        for text, command, color in viz_options:
-            btn = tk.Button(content_frame, text=text, command=command,
+        for text, method_name, color in self._VIZ_OPTIONS:
+            btn = tk.Button(content_frame, text=text, command=getattr(self, method_name),
                            bg=color, fg='white', font=('Arial', 12, 'bold'),
                            width=40, height=2, relief=tk.FLAT, cursor='hand2')
             btn.pack(pady=10, padx=20, fill=tk.X)
     
+    def _show_info(self, title, message):
+        """Show message in one reusable info window instead of building a new messagebox each time"""
+        dialog = self._info_dialog
+        if dialog is None or not dialog.winfo_exists():
+            dialog = tk.Toplevel(self.root)
+            dialog.transient(self.root)
+            dialog.resizable(False, False)
+            # Closing only hides the window so the next message can reuse it
+            dialog.protocol("WM_DELETE_WINDOW", dialog.withdraw)
+            dialog.bind('<Return>', lambda event: dialog.withdraw())
+            dialog.bind('<Escape>', lambda event: dialog.withdraw())
+            self._info_label = tk.Label(dialog, font=('Arial', 11), justify=tk.LEFT)
+            self._info_label.pack(padx=20, pady=20)
+            tk.Button(dialog, text="OK", command=dialog.withdraw, width=10).pack(pady=(0, 15))
+            self._info_dialog = dialog
+        dialog.title(title)
+        self._info_label.configure(text=message)
+        dialog.deiconify()
+        dialog.lift()
+        dialog.focus_set()
+    
     def viz_decision_tree(self):
         """Visualize decision tree"""
-        messagebox.showinfo("Decision Tree Visualization", 
-                          "Decision Tree splits data based on feature values.\n\n"
-                          "Each node represents a decision point, and leaves represent outcomes.\n"
-                          "The tree grows by finding the best feature to split on at each node.")
+        self._show_info("Decision Tree Visualization", 
+                        "Decision Tree splits data based on feature values.\n\n"
+                        "Each node represents a decision point, and leaves represent outcomes.\n"
+                        "The tree grows by finding the best feature to split on at each node.")
         self.add_xp(5)
     
     def viz_kmeans(self):
         """Visualize K-Means clustering"""
-        messagebox.showinfo("K-Means Visualization",
-                          "K-Means groups data into k clusters.\n\n"
-                          "1. Initialize k centroids randomly\n"
-                          "2. Assign points to nearest centroid\n"
-                          "3. Update centroids to mean of assigned points\n"
-                          "4. Repeat until convergence")
+        self._show_info("K-Means Visualization",
+                        "K-Means groups data into k clusters.\n\n"
+                        "1. Initialize k centroids randomly\n"
+                        "2. Assign points to nearest centroid\n"
+                        "3. Update centroids to mean of assigned points\n"
+                        "4. Repeat until convergence")
         self.add_xp(5)
     
     def viz_gradient_descent(self):
         """Visualize gradient descent"""
-        messagebox.showinfo("Gradient Descent Visualization",
-                          "Gradient Descent minimizes loss by following the steepest descent.\n\n"
-                          "The algorithm iteratively updates parameters:\n"
-                          "θ = θ - α∇J(θ)\n\n"
-                          "Where α is the learning rate and ∇J is the gradient.")
+        self._show_info("Gradient Descent Visualization",
+                        "Gradient Descent minimizes loss by following the steepest descent.\n\n"
+                        "The algorithm iteratively updates parameters:\n"
+                        "θ = θ - α∇J(θ)\n\n"
+                        "Where α is the learning rate and ∇J is the gradient.")
         self.add_xp(5)
     
     def viz_nn_training(self):
         """Visualize neural network training"""
-        messagebox.showinfo("Neural Network Training",
-                          "Neural networks learn through:\n\n"
-                          "1. Forward Propagation: Data flows through layers\n"
-                          "2. Loss Calculation: Compare prediction vs actual\n"
-                          "3. Backpropagation: Calculate gradients\n"
-                          "4. Weight Update: Adjust weights using gradient descent")
+        self._show_info("Neural Network Training",
+                        "Neural networks learn through:\n\n"
+                        "1. Forward Propagation: Data flows through layers\n"
+                        "2. Loss Calculation: Compare prediction vs actual\n"
+                        "3. Backpropagation: Calculate gradients\n"
+                        "4. Weight Update: Adjust weights using gradient descent")
         self.add_xp(5)
     
     def show_achievements(self):
         """Show achievements page"""
         self.clear_window()
-        self.root.configure(bg=self.theme_colors['bg'])
+        colors = self.theme_colors
+        bg = colors['bg']
+        text_secondary = colors['text_secondary']
+        card_bg = colors['card_bg']
+        text = colors['text']
+        self._screen.configure(bg=bg)
         
-        back_btn = tk.Button(self.root, text="← Back to Menu", command=self.show_main_menu,
+        back_btn = tk.Button(self._screen, text="← Back to Menu", command=self.show_main_menu,
                             bg=self.TARLETON_PURPLE, fg='white', font=('Arial', 12),
                             relief=tk.FLAT, cursor='hand2')
         back_btn.pack(anchor='nw', padx=10, pady=10)
         
-        header = tk.Label(self.root, text="🎁 Achievements", 
-                         font=('Georgia', 24, 'bold'), bg=self.theme_colors['bg'], 
+        header = tk.Label(self._screen, text="🎁 Achievements", 
+                         font=('Georgia', 24, 'bold'), bg=bg, 
                          fg=self.TARLETON_GOLD)
         header.pack(pady=20)
         
-        content_frame = tk.Frame(self.root, bg=self.theme_colors['bg'])
+        content_frame = tk.Frame(self._screen, bg=bg)
         content_frame.pack(fill=tk.BOTH, expand=True, padx=50, pady=20)
         
         # Stats
-        stats_frame = tk.Frame(content_frame, bg=self.theme_colors['card_bg'], relief=tk.RAISED, bd=2)
+        stats_frame = tk.Frame(content_frame, bg=card_bg, relief=tk.RAISED, bd=2)
         stats_frame.pack(fill=tk.X, pady=20)
         
-        stats_text = f"""
-        🏆 Total Achievements: {len(self.achievements)}
-        ⭐ Current Level: {self.level}
-        💎 Total XP: {self.xp}
-        🔥 Current Streak: {self.streak} days
-        """
+        stats_text = (f"🏆 Total Achievements: {len(self.achievements)}\n"
+                      f"⭐ Current Level: {self.level}\n"
+                      f"💎 Total XP: {self.xp}\n"
+                      f"🔥 Current Streak: {self.streak} days")
         tk.Label(stats_frame, text=stats_text, font=('Arial', 14),
-                bg=self.theme_colors['card_bg'], fg=self.theme_colors['text'],
+                bg=card_bg, fg=text,
                 justify=tk.LEFT).pack(padx=30, pady=20)
         
         # Achievements list
         if self.achievements:
             tk.Label(content_frame, text="Your Achievements:", font=('Arial', 16, 'bold'),
-                    bg=self.theme_colors['bg'], fg=self.theme_colors['text']).pack(anchor='w', pady=10)
+                    bg=bg, fg=text).pack(anchor='w', pady=10)
             
-            for ach in self.achievements:
-                ach_frame = tk.Frame(content_frame, bg=self.theme_colors['card_bg'], relief=tk.RAISED, bd=1)
-                ach_frame.pack(fill=tk.X, pady=5)
-                tk.Label(ach_frame, text=f"🏆 {ach}", font=('Arial', 12),
-                        bg=self.theme_colors['card_bg'], fg=self.theme_colors['accent']).pack(padx=20, pady=10, anchor='w')
+            # Long lists are built a pass at a time so the screen paints before every row exists
+            self._add_achievement_rows(content_frame, 0)
         else:
             tk.Label(content_frame, text="No achievements yet. Start learning to unlock achievements!",
-                    font=('Arial', 14), bg=self.theme_colors['bg'], fg=self.theme_colors['text_secondary']).pack(pady=50)
+                    font=('Arial', 14), bg=bg, fg=text_secondary).pack(pady=50)
+    
+    def _add_achievement_rows(self, parent, start):
+        """Add one batch of achievement rows to parent, then schedule the next batch"""
+        if not parent.winfo_exists():
+            return  # Left the achievements screen before the list finished building
+        colors = self.theme_colors
+        card_bg = colors['card_bg']
+        accent = colors['accent']
+        end = min(start + self._ACHIEVEMENT_ROWS_PER_PASS, len(self.achievements))
+        for ach in self.achievements[start:end]:
+            ach_frame = tk.Frame(parent, bg=card_bg, relief=tk.RAISED, bd=1)
+            ach_frame.pack(fill=tk.X, pady=5)
+            tk.Label(ach_frame, text=f"🏆 {ach}", font=('Arial', 12),
+                    bg=card_bg, fg=accent).pack(padx=20, pady=10, anchor='w')
+        if end < len(self.achievements):
+            self.root.after_idle(self._add_achievement_rows, parent, end)
     
     def show_quests(self):
         """Show active quests/challenges"""
         self.clear_window()
-        self.root.configure(bg=self.theme_colors['bg'])
+        colors = self.theme_colors
+        bg = colors['bg']
+        text_secondary = colors['text_secondary']
+        card_bg = colors['card_bg']
+        text = colors['text']
+        self._screen.configure(bg=bg)
         
-        back_btn = tk.Button(self.root, text="← Back to Menu", command=self.show_main_menu,
+        back_btn = tk.Button(self._screen, text="← Back to Menu", command=self.show_main_menu,
                             bg=self.TARLETON_PURPLE, fg='white', font=('Arial', 12),
                             relief=tk.FLAT, cursor='hand2')
         back_btn.pack(anchor='nw', padx=10, pady=10)
         
-        header = tk.Label(self.root, text="🎯 Daily & Weekly Quests", 
-                         font=('Georgia', 24, 'bold'), bg=self.theme_colors['bg'], 
+        header = tk.Label(self._screen, text="🎯 Daily & Weekly Quests", 
+                         font=('Georgia', 24, 'bold'), bg=bg, 
                          fg=self.TARLETON_PURPLE)
         header.pack(pady=15)
         
-        content_frame = tk.Frame(self.root, bg=self.theme_colors['bg'])
+        content_frame = tk.Frame(self._screen, bg=bg)
         content_frame.pack(fill=tk.BOTH, expand=True, padx=50, pady=20)
         
         # Streak freeze status
-        freeze_frame = tk.Frame(content_frame, bg=self.theme_colors['card_bg'],
+        freeze_frame = tk.Frame(content_frame, bg=card_bg,
                                highlightbackground='#3498db', highlightthickness=2)
         freeze_frame.pack(fill=tk.X, pady=10)
         
-        freeze_inner = tk.Frame(freeze_frame, bg=self.theme_colors['card_bg'])
-        freeze_inner.pack(fill=tk.X, padx=20, pady=10)
-        
-        tk.Label(freeze_inner, text=f"❄️ Streak Freezes: {self.streak_freezes}/5", 
+        tk.Label(freeze_frame, text=f"❄️ Streak Freezes: {self.streak_freezes}/5", 
                 font=('Arial', 12, 'bold'),
-                bg=self.theme_colors['card_bg'], fg='#3498db').pack(side=tk.LEFT)
+                bg=card_bg, fg='#3498db').pack(side=tk.LEFT, padx=(20, 0), pady=10)
         
-        tk.Label(freeze_inner, text="(Protect your streak on busy days)", 
+        tk.Label(freeze_frame, text="(Protect your streak on busy days)", 
                 font=('Arial', 10),
-                bg=self.theme_colors['card_bg'], fg=self.theme_colors['text_secondary']).pack(side=tk.LEFT, padx=10)
+                bg=card_bg, fg=text_secondary).pack(side=tk.LEFT, padx=10, pady=10)
         
         # Active quests
         tk.Label(content_frame, text="Active Quests", font=('Arial', 16, 'bold'),
-                bg=self.theme_colors['bg'], fg=self.theme_colors['text']).pack(anchor='w', pady=(15, 5))
+                bg=bg, fg=text).pack(anchor='w', pady=(15, 5))
         
         if self.active_quests:
             for quest in self.active_quests:
@@ -2669,169 +3243,156 @@ Good luck with your studies! 🎓
         else:
             tk.Label(content_frame, text="No active quests. Check back tomorrow!", 
                     font=('Arial', 12),
-                    bg=self.theme_colors['bg'], fg=self.theme_colors['text_secondary']).pack(pady=20)
+                    bg=bg, fg=text_secondary).pack(pady=20)
         
         # Completed quests count
         tk.Label(content_frame, text=f"\n✅ Completed Quests: {len(self.completed_quests)}", 
                 font=('Arial', 14, 'bold'),
-                bg=self.theme_colors['bg'], fg='#27ae60').pack(anchor='w', pady=10)
+                bg=bg, fg='#27ae60').pack(anchor='w', pady=10)
         
         # Unlockable features status
         tk.Label(content_frame, text="🔓 Unlockable Features", font=('Arial', 16, 'bold'),
-                bg=self.theme_colors['bg'], fg=self.theme_colors['text']).pack(anchor='w', pady=(15, 5))
+                bg=bg, fg=text).pack(anchor='w', pady=(15, 5))
         
-        unlock_frame = tk.Frame(content_frame, bg=self.theme_colors['card_bg'],
+        unlock_frame = tk.Frame(content_frame, bg=card_bg,
                                highlightbackground=self.TARLETON_PURPLE, highlightthickness=1)
         unlock_frame.pack(fill=tk.X, pady=5)
         
-        unlocks = [
-            ('Hard Mode', 'hard_mode', 5, '🔥'),
-            ('Exam Simulator', 'exam_simulator', 15, '📝'),
-            ('Bonus Visualizations', 'bonus_visualizations', 25, '🔬'),
-            ('AI Case Studies', 'case_studies', 40, '📚')
-        ]
-        
-        for name, key, required, emoji in unlocks:
-            row = tk.Frame(unlock_frame, bg=self.theme_colors['card_bg'])
-            row.pack(fill=tk.X, padx=15, pady=5)
-            
+        # Name and status are gridded straight onto the card; the wide first column pushes status right
+        unlock_frame.columnconfigure(0, weight=1)
+        for row, (name, key, required, emoji) in enumerate(self._FEATURE_UNLOCKS):
             is_unlocked = self.unlocked_features.get(key, False)
             status = "✓ Unlocked" if is_unlocked else f"🔒 {required} quests needed"
-            color = '#27ae60' if is_unlocked else self.theme_colors['text_secondary']
+            color = '#27ae60' if is_unlocked else text_secondary
             
-            tk.Label(row, text=f"{emoji} {name}", font=('Arial', 11),
-                    bg=self.theme_colors['card_bg'], fg=self.theme_colors['text']).pack(side=tk.LEFT)
-            tk.Label(row, text=status, font=('Arial', 10),
-                    bg=self.theme_colors['card_bg'], fg=color).pack(side=tk.RIGHT)
+            tk.Label(unlock_frame, text=f"{emoji} {name}", font=('Arial', 11),
+                    bg=card_bg, fg=text).grid(row=row, column=0, sticky='w', padx=(15, 0), pady=5)
+            tk.Label(unlock_frame, text=status, font=('Arial', 10),
+                    bg=card_bg, fg=color).grid(row=row, column=1, sticky='e', padx=(0, 15), pady=5)
     
     def _create_quest_card(self, parent, quest):
         """Create a quest progress card"""
+        colors = self.theme_colors
+        text_secondary = colors['text_secondary']
+        card_bg = colors['card_bg']
+        text = colors['text']
+        
         is_weekly = quest.get('is_weekly', False)
         border_color = '#f39c12' if is_weekly else '#27ae60'
         
-        card = tk.Frame(parent, bg=self.theme_colors['card_bg'],
+        card = tk.Frame(parent, bg=card_bg,
                        highlightbackground=border_color, highlightthickness=2)
         card.pack(fill=tk.X, pady=5)
         
-        inner = tk.Frame(card, bg=self.theme_colors['card_bg'])
-        inner.pack(fill=tk.X, padx=15, pady=10)
-        
         # Quest title and type
-        header_row = tk.Frame(inner, bg=self.theme_colors['card_bg'])
-        header_row.pack(fill=tk.X)
+        header_row = tk.Frame(card, bg=card_bg)
+        header_row.pack(fill=tk.X, padx=15, pady=(10, 0))
         
         tk.Label(header_row, text=quest['title'], font=('Arial', 12, 'bold'),
-                bg=self.theme_colors['card_bg'], fg=self.theme_colors['text']).pack(side=tk.LEFT)
+                bg=card_bg, fg=text).pack(side=tk.LEFT)
         
         if is_weekly:
             tk.Label(header_row, text="WEEKLY", font=('Arial', 9, 'bold'),
                     bg='#f39c12', fg='white', padx=5).pack(side=tk.RIGHT)
         
         # Description
-        tk.Label(inner, text=quest['description'], font=('Arial', 10),
-                bg=self.theme_colors['card_bg'], fg=self.theme_colors['text_secondary']).pack(anchor='w')
+        tk.Label(card, text=quest['description'], font=('Arial', 10),
+                bg=card_bg, fg=text_secondary).pack(anchor='w', padx=15)
         
         # Progress bar
         progress_pct = (quest['progress'] / quest['target']) * 100
         
-        progress_row = tk.Frame(inner, bg=self.theme_colors['card_bg'])
-        progress_row.pack(fill=tk.X, pady=5)
+        progress_row = tk.Frame(card, bg=card_bg)
+        progress_row.pack(fill=tk.X, padx=15, pady=(5, 15))
         
-        bar_bg = tk.Frame(progress_row, bg='#e0e0e0', height=15, width=300)
-        bar_bg.pack(side=tk.LEFT)
-        bar_bg.pack_propagate(False)
-        
-        bar_fill = tk.Frame(bar_bg, bg='#27ae60', height=15, width=int(300 * progress_pct / 100))
-        bar_fill.place(x=0, y=0)
+        self.create_score_bar(progress_row, 300, 15, progress_pct, '#27ae60').pack(side=tk.LEFT)
         
         tk.Label(progress_row, text=f"{quest['progress']}/{quest['target']}", 
                 font=('Arial', 10),
-                bg=self.theme_colors['card_bg'], fg=self.theme_colors['text']).pack(side=tk.LEFT, padx=10)
+                bg=card_bg, fg=text).pack(side=tk.LEFT, padx=10)
         
         tk.Label(progress_row, text=f"+{quest['xp_reward']} XP", 
                 font=('Arial', 10, 'bold'),
-                bg=self.theme_colors['card_bg'], fg=self.TARLETON_GOLD).pack(side=tk.RIGHT)
+                bg=card_bg, fg=self.TARLETON_GOLD).pack(side=tk.RIGHT)
     
     def show_instructor_dashboard(self):
         """Show instructor dashboard with class analytics"""
         self.clear_window()
-        self.root.configure(bg=self.theme_colors['bg'])
+        colors = self.theme_colors
+        bg = colors['bg']
+        card_bg = colors['card_bg']
+        text = colors['text']
+        self._screen.configure(bg=bg)
         
-        back_btn = tk.Button(self.root, text="← Back to Menu", command=self.show_main_menu,
+        back_btn = tk.Button(self._screen, text="← Back to Menu", command=self.show_main_menu,
                             bg=self.TARLETON_PURPLE, fg='white', font=('Arial', 12),
                             relief=tk.FLAT, cursor='hand2')
         back_btn.pack(anchor='nw', padx=10, pady=10)
         
-        header = tk.Label(self.root, text="👨‍🏫 Instructor Dashboard", 
-                         font=('Georgia', 24, 'bold'), bg=self.theme_colors['bg'], 
+        header = tk.Label(self._screen, text="👨‍🏫 Instructor Dashboard", 
+                         font=('Georgia', 24, 'bold'), bg=bg, 
                          fg=self.TARLETON_PURPLE)
         header.pack(pady=15)
         
-        content_frame = tk.Frame(self.root, bg=self.theme_colors['bg'])
+        content_frame = tk.Frame(self._screen, bg=bg)
         content_frame.pack(fill=tk.BOTH, expand=True, padx=50, pady=20)
         
         # Current student summary
-        summary_frame = tk.Frame(content_frame, bg=self.theme_colors['card_bg'],
+        summary_frame = tk.Frame(content_frame, bg=card_bg,
                                 highlightbackground=self.TARLETON_PURPLE, highlightthickness=2)
         summary_frame.pack(fill=tk.X, pady=10)
         
-        summary_inner = tk.Frame(summary_frame, bg=self.theme_colors['card_bg'])
-        summary_inner.pack(fill=tk.X, padx=20, pady=15)
-        
-        tk.Label(summary_inner, text="Current Student Summary", font=('Arial', 14, 'bold'),
-                bg=self.theme_colors['card_bg'], fg=self.theme_colors['text']).pack(anchor='w')
+        tk.Label(summary_frame, text="Current Student Summary", font=('Arial', 14, 'bold'),
+                bg=card_bg, fg=text).pack(anchor='w', padx=20, pady=(15, 0))
         
-        overall_accuracy = (self.correct_answers / self.total_questions_answered * 100) if self.total_questions_answered > 0 else 0
+        overall_accuracy = self._overall_accuracy
         
-        summary_text = f"""
-        Student: {self.student_name or 'Guest'}
-        Exam Readiness: {self.get_exam_readiness()}%
-        Overall Accuracy: {overall_accuracy:.1f}%
-        Questions Answered: {self.total_questions_answered}
-        Time Spent: {self.total_time_spent/60:.0f} minutes
-        """
-        tk.Label(summary_inner, text=summary_text, font=('Arial', 11),
-                bg=self.theme_colors['card_bg'], fg=self.theme_colors['text'],
-                justify=tk.LEFT).pack(anchor='w')
+        summary_text = (f"Student: {self.student_name or 'Guest'}\n"
+                        f"Exam Readiness: {self.get_exam_readiness()}%\n"
+                        f"Overall Accuracy: {overall_accuracy:.1f}%\n"
+                        f"Questions Answered: {self.total_questions_answered}\n"
+                        f"Time Spent: {self.total_time_spent/60:.0f} minutes")
+        tk.Label(summary_frame, text=summary_text, font=('Arial', 11),
+                bg=card_bg, fg=text,
+                justify=tk.LEFT).pack(anchor='w', padx=20, pady=(5, 15))
         
         # Topic-wise analysis
         tk.Label(content_frame, text="📊 Topic-wise Accuracy Distribution", 
                 font=('Arial', 14, 'bold'),
-                bg=self.theme_colors['bg'], fg=self.theme_colors['text']).pack(anchor='w', pady=(15, 5))
+                bg=bg, fg=text).pack(anchor='w', pady=(15, 5))
         
-        topic_frame = tk.Frame(content_frame, bg=self.theme_colors['card_bg'],
+        topic_frame = tk.Frame(content_frame, bg=card_bg,
                               highlightbackground=self.TARLETON_PURPLE, highlightthickness=1)
         topic_frame.pack(fill=tk.X, pady=5)
         
-        for topic_num, topic_info in list(self.topics.items())[:5]:
-            row = tk.Frame(topic_frame, bg=self.theme_colors['card_bg'])
-            row.pack(fill=tk.X, padx=15, pady=3)
-            
-            acc_data = self.topic_accuracy.get(str(topic_num), {'correct': 0, 'total': 0})
-            acc = (acc_data['correct'] / acc_data['total'] * 100) if acc_data['total'] > 0 else 0
+        # One canvas for all the mini bars instead of a frame, two labels and a bar canvas per topic
+        shown_topics = list(self.topics.items())[:5]
+        row_height = 20
+        bars = tk.Canvas(topic_frame, height=len(shown_topics) * row_height, bg=card_bg,
+                        highlightthickness=0, bd=0)
+        bars.pack(fill=tk.X, padx=15, pady=5)
+        
+        for i, (topic_num, topic_info) in enumerate(shown_topics):
+            total = self.topic_total[topic_num]
+            acc = self._topic_acc_pct[topic_num]
+            y = i * row_height + row_height // 2
             
-            tk.Label(row, text=f"T{topic_num}:", font=('Arial', 10),
-                    bg=self.theme_colors['card_bg'], fg=self.theme_colors['text'],
-                    width=4).pack(side=tk.LEFT)
+            bars.create_text(0, y, text=f"T{topic_num}:", font=('Arial', 10), fill=text, anchor='w')
             
             # Mini bar
-            bar_bg = tk.Frame(row, bg='#e0e0e0', height=12, width=200)
-            bar_bg.pack(side=tk.LEFT, padx=5)
-            bar_bg.pack_propagate(False)
-            
             bar_color = '#27ae60' if acc >= 70 else '#f39c12' if acc >= 50 else '#e74c3c'
-            bar_fill = tk.Frame(bar_bg, bg=bar_color, height=12, width=int(200 * acc / 100))
-            bar_fill.place(x=0, y=0)
+            bars.create_rectangle(45, y - 6, 245, y + 6, fill='#e0e0e0', width=0)
+            if acc > 0:
+                bars.create_rectangle(45, y - 6, 45 + 2 * acc, y + 6, fill=bar_color, width=0)
             
-            tk.Label(row, text=f"{acc:.0f}% ({acc_data['total']} Q)", 
-                    font=('Arial', 9),
-                    bg=self.theme_colors['card_bg'], fg=bar_color).pack(side=tk.LEFT, padx=5)
+            bars.create_text(255, y, text=f"{acc:.0f}% ({total} Q)", font=('Arial', 9),
+                             fill=bar_color, anchor='w')
         
         # Export buttons
         tk.Label(content_frame, text="📤 Export Options", font=('Arial', 14, 'bold'),
-                bg=self.theme_colors['bg'], fg=self.theme_colors['text']).pack(anchor='w', pady=(20, 5))
+                bg=bg, fg=text).pack(anchor='w', pady=(20, 5))
         
-        export_frame = tk.Frame(content_frame, bg=self.theme_colors['bg'])
+        export_frame = tk.Frame(content_frame, bg=bg)
         export_frame.pack(fill=tk.X, pady=5)
         
         tk.Button(export_frame, text="📊 Export CSV Report", 
@@ -2840,62 +3401,64 @@ Good luck with your studies! 🎓
                  relief=tk.FLAT, cursor='hand2', width=20).pack(side=tk.LEFT, padx=5)
         
         tk.Button(export_frame, text="📋 Export JSON Data", 
-                 command=lambda: messagebox.showinfo("Exported", 
-                     f"Data exported to gradebook_export_{self.student_name or 'guest'}.json"),
+                 command=lambda: (self.flush_gradebook(), messagebox.showinfo("Exported", 
+                     f"Data exported to gradebook_export_{self.student_name or 'guest'}.json")),
                  bg='#3498db', fg='white', font=('Arial', 11),
                  relief=tk.FLAT, cursor='hand2', width=20).pack(side=tk.LEFT, padx=5)
     
     def show_class_leaderboard(self):
         """Show class leaderboard with multiple categories and privacy controls"""
         self.clear_window()
-        self.root.configure(bg=self.theme_colors['bg'])
+        colors = self.theme_colors
+        bg = colors['bg']
+        text_secondary = colors['text_secondary']
+        card_bg = colors['card_bg']
+        text = colors['text']
+        self._screen.configure(bg=bg)
         
-        back_btn = tk.Button(self.root, text="← Back to Menu", command=self.show_main_menu,
+        back_btn = tk.Button(self._screen, text="← Back to Menu", command=self.show_main_menu,
                             bg=self.TARLETON_PURPLE, fg='white', font=('Arial', 12),
                             relief=tk.FLAT, cursor='hand2')
         back_btn.pack(anchor='nw', padx=10, pady=10)
         
-        header = tk.Label(self.root, text="🏆 Class Leaderboard", 
-                         font=('Georgia', 24, 'bold'), bg=self.theme_colors['bg'], 
+        header = tk.Label(self._screen, text="🏆 Class Leaderboard", 
+                         font=('Georgia', 24, 'bold'), bg=bg, 
                          fg=self.TARLETON_GOLD)
         header.pack(pady=15)
         
-        content_frame = tk.Frame(self.root, bg=self.theme_colors['bg'])
+        content_frame = tk.Frame(self._screen, bg=bg)
         content_frame.pack(fill=tk.BOTH, expand=True, padx=50, pady=20)
         
         # Privacy settings
-        privacy_frame = tk.Frame(content_frame, bg=self.theme_colors['card_bg'],
+        privacy_frame = tk.Frame(content_frame, bg=card_bg,
                                 highlightbackground='#3498db', highlightthickness=2)
         privacy_frame.pack(fill=tk.X, pady=10)
         
-        privacy_inner = tk.Frame(privacy_frame, bg=self.theme_colors['card_bg'])
-        privacy_inner.pack(fill=tk.X, padx=20, pady=10)
-        
-        tk.Label(privacy_inner, text="🔒 Privacy Settings", font=('Arial', 12, 'bold'),
-                bg=self.theme_colors['card_bg'], fg=self.theme_colors['text']).pack(anchor='w')
+        tk.Label(privacy_frame, text="🔒 Privacy Settings", font=('Arial', 12, 'bold'),
+                bg=card_bg, fg=text).pack(anchor='w', padx=20, pady=(10, 0))
         
         # Alias setting
-        alias_row = tk.Frame(privacy_inner, bg=self.theme_colors['card_bg'])
-        alias_row.pack(fill=tk.X, pady=5)
+        alias_row = tk.Frame(privacy_frame, bg=card_bg)
+        alias_row.pack(fill=tk.X, padx=20, pady=(5, 15))
         
         self.alias_var = tk.BooleanVar(value=self.display_alias)
         tk.Checkbutton(alias_row, text="Use alias instead of real name", 
                       variable=self.alias_var,
                       command=self._toggle_alias,
-                      bg=self.theme_colors['card_bg'], fg=self.theme_colors['text']).pack(side=tk.LEFT)
+                      bg=card_bg, fg=text).pack(side=tk.LEFT)
         
         # Opt-in setting
         self.optin_var = tk.BooleanVar(value=self.opt_in_leaderboard)
         tk.Checkbutton(alias_row, text="Show me on class leaderboard", 
                       variable=self.optin_var,
                       command=self._toggle_optin,
-                      bg=self.theme_colors['card_bg'], fg=self.theme_colors['text']).pack(side=tk.LEFT, padx=20)
+                      bg=card_bg, fg=text).pack(side=tk.LEFT, padx=20)
         
         # Leaderboard categories
         tk.Label(content_frame, text="Multiple Ways to Win! 🎉", font=('Arial', 14, 'bold'),
-                bg=self.theme_colors['bg'], fg=self.theme_colors['text']).pack(anchor='w', pady=(15, 5))
+                bg=bg, fg=text).pack(anchor='w', pady=(15, 5))
         
-        overall_accuracy = (self.correct_answers / self.total_questions_answered * 100) if self.total_questions_answered > 0 else 0
+        overall_accuracy = self._overall_accuracy
         
         categories = [
             ("🔥 Most Consistent (Streak)", f"{self.streak} days", '#FF6B35'),
@@ -2905,27 +3468,36 @@ Good luck with your studies! 🎓
             ("🎓 Overall Accuracy", f"{overall_accuracy:.1f}%", self.TARLETON_PURPLE),
         ]
         
-        for title, value, color in categories:
-            cat_frame = tk.Frame(content_frame, bg=self.theme_colors['card_bg'],
-                                highlightbackground=color, highlightthickness=2)
-            cat_frame.pack(fill=tk.X, pady=5)
-            
-            inner = tk.Frame(cat_frame, bg=self.theme_colors['card_bg'])
-            inner.pack(fill=tk.X, padx=20, pady=12)
-            
-            tk.Label(inner, text=title, font=('Arial', 13, 'bold'),
-                    bg=self.theme_colors['card_bg'], fg=color).pack(side=tk.LEFT)
-            
-            # Your position
-            display_name = self.student_alias if self.display_alias else self.student_name
-            tk.Label(inner, text=f"Your score: {value}", font=('Arial', 11),
-                    bg=self.theme_colors['card_bg'], fg=self.theme_colors['text']).pack(side=tk.RIGHT)
+        # All category cards are drawn on one canvas rather than two frames and two labels each
+        card_height, card_gap = 46, 10
+        cards = tk.Canvas(content_frame, height=len(categories) * (card_height + card_gap), bg=bg,
+                         highlightthickness=0, bd=0)
+        cards.pack(fill=tk.X)
+        
+        rows = []  # (border, score label, top y) canvas items per category
+        for i, (title, value, color) in enumerate(categories):
+            top = i * (card_height + card_gap) + card_gap // 2
+            middle = top + card_height // 2
+            border = cards.create_rectangle(1, top + 1, 599, top + card_height - 1,
+                                            fill=card_bg, outline=color, width=2)
+            cards.create_text(22, middle, text=title, font=('Arial', 13, 'bold'), fill=color, anchor='w')
+            score = cards.create_text(578, middle, text=f"Your score: {value}", font=('Arial', 11),
+                                      fill=text, anchor='e')
+            rows.append((border, score, top))
+        
+        def stretch_cards(event):
+            # Cards fill the canvas width; the score stays right-aligned inside each card
+            for border, score, top in rows:
+                cards.coords(border, 1, top + 1, event.width - 1, top + card_height - 1)
+                cards.coords(score, event.width - 22, top + card_height // 2)
+        
+        cards.bind('<Configure>', stretch_cards)
         
         # Note about class data
         tk.Label(content_frame, 
                 text="\n💡 Full class rankings will be available when connected to class data.",
-                font=('Arial', 10), bg=self.theme_colors['bg'], 
-                fg=self.theme_colors['text_secondary']).pack(pady=10)
+                font=('Arial', 10), bg=bg, 
+                fg=text_secondary).pack(pady=10)
     
     def _toggle_alias(self):
         """Toggle alias display preference"""
@@ -2944,14 +3516,19 @@ class QuestionsDatabase:
     """Database of questions for all topics"""
     
     def __init__(self):
-        self.questions = self._load_questions()
+        # The bank and its per-topic groups are tuples so every caller can share them safely
+        self.questions = tuple(self._load_questions())
+        # Topic number -> that topic's questions, built once so lookups don't scan the bank
+        by_topic = {}
+        for q in self.questions:
+            q['options'] = tuple(q['options'])  # Never modified, so drop the list's spare capacity
+            by_topic.setdefault(q['topic'], []).append(q)
+        self.by_topic = {topic: tuple(questions) for topic, questions in by_topic.items()}
     
     def _load_questions(self):
         """Load all questions"""
-        questions = []
-        
-        # Topic 1: Introduction to AI
-        questions.extend([
+        questions = [
+            # Topic 1: Introduction to AI
             {
                 "topic": 1,
                 "question": "What is the primary goal of Artificial Intelligence?",
@@ -3006,11 +3583,9 @@ class QuestionsDatabase:
                     "Evaluate programming languages"
                 ],
                 "correct": "Determine if a machine can exhibit intelligent behavior"
-            }
-        ])
-        
-        # Topic 2: Machine Learning
-        questions.extend([
+            },
+            
+            # Topic 2: Machine Learning
             {
                 "topic": 2,
                 "question": "What is Machine Learning?",
@@ -3120,11 +3695,9 @@ class QuestionsDatabase:
                     "General intelligence, or strong AI"
                 ],
                 "correct": "Database management"
-            }
-        ])
-        
-        # Topic 3: Regression Methods
-        questions.extend([
+            },
+            
+            # Topic 3: Regression Methods
             {
                 "topic": 3,
                 "question": "Linear regression is used for:",
@@ -3179,11 +3752,9 @@ class QuestionsDatabase:
                     "We need to classify data"
                 ],
                 "correct": "The relationship between variables is non-linear"
-            }
-        ])
-        
-        # Topic 4: Classification Algorithms
-        questions.extend([
+            },
+            
+            # Topic 4: Classification Algorithms
             {
                 "topic": 4,
                 "question": "Which algorithm uses decision trees?",
@@ -3249,11 +3820,9 @@ class QuestionsDatabase:
                     "The model cannot make predictions"
                 ],
                 "correct": "The model becomes sensitive to noise"
-            }
-        ])
-        
-        # Topic 5: Clustering
-        questions.extend([
+            },
+            
+            # Topic 5: Clustering
             {
                 "topic": 5,
                 "question": "K-Means clustering is an example of:",
@@ -3308,11 +3877,9 @@ class QuestionsDatabase:
                     "Reducing dimensionality"
                 ],
                 "correct": "Finding clusters of arbitrary shapes and identifying outliers"
-            }
-        ])
-        
-        # Topic 6: Neural Networks
-        questions.extend([
+            },
+            
+            # Topic 6: Neural Networks
             {
                 "topic": 6,
                 "question": "What is an activation function in a neural network?",
@@ -3367,11 +3934,9 @@ class QuestionsDatabase:
                     "To initialize weights"
                 ],
                 "correct": "To prevent overfitting by randomly disabling neurons"
-            }
-        ])
-        
-        # Topic 7: Practical Applications
-        questions.extend([
+            },
+            
+            # Topic 7: Practical Applications
             {
                 "topic": 7,
                 "question": "Which is a common application of computer vision?",
@@ -3415,11 +3980,9 @@ class QuestionsDatabase:
                     "Training multiple models simultaneously"
                 ],
                 "correct": "Using a pre-trained model and adapting it for a new task"
-            }
-        ])
-        
-        # Topic 8: Dimensionality Reduction
-        questions.extend([
+            },
+            
+            # Topic 8: Dimensionality Reduction
             {
                 "topic": 8,
                 "question": "Principal Component Analysis (PCA) is used for:",
@@ -3463,11 +4026,9 @@ class QuestionsDatabase:
                     "There is no difference"
                 ],
                 "correct": "Grid search exhaustively searches all combinations, random search samples randomly"
-            }
-        ])
-        
-        # Topic 9: MDP and Reinforcement Learning
-        questions.extend([
+            },
+            
+            # Topic 9: MDP and Reinforcement Learning
             {
                 "topic": 9,
                 "question": "In a Markov Decision Process (MDP), what does the agent try to maximize?",
@@ -3522,11 +4083,9 @@ class QuestionsDatabase:
                     "It only works for discrete state spaces"
                 ],
                 "correct": "It can learn optimal policies without knowing the environment model"
-            }
-        ])
-        
-        # Topic 10: Exam Review
-        questions.extend([
+            },
+            
+            # Topic 10: Exam Review
             {
                 "topic": 10,
                 "question": "Which evaluation metric is best for imbalanced classification?",
@@ -3570,13 +4129,11 @@ class QuestionsDatabase:
                     "To handle missing values"
                 ],
                 "correct": "To maintain the class distribution in each fold"
-            }
-        ])
-        
-        # Additional questions to ensure 10+ per topic
-        
-        # More Topic 1 questions
-        questions.extend([
+            },
+            
+            # Additional questions to ensure 10+ per topic
+            
+            # More Topic 1 questions
             {"topic": 1, "question": "Who is considered the father of Artificial Intelligence?",
              "options": ["Alan Turing", "John McCarthy", "Marvin Minsky", "Geoffrey Hinton"],
              "correct": "John McCarthy"},
@@ -3594,12 +4151,9 @@ class QuestionsDatabase:
              "correct": "AI learns from data, traditional programming uses explicit rules"},
             {"topic": 1, "question": "Which company developed AlphaGo?",
              "options": ["Google DeepMind", "OpenAI", "IBM", "Microsoft"],
-             "correct": "Google DeepMind"}
-        ])
-        
-        
-        # More Topic 3 questions
-        questions.extend([
+             "correct": "Google DeepMind"},
+            
+            # More Topic 3 questions
             {"topic": 3, "question": "What is the cost function typically used in linear regression?",
              "options": ["Mean Squared Error", "Cross Entropy", "Hinge Loss", "Log Loss"],
              "correct": "Mean Squared Error"},
@@ -3617,11 +4171,9 @@ class QuestionsDatabase:
              "correct": "Regularization"},
             {"topic": 3, "question": "Elastic Net regression combines:",
              "options": ["L1 and L2 regularization", "Linear and logistic regression", "Ridge and decision trees", "Lasso and neural networks"],
-             "correct": "L1 and L2 regularization"}
-        ])
-        
-        # More Topic 4 questions
-        questions.extend([
+             "correct": "L1 and L2 regularization"},
+            
+            # More Topic 4 questions
             {"topic": 4, "question": "Precision measures:",
              "options": ["True positives out of predicted positives", "True positives out of actual positives", "Overall accuracy", "False positive rate"],
              "correct": "True positives out of predicted positives"},
@@ -3636,11 +4188,9 @@ class QuestionsDatabase:
              "correct": "Sequentially, correcting previous errors"},
             {"topic": 4, "question": "What is the purpose of pruning in decision trees?",
              "options": ["Reduce overfitting by removing branches", "Speed up training", "Add more nodes", "Increase accuracy"],
-             "correct": "Reduce overfitting by removing branches"}
-        ])
-        
-        # More Topic 5 questions
-        questions.extend([
+             "correct": "Reduce overfitting by removing branches"},
+            
+            # More Topic 5 questions
             {"topic": 5, "question": "The elbow method helps determine:",
              "options": ["Optimal number of clusters in K-Means", "Learning rate", "Number of features", "Training iterations"],
              "correct": "Optimal number of clusters in K-Means"},
@@ -3658,11 +4208,9 @@ class QuestionsDatabase:
              "correct": "Noise points"},
             {"topic": 5, "question": "Mean-shift clustering finds clusters by:",
              "options": ["Seeking modes of density", "Random initialization", "Hierarchical splitting", "Minimizing variance"],
-             "correct": "Seeking modes of density"}
-        ])
-        
-        # More Topic 6 questions
-        questions.extend([
+             "correct": "Seeking modes of density"},
+            
+            # More Topic 6 questions
             {"topic": 6, "question": "The vanishing gradient problem affects:",
              "options": ["Deep networks with certain activation functions", "Only shallow networks", "Linear models", "Clustering algorithms"],
              "correct": "Deep networks with certain activation functions"},
@@ -3680,11 +4228,9 @@ class QuestionsDatabase:
              "correct": "Momentum and RMSprop"},
             {"topic": 6, "question": "Early stopping prevents overfitting by:",
              "options": ["Stopping training when validation error increases", "Training longer", "Using more data", "Adding layers"],
-             "correct": "Stopping training when validation error increases"}
-        ])
-        
-        # More Topic 7 questions
-        questions.extend([
+             "correct": "Stopping training when validation error increases"},
+            
+            # More Topic 7 questions
             {"topic": 7, "question": "BERT is primarily used for:",
              "options": ["Natural Language Processing tasks", "Image classification", "Audio processing", "Reinforcement learning"],
              "correct": "Natural Language Processing tasks"},
@@ -3702,11 +4248,9 @@ class QuestionsDatabase:
              "correct": "Real-time object detection"},
             {"topic": 7, "question": "Attention mechanism in transformers helps with:",
              "options": ["Focusing on relevant parts of input", "Reducing model size", "Faster training only", "Data preprocessing"],
-             "correct": "Focusing on relevant parts of input"}
-        ])
-        
-        # More Topic 8 questions
-        questions.extend([
+             "correct": "Focusing on relevant parts of input"},
+            
+            # More Topic 8 questions
             {"topic": 8, "question": "t-SNE is commonly used for:",
              "options": ["Visualizing high-dimensional data in 2D/3D", "Classification", "Regression", "Clustering"],
              "correct": "Visualizing high-dimensional data in 2D/3D"},
@@ -3724,11 +4268,9 @@ class QuestionsDatabase:
              "correct": "Model selection and comparison"},
             {"topic": 8, "question": "Variance explained by principal components:",
              "options": ["Decreases with each subsequent component", "Increases with each component", "Stays constant", "Is random"],
-             "correct": "Decreases with each subsequent component"}
-        ])
-        
-        # More Topic 9 questions
-        questions.extend([
+             "correct": "Decreases with each subsequent component"},
+            
+            # More Topic 9 questions
             {"topic": 9, "question": "In MDP, the Markov property states:",
              "options": ["Future depends only on current state, not history", "All states are equally likely", "Actions don't affect states", "Rewards are always positive"],
              "correct": "Future depends only on current state, not history"},
@@ -3746,11 +4288,9 @@ class QuestionsDatabase:
              "correct": "Approximate the Q-function"},
             {"topic": 9, "question": "Experience replay in DQN helps by:",
              "options": ["Breaking correlation between consecutive samples", "Speeding up training", "Reducing memory", "Simplifying the network"],
-             "correct": "Breaking correlation between consecutive samples"}
-        ])
-        
-        # More Topic 10 questions
-        questions.extend([
+             "correct": "Breaking correlation between consecutive samples"},
+            
+            # More Topic 10 questions
             {"topic": 10, "question": "ROC curve plots:",
              "options": ["True Positive Rate vs False Positive Rate", "Precision vs Recall", "Accuracy vs Loss", "Training vs Validation error"],
              "correct": "True Positive Rate vs False Positive Rate"},
@@ -3769,22 +4309,30 @@ class QuestionsDatabase:
             {"topic": 10, "question": "Occam's Razor in ML suggests:",
              "options": ["Prefer simpler models that explain the data well", "Always use complex models", "Use as many features as possible", "Train longer"],
              "correct": "Prefer simpler models that explain the data well"}
-        ])
+        ]
         
         return questions
     
     def get_all_questions(self):
         """Return all questions"""
         return self.questions
+    
+    def get_topic(self, topic_num):
+        """Return the questions for one topic (empty if it has none)"""
+        return self.by_topic.get(topic_num, ())
+    
+    def sample_topic(self, topic_num, n):
+        """Return up to n distinct random questions from one topic"""
+        questions = self.by_topic.get(topic_num, ())
+        return random.sample(questions, min(n, len(questions)))
 
 
 class StudyContent:
     """Study content for each topic"""
     
-    def get_content(self, topic_num):
-        """Get study content for a topic"""
-        content_map = {
-            1: """TOPIC 1: INTRODUCTION TO ARTIFICIAL INTELLIGENCE AND APPLICATIONS
+    # Topic number -> study text, built once with the class rather than on every call
+    _CONTENT = {
+        1: """TOPIC 1: INTRODUCTION TO ARTIFICIAL INTELLIGENCE AND APPLICATIONS
 
 What is Artificial Intelligence?
 Artificial Intelligence (AI) is a branch of computer science that aims to create intelligent machines capable of performing tasks that typically require human intelligence. These tasks include learning, reasoning, problem-solving, perception, and language understanding.
@@ -3814,7 +4362,7 @@ Current Trends:
 • Autonomous vehicles
 • Healthcare AI applications""",
 
-            2: """TOPIC 2: REVIEW OF PROBABILITY, LINEAR ALGEBRA, AND OPTIMIZATION FOR AI
+        2: """TOPIC 2: REVIEW OF PROBABILITY, LINEAR ALGEBRA, AND OPTIMIZATION FOR AI
 
 PROBABILITY THEORY
 Probability is fundamental to AI, especially in machine learning and uncertainty handling.
@@ -3855,7 +4403,7 @@ Applications in AI:
 • Linear Algebra: Neural networks, PCA, data transformations
 • Optimization: Training machine learning models, hyperparameter tuning""",
 
-            3: """TOPIC 3: REGRESSION METHODS IN MACHINE LEARNING
+        3: """TOPIC 3: REGRESSION METHODS IN MACHINE LEARNING
 
 REGRESSION OVERVIEW
 Regression is a supervised learning technique used to predict continuous numerical values based on input features.
@@ -3901,7 +4449,7 @@ BEST PRACTICES
 • Feature engineering
 • Regularization for complex models""",
 
-            4: """TOPIC 4: CLASSIFICATION ALGORITHMS
+        4: """TOPIC 4: CLASSIFICATION ALGORITHMS
 
 CLASSIFICATION OVERVIEW
 Classification is a supervised learning task that assigns input data to predefined categories or classes.
@@ -3956,7 +4504,7 @@ MULTI-CLASS CLASSIFICATION
 • One-vs-One (OvO): Train classifier for each pair
 • Softmax: Outputs probability distribution over classes""",
 
-            5: """TOPIC 5: CLUSTERING AND UNSUPERVISED LEARNING
+        5: """TOPIC 5: CLUSTERING AND UNSUPERVISED LEARNING
 
 UNSUPERVISED LEARNING
 Learning patterns from data without labeled examples. The algorithm discovers hidden structures in the data.
@@ -4021,7 +4569,7 @@ APPLICATIONS
 • Data compression
 • Pattern recognition""",
 
-            6: """TOPIC 6: NEURAL NETWORKS AND MODEL EVALUATION
+        6: """TOPIC 6: NEURAL NETWORKS AND MODEL EVALUATION
 
 NEURAL NETWORKS
 Inspired by biological neurons, neural networks are computing systems that learn to perform tasks by considering examples.
@@ -4089,7 +4637,7 @@ REGULARIZATION TECHNIQUES
 • Weight Decay: L2 regularization
 • Batch Normalization: Normalize inputs to each layer""",
 
-            7: """TOPIC 7: PRACTICAL AI AND MACHINE LEARNING APPLICATIONS
+        7: """TOPIC 7: PRACTICAL AI AND MACHINE LEARNING APPLICATIONS
 
 REAL-WORLD APPLICATIONS
 
@@ -4160,7 +4708,7 @@ ETHICAL CONSIDERATIONS
 • Transparency: Explainable AI
 • Accountability: Responsibility for AI decisions""",
 
-            8: """TOPIC 8: DIMENSIONALITY REDUCTION AND MODEL SELECTION
+        8: """TOPIC 8: DIMENSIONALITY REDUCTION AND MODEL SELECTION
 
 DIMENSIONALITY REDUCTION
 Techniques to reduce the number of features while preserving important information.
@@ -4236,7 +4784,7 @@ MODEL SELECTION CRITERIA
 • Cross-validation score
 • Domain knowledge""",
 
-            9: """TOPIC 9: MARKOV DECISION PROCESS AND REINFORCEMENT LEARNING
+        9: """TOPIC 9: MARKOV DECISION PROCESS AND REINFORCEMENT LEARNING
 
 REINFORCEMENT LEARNING (RL)
 A type of machine learning where an agent learns to make decisions by interacting with an environment to maximize cumulative reward.
@@ -4311,7 +4859,7 @@ CHALLENGES
 • Stability: Training can be unstable
 • Credit Assignment: Determining which actions led to rewards""",
 
-            10: """TOPIC 10: EXAM REVIEW AND RECITATION
+        10: """TOPIC 10: EXAM REVIEW AND RECITATION
 
 COMPREHENSIVE REVIEW OF KEY CONCEPTS
 
@@ -4396,13 +4944,19 @@ STUDY STRATEGIES
 • Work through examples
 • Review your quiz and test results
 • Focus on areas with lower scores"""
-        }
-        
-        return content_map.get(topic_num, "Content not available for this topic.")
+    }
+    
+    def get_content(self, topic_num):
+        """Get study content for a topic"""
+        return self._CONTENT.get(topic_num, "Content not available for this topic.")
 
 
 def main():
-    root = tk.Tk()
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        # No display (e.g. a headless shell): report it instead of a traceback
+        raise SystemExit(f"Cannot start the AI Learning App: {e}")
     app = AILearningApp(root)
     root.mainloop()
 